@@ -0,0 +1,127 @@
+# ai_cache.py
+"""
+Cache persisten jawaban AI Consultant (SQLite), dikunci dengan teks kasus
+yang dinormalisasi dan nama model.
+
+Teks kasus dinormalisasi (huruf kecil, spasi dirapatkan) sehingga kasus yang
+sama dengan penulisan sedikit berbeda tetap memakai jawaban yang sama.
+Entri kedaluwarsa setelah TTL_SECONDS; bila jumlah entri melebihi
+MAX_ENTRIES, entri yang paling lama tidak dipakai dibuang (LRU).
+
+Lokasi file dapat diatur lewat variabel lingkungan STATLAB_AI_CACHE.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+CACHE_PATH = os.environ.get(
+    "STATLAB_AI_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "statlab", "ai_responses.sqlite3")
+)
+TTL_SECONDS = 7 * 24 * 3600
+MAX_ENTRIES = 1000
+
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    text TEXT NOT NULL
+)
+"""
+
+
+def normalize(case_text):
+    return " ".join(case_text.casefold().split())
+
+
+def cache_key(case_text, model_name):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(model_name.encode())
+    h.update(b"\0")
+    h.update(normalize(case_text).encode())
+    return h.hexdigest()
+
+
+@contextmanager
+def _connect(path):
+    """Koneksi singkat per operasi (aman dipakai dari thread sesi mana pun)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        with conn:
+            conn.execute(_SCHEMA)
+            yield conn
+    finally:
+        conn.close()
+
+
+def _evict(conn, now, ttl, max_entries):
+    n = conn.execute("DELETE FROM responses WHERE created < ?", (now - ttl,)).rowcount
+    n += conn.execute(
+        "DELETE FROM responses WHERE key IN "
+        "(SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+        (max_entries,),
+    ).rowcount
+    _stats["evictions"] += n
+
+
+def get(case_text, model_name, path=None, ttl=None):
+    """Jawaban tersimpan untuk kasus ini, atau None bila belum ada / kedaluwarsa."""
+    path = path or CACHE_PATH
+    ttl = TTL_SECONDS if ttl is None else ttl
+    key = cache_key(case_text, model_name)
+    now = time.time()
+    with _lock, _connect(path) as conn:
+        row = conn.execute("SELECT text, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] < now - ttl:
+            _stats["misses"] += 1
+            return None
+        conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        _stats["hits"] += 1
+        return row[0]
+
+
+def put(case_text, model_name, text, path=None, ttl=None, max_entries=None):
+    path = path or CACHE_PATH
+    now = time.time()
+    with _lock, _connect(path) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, model, created, last_used, text) VALUES (?, ?, ?, ?, ?)",
+            (cache_key(case_text, model_name), model_name, now, now, text),
+        )
+        _evict(conn, now, TTL_SECONDS if ttl is None else ttl, MAX_ENTRIES if max_entries is None else max_entries)
+
+
+def get_or_generate(case_text, model_name, generate, **kwargs):
+    """(teks, dari_cache): `generate()` hanya dipanggil saat cache meleset."""
+    text = get(case_text, model_name, kwargs.get("path"), kwargs.get("ttl"))
+    if text is not None:
+        return text, True
+    text = generate()
+    put(case_text, model_name, text, **kwargs)
+    return text, False
+
+
+def size(path=None):
+    with _lock, _connect(path or CACHE_PATH) as conn:
+        return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def clear(path=None):
+    with _lock, _connect(path or CACHE_PATH) as conn:
+        conn.execute("DELETE FROM responses")
+        for k in _stats:
+            _stats[k] = 0
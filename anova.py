@@ -0,0 +1,180 @@
+# anova.py
+"""
+One-way ANOVA dan uji post-hoc (Tukey-HSD, Games-Howell) dari Moments per grup.
+
+Semua pasangan grup dihitung sekaligus dengan broadcasting (matriks k x k),
+tanpa loop Python per pasangan.
+
+Distribusi rentang tersandar (studentized range) dihitung sendiri secara
+tervektorisasi, karena scipy.stats.studentized_range butuh ~15 ms per
+titik. P(R > w) rentang k normal baku dihitung sekali per k pada grid w
+(kuadratur Gauss-Legendre atas minimum sampel, dalam ruang log agar ekor
+tetap akurat), lalu P(Q > q) = E[P(R > q S)] dengan S² ~ chi²(df)/df
+dihitung dengan kuadratur atas log S untuk setiap node df. Pasangan
+dengan df berbeda (Games-Howell) diinterpolasi di antara node df.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from scipy import special, stats
+
+import critical_values
+import engine
+
+
+GRID_W = 4096
+GRID_Q = 1024
+GRID_DF = 32
+N_Z = 256
+N_S = 128
+
+AnovaResult = namedtuple(
+    "AnovaResult",
+    ["stat", "crit", "p_val", "reject", "df1", "df2", "ss_between", "ss_within", "ms_between", "ms_within"],
+)
+
+PostHocResult = namedtuple("PostHocResult", ["method", "diff", "se", "q", "crit", "p_val", "reject", "df"])
+
+
+def _group_stats(m):
+    n, mean, var = (np.asarray(v, dtype=float) for v in engine.sample_moments(m))
+    # Moments dari tabel lebar berbagi satu n skalar untuk semua kolom
+    return np.broadcast_to(n, mean.shape), mean, var
+
+
+def one_way_from_moments(m, alpha=0.05):
+    """ANOVA satu arah; `m` adalah Moments berisi array (satu elemen per grup)."""
+    n, mean, var = _group_stats(m)
+    k, n_total = len(n), n.sum()
+    grand = np.sum(n * mean) / n_total
+    ss_between = np.sum(n * (mean - grand)**2)
+    ss_within = np.sum((n - 1) * var)
+    df1, df2 = k - 1, int(n_total - k)
+    ms_between, ms_within = ss_between / df1, ss_within / df2
+    f_stat = ms_between / ms_within
+
+    crit = critical_values.critical_value("f", alpha, "right", df1, df2)
+    p_val = critical_values.p_value("f", f_stat, "right", df1, df2)
+    return AnovaResult(f_stat, crit, p_val, f_stat > crit, df1, df2,
+                       ss_between, ss_within, ms_between, ms_within)
+
+
+def _gauss_legendre(n, lo, hi):
+    x, w = np.polynomial.legendre.leggauss(n)
+    return (hi - lo) / 2 * x + (hi + lo) / 2, w * (hi - lo) / 2
+
+
+@lru_cache(maxsize=32)
+def _log_range_sf_table(k, w_max):
+    """log P(R > w) rentang k normal baku pada grid w [0, w_max]."""
+    z, wz = _gauss_legendre(N_Z, -12.0, 9.0)
+    w = np.linspace(0.0, w_max, GRID_W)[:, None]
+    log_sf_z = stats.norm.logsf(z)
+    # P(R > w) = k ∫ φ(z) [S(z)^(k-1) - (S(z) - S(z+w))^(k-1)] dz, S = sf normal (z = minimum)
+    ratio = np.exp(stats.norm.logsf(z + w) - log_sf_z)
+    with np.errstate(divide="ignore"):
+        term = (np.log(k) + stats.norm.logpdf(z) + (k - 1) * log_sf_z
+                + np.log(-np.expm1((k - 1) * np.log1p(-ratio))))
+    return w[:, 0], special.logsumexp(term + np.log(wz), axis=-1)
+
+
+def _s_range(df):
+    """Rentang S = sqrt(chi²(df)/df) yang memuat hampir seluruh massa peluang."""
+    return np.sqrt(stats.chi2.ppf([1e-14, 1 - 1e-14], df) / df)
+
+
+def _log_q_sf_node(q, k, df, w_max):
+    """log P(Q > q) untuk satu df; q berupa array dengan q * S <= w_max."""
+    s_lo, s_hi = _s_range(df)
+    t, wt = _gauss_legendre(N_S, np.log(s_lo), np.log(s_hi))
+    s = np.exp(t)
+    w_grid, log_r = _log_range_sf_table(k, w_max)
+    log_density = np.log(2 * df * s * s) + stats.chi2.logpdf(df * s * s, df)
+    log_r_qs = np.interp(np.asarray(q)[:, None] * s, w_grid, log_r)
+    return np.minimum(special.logsumexp(log_r_qs + log_density + np.log(wt), axis=-1), 0.0)
+
+
+def _df_nodes(df):
+    lo, hi = float(np.min(df)), float(np.max(df))
+    if np.isclose(lo, hi):
+        return np.array([lo])
+    return np.geomspace(lo, hi, GRID_DF)
+
+
+def studentized_range(q, k, df, alpha):
+    """
+    (log sf, q kritis) rentang tersandar untuk array q dan df (di-broadcast).
+    log sf per node df dihitung pada grid q lalu diinterpolasi (q linear, df log).
+    """
+    q, df = np.broadcast_arrays(np.asarray(q, dtype=float), np.asarray(df, dtype=float))
+    shape = q.shape
+    q, df = q.ravel(), df.ravel()
+    nodes = _df_nodes(df)
+    q_max = float(np.ceil(max(np.max(q), 1.0)))
+    q_grid = np.linspace(0.0, q_max, GRID_Q)
+
+    # S terlebar ada di df terkecil; satu tabel rentang dipakai bersama semua node
+    w_max = float(np.ceil(q_max * _s_range(nodes[0])[1]))
+    tables = np.array([_log_q_sf_node(q_grid, k, d, w_max) for d in nodes])  # (node, q)
+    crit_nodes = np.array([np.interp(-np.log(alpha), -t, q_grid, right=np.nan) for t in tables])
+    # q_max bisa di bawah q kritis (semua pasangan jauh dari signifikan); hitung ulang di grid yang lebih lebar
+    for i in np.flatnonzero(np.isnan(crit_nodes)):
+        wide = np.linspace(0.0, 4 * q_max + 10, GRID_Q)
+        w_wide = float(np.ceil(wide[-1] * _s_range(nodes[0])[1]))
+        crit_nodes[i] = np.interp(-np.log(alpha), -_log_q_sf_node(wide, k, nodes[i], w_wide), wide)
+
+    pos = q / q_max * (GRID_Q - 1)
+    i = np.clip(np.floor(pos).astype(int), 0, GRID_Q - 2)
+    u = pos - i
+    at_q = tables[:, i] * (1 - u) + tables[:, i + 1] * u  # (node, titik)
+    if len(nodes) == 1:
+        return at_q[0].reshape(shape), np.full(shape, crit_nodes[0])
+
+    log_nodes = np.log(nodes)
+    j = np.clip(np.searchsorted(log_nodes, np.log(df), side="right") - 1, 0, len(nodes) - 2)
+    v = (np.log(df) - log_nodes[j]) / (log_nodes[j + 1] - log_nodes[j])
+    cols = np.arange(q.size)
+    log_sf = at_q[j, cols] * (1 - v) + at_q[j + 1, cols] * v
+    crit = np.interp(np.log(df), log_nodes, crit_nodes)
+    return log_sf.reshape(shape), crit.reshape(shape)
+
+
+def tukey_hsd(m, alpha=0.05):
+    """Tukey-HSD (Tukey-Kramer untuk n tidak sama) semua pasangan; hasil matriks (k, k)."""
+    n, mean, var = _group_stats(m)
+    k = len(n)
+    df = n.sum() - k
+    ms_within = np.sum((n - 1) * var) / df
+
+    diff = mean[:, None] - mean[None, :]
+    se = np.sqrt(ms_within / 2 * (1 / n[:, None] + 1 / n[None, :]))
+    q = np.abs(diff) / se
+    log_sf, crit = studentized_range(q, k, df, alpha)
+    crit = float(crit.flat[0])
+    return PostHocResult("tukey", diff, se, q, crit, np.exp(log_sf), q > crit, df)
+
+
+def games_howell(m, alpha=0.05):
+    """Games-Howell (varians tidak sama, df Welch per pasangan); hasil matriks (k, k)."""
+    n, mean, var = _group_stats(m)
+    k = len(n)
+    a = var / n
+    a_i, a_j = a[:, None], a[None, :]
+
+    diff = mean[:, None] - mean[None, :]
+    se = np.sqrt((a_i + a_j) / 2)
+    q = np.abs(diff) / se
+    with np.errstate(invalid="ignore", divide="ignore"):
+        df = (a_i + a_j)**2 / (a_i**2 / (n[:, None] - 1) + a_j**2 / (n[None, :] - 1))
+    df = np.where(np.isfinite(df), df, np.nanmax(df))
+    log_sf, crit = studentized_range(q, k, df, alpha)
+    return PostHocResult("games_howell", diff, se, q, crit, np.exp(log_sf), q > crit, df)
+
+
+def post_hoc(m, alpha=0.05, method="tukey"):
+    if method == "tukey":
+        return tukey_hsd(m, alpha)
+    if method == "games_howell":
+        return games_howell(m, alpha)
+    raise ValueError(f"Metode post-hoc tidak dikenal: {method}")
@@ -0,0 +1,51 @@
+# benchmarks/bench_ai_cache.py
+"""
+Latensi AI Consultant saat cache meleset vs kena (ai_cache), dengan model
+tiruan lokal tanpa jaringan. Perilaku cache (normalisasi, TTL, eviksi)
+diperiksa di tests/test_ai_cache.py.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_ai_cache --latency 0.5 --repeat 200
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ai_cache
+import consultant
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5, help="detik per panggilan model tiruan")
+    parser.add_argument("--repeat", type=int, default=200, help="jumlah pembacaan cache")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ai.sqlite3")
+        case = "Membandingkan rata-rata waktu tunggu dua cabang bank."
+
+        def generate():
+            time.sleep(args.latency)
+            return "**Rekomendasi Uji**: Welch t-test"
+
+        start = time.perf_counter()
+        ai_cache.get_or_generate(case, consultant.MODEL_NAME, generate, path=path)
+        t_miss = time.perf_counter() - start
+
+        hits = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            ai_cache.get_or_generate(case, consultant.MODEL_NAME, generate, path=path)
+            hits.append(time.perf_counter() - start)
+
+    hits = np.array(hits) * 1000
+    print(f"miss (model {args.latency:.2f} s): {t_miss * 1000:.1f} ms")
+    print(f"hit: p50 {np.percentile(hits, 50):.2f} ms | p99 {np.percentile(hits, 99):.2f} ms ({args.repeat} kali)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# benchmarks/bench_ai_stream.py
+"""
+Uji beban AI Consultant streaming (consultant.stream_case) terhadap server
+model tiruan lokal (HTTP, respons chunked), tanpa jaringan ke luar.
+
+Server mengirim --chunks potongan dengan jeda --chunk-delay; sebagian
+permintaan (--stuck) sengaja macet untuk menguji tenggat. --users pengguna
+mengirim kasus unik bersamaan (cache tidak berperan). Dilaporkan time to
+first token (TTFT) dan latensi total p50/p99, serta jumlah yang ditolak
+karena slot penuh (ConsultantBusy) atau melewati tenggat.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_ai_stream --users 64 --timeout 3
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import numpy as np
+
+import ai_cache
+import consultant
+
+
+class FakeModelHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    chunks, chunk_delay, stuck = 20, 0.02, 0.0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        stuck = body["seed"] % 1000 < self.stuck * 1000
+        try:
+            for i in range(self.chunks):
+                time.sleep(self.chunk_delay * (50 if stuck else 1))
+                line = f"token{i} ".encode() + b"\n"
+                self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # klien membatalkan stream
+
+    def log_message(self, *args):
+        pass
+
+
+class HttpModel:
+    """Klien tiruan dengan antarmuka generate_content(..., stream=True) seperti GenerativeModel."""
+
+    def __init__(self, url):
+        self.url = url
+        self.seed = 0
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.seed += 1
+        req = urllib.request.Request(self.url, json.dumps({"prompt": prompt, "seed": self.seed * 7919}).encode())
+        resp = urllib.request.urlopen(req, timeout=(request_options or {}).get("timeout"))
+        return (SimpleNamespace(text=line.decode()) for line in resp)
+
+
+def run_user(model, case, timeout, result):
+    start = time.perf_counter()
+    first = None
+    try:
+        for _ in consultant.stream_case(case, model, timeout=timeout):
+            if first is None:
+                first = time.perf_counter() - start
+        result.update(status="ok", ttft=first, total=time.perf_counter() - start)
+    except consultant.ConsultantBusy:
+        result.update(status="busy")
+    except TimeoutError:
+        result.update(status="timeout", total=time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=64)
+    parser.add_argument("--max-concurrent", type=int, default=consultant.MAX_CONCURRENT)
+    parser.add_argument("--slot-wait", type=float, default=consultant.SLOT_WAIT_SECONDS)
+    parser.add_argument("--timeout", type=float, default=3.0)
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--chunk-delay", type=float, default=0.02)
+    parser.add_argument("--stuck", type=float, default=0.05, help="fraksi permintaan yang macet")
+    args = parser.parse_args()
+
+    FakeModelHandler.chunks, FakeModelHandler.chunk_delay, FakeModelHandler.stuck = \
+        args.chunks, args.chunk_delay, args.stuck
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeModelHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    consultant._slots = threading.BoundedSemaphore(args.max_concurrent)
+    consultant.SLOT_WAIT_SECONDS = args.slot_wait
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ai_cache.CACHE_PATH = os.path.join(tmp, "ai.sqlite3")
+        model = HttpModel(f"http://127.0.0.1:{server.server_address[1]}/generate")
+        results = [{} for _ in range(args.users)]
+        threads = [threading.Thread(target=run_user, args=(model, f"kasus {i}", args.timeout, r))
+                   for i, r in enumerate(results)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - start
+    server.shutdown()
+
+    ok = [r for r in results if r["status"] == "ok"]
+    count = {s: sum(r["status"] == s for r in results) for s in ("ok", "busy", "timeout")}
+    print(f"{args.users} pengguna, {args.max_concurrent} slot, tenggat {args.timeout:g} s, "
+          f"model {args.chunks} x {args.chunk_delay * 1000:.0f} ms: wall {wall:.2f} s, {count}")
+    if ok:
+        ttft = np.array([r["ttft"] for r in ok]) * 1000
+        total = np.array([r["total"] for r in ok]) * 1000
+        print(f"TTFT  ms: p50 {np.percentile(ttft, 50):8.1f} | p99 {np.percentile(ttft, 99):8.1f}")
+        print(f"total ms: p50 {np.percentile(total, 50):8.1f} | p99 {np.percentile(total, 99):8.1f}")
+    timeouts = [r["total"] for r in results if r["status"] == "timeout"]
+    if timeouts:
+        print(f"timeout dilepas setelah maks {max(timeouts):.2f} s (tenggat {args.timeout:g} s)")
+
+
+if __name__ == "__main__":
+    main()
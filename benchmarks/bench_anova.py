@@ -0,0 +1,83 @@
+# benchmarks/bench_anova.py
+"""
+ANOVA + post-hoc semua pasangan (anova.py) untuk k grup: matriks broadcast
+dibandingkan loop Python per pasangan.
+
+Baseline loop menghitung q dan df setiap pasangan satu per satu, lalu p-value
+dengan scipy.stats.studentized_range.sf; karena p-value scipy ~ms per pasangan,
+waktunya diukur pada --sample pasangan lalu diekstrapolasi ke k(k-1)/2 pasangan.
+"Dingin" berarti cache tabel distribusi rentang dikosongkan lebih dulu.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_anova --groups 50 500 --n 100
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy import stats
+
+import anova
+import moments
+
+
+def make_groups(k, n, rng):
+    codes = np.repeat(np.arange(k), rng.integers(max(2, n // 2), 2 * n, k))
+    values = rng.normal(rng.normal(0, 0.3, k)[codes], rng.uniform(0.5, 2.0, k)[codes])
+    return moments.from_groups(codes, values, k)
+
+
+def timed(func):
+    start = time.perf_counter()
+    out = func()
+    return out, time.perf_counter() - start
+
+
+def loop_pairs(m, sample, rng):
+    """Loop per pasangan (Games-Howell); p-value scipy hanya untuk `sample` pasangan."""
+    n, mean, var = np.asarray(m.n, float), np.asarray(m.mean, float), moments.variance(m)
+    k = len(n)
+    start = time.perf_counter()
+    for i in range(k):
+        for j in range(i + 1, k):
+            a_i, a_j = var[i] / n[i], var[j] / n[j]
+            q = abs(mean[i] - mean[j]) / np.sqrt((a_i + a_j) / 2)
+            df = (a_i + a_j)**2 / (a_i**2 / (n[i] - 1) + a_j**2 / (n[j] - 1))
+    t_stats = time.perf_counter() - start
+
+    i, j = np.triu_indices(k, k=1)
+    pick = rng.choice(len(i), min(sample, len(i)), replace=False)
+    res = anova.games_howell(m)
+    start = time.perf_counter()
+    ref = np.array([stats.studentized_range.sf(res.q[a, b], k, res.df[a, b]) for a, b in zip(i[pick], j[pick])])
+    t_p = (time.perf_counter() - start) / len(pick) * len(i)
+    got = res.p_val[i[pick], j[pick]]
+    return t_stats + t_p, np.max(np.abs(got - ref))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--groups", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--n", type=int, default=100, help="rata-rata observasi per grup")
+    parser.add_argument("--sample", type=int, default=200, help="pasangan untuk p-value scipy")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'k':>5} | {'pasangan':>8} | {'anova ms':>8} | {'tukey dingin':>12} | {'tukey hangat':>12} | "
+          f"{'GH dingin':>9} | {'GH hangat':>9} | {'loop s (est.)':>13} | {'maks |Δp|':>9}")
+    for k in args.groups:
+        m = make_groups(k, args.n, rng)
+        _, t_anova = timed(lambda: anova.one_way_from_moments(m))
+        anova._log_range_sf_table.cache_clear()
+        _, t_tukey_cold = timed(lambda: anova.tukey_hsd(m))
+        _, t_tukey = timed(lambda: anova.tukey_hsd(m))
+        anova._log_range_sf_table.cache_clear()
+        _, t_gh_cold = timed(lambda: anova.games_howell(m))
+        _, t_gh = timed(lambda: anova.games_howell(m))
+        t_loop, err = loop_pairs(m, args.sample, rng)
+        print(f"{k:>5} | {k * (k - 1) // 2:>8} | {t_anova * 1000:>8.2f} | {t_tukey_cold:>12.3f} | {t_tukey:>12.3f} | "
+              f"{t_gh_cold:>9.3f} | {t_gh:>9.3f} | {t_loop:>13.1f} | {err:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_columnar.py
+"""
+Waktu sampai hasil uji (one-sample t) dan puncak memori (RSS) untuk kolom
+yang sama dalam format CSV, Excel, Parquet, Arrow (Feather) dan .npy.
+
+Setiap file berisi kolom 'id' (int64) dan 'nilai' (float64); hanya 'nilai'
+yang dipakai. Jalur yang diukur sama dengan jalur upload di aplikasi:
+CSV/Excel lewat pandas lalu df[kolom].dropna(), format kolumnar lewat
+ingest.read_column_values (proyeksi kolom, memory map untuk Arrow dan
+.npy). Jalur File Lokal Besar (ingest.sharded_moments, satu proses) ikut
+diukur untuk CSV, Parquet, Arrow dan .npy. Excel dibatasi 1.048.576 baris
+per sheet (dan openpyxl lambat), jadi memakai --excel-rows baris; waktunya
+juga ditampilkan per juta baris.
+
+Setiap pengukuran berjalan di proses baru (spawn) agar puncak RSS terpisah.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_columnar --rows 20000000
+    python -m benchmarks.bench_columnar --rows 100000000 --skip-excel
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import engine
+import ingest
+
+BLOCK = 5_000_000
+
+
+def make_files(tmp, rows, excel_rows, seed=0):
+    """Menulis kolom yang sama ke tiap format per blok (RAM penulis tidak sebesar file)."""
+    rng = np.random.default_rng(seed)
+    paths = {fmt: os.path.join(tmp, f"data.{fmt}") for fmt in ("csv", "parquet", "arrow", "npy")}
+    schema = pa.schema([("id", pa.int64()), ("nilai", pa.float64())])
+    npy = np.lib.format.open_memmap(paths["npy"], mode="w+", dtype=np.float64, shape=(rows,))
+    with pq.ParquetWriter(paths["parquet"], schema) as pw, \
+            pa.ipc.new_file(paths["arrow"], schema, options=pa.ipc.IpcWriteOptions(compression=None)) as aw:
+        for start in range(0, rows, BLOCK):
+            size = min(BLOCK, rows - start)
+            values = rng.normal(50, 10, size).round(4)
+            ids = np.arange(start, start + size)
+            table = pa.table({"id": ids, "nilai": values}, schema=schema)
+            pw.write_table(table, row_group_size=1_000_000)
+            aw.write_table(table, max_chunksize=1_000_000)
+            npy[start:start + size] = values
+            pd.DataFrame({"id": ids, "nilai": values}).to_csv(
+                paths["csv"], mode="w" if start == 0 else "a", header=start == 0, index=False)
+    npy.flush()
+    del npy
+    if excel_rows:
+        paths["xlsx"] = os.path.join(tmp, "data.xlsx")
+        pd.read_csv(paths["csv"], nrows=excel_rows).to_excel(paths["xlsx"], index=False)
+    return paths
+
+
+def peak_rss_mb():
+    """VmHWM proses ini (ru_maxrss ikut terwarisi lewat fork/exec, VmHWM tidak)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def run(method, path):
+    base = peak_rss_mb()
+    start = time.perf_counter()
+    if method == "upload":
+        if path.endswith(".csv"):
+            data = pd.read_csv(path)["nilai"].dropna().to_numpy()
+        elif path.endswith(".xlsx"):
+            data = pd.read_excel(path)["nilai"].dropna().to_numpy()
+        else:
+            data, _ = ingest.read_column_values(path, column="nilai")
+    else:
+        data, _ = ingest.sharded_moments(path, "nilai", workers=1)
+    res = engine.t_test_1(data, 50.0, 0.05, "Two-sided")
+    seconds = time.perf_counter() - start
+    return seconds, peak_rss_mb() - base, float(res.stat)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--excel-rows", type=int, default=200_000, help="maksimum 1.048.575 (batas sheet Excel)")
+    parser.add_argument("--skip-excel", action="store_true")
+    parser.add_argument("--skip-csv-upload", action="store_true", help="lewati pd.read_csv penuh (butuh RAM besar)")
+    args = parser.parse_args()
+    excel_rows = 0 if args.skip_excel else min(args.excel_rows, args.rows, 1_048_575)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        paths = make_files(tmp, args.rows, excel_rows)
+        print(f"file dibuat dalam {time.perf_counter() - start:.0f} s:",
+              ", ".join(f"{fmt} {os.path.getsize(p) / 1024**2:,.0f} MB" for fmt, p in paths.items()))
+
+        cases = [("upload", fmt) for fmt in ("csv", "xlsx", "parquet", "arrow", "npy")]
+        cases += [("lokal", fmt) for fmt in ("csv", "parquet", "arrow", "npy")]
+        print(f"{'jalur':>6} | {'format':>7} | {'baris':>11} | {'detik':>8} | {'s/juta baris':>12} | "
+              f"{'tambahan RSS MB':>15} | {'t':>9}")
+        for method, fmt in cases:
+            if fmt not in paths or (method, fmt) == ("upload", "csv") and args.skip_csv_upload:
+                continue
+            rows = excel_rows if fmt == "xlsx" else args.rows
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                seconds, rss, t_stat = pool.submit(run, method, paths[fmt]).result()
+            print(f"{method:>6} | {fmt:>7} | {rows:>11,} | {seconds:>8.2f} | {seconds / rows * 1e6:>12.3f} | "
+                  f"{rss:>15.0f} | {t_stat:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
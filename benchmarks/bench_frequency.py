@@ -0,0 +1,66 @@
+# benchmarks/bench_frequency.py
+"""
+Tabel frekuensi (moments.from_weighted) dibandingkan dengan mengekspansi
+data menjadi baris mentah (np.repeat + moments.from_array).
+
+Untuk K nilai berbeda dan total frekuensi N diukur waktu, puncak alokasi
+NumPy (tracemalloc) dan selisih relatif statistik Welch t / F tabel
+frekuensi terhadap data ekspansi.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_frequency --distinct 1000 --totals 1000000 10000000 50000000
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import engine
+import moments
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, seconds, peak / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--distinct", type=int, default=1000)
+    parser.add_argument("--totals", type=int, nargs="+", default=[1_000_000, 10_000_000, 50_000_000])
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'N':>11} | {'cara':>9} | {'ms':>9} | {'puncak MB':>9} | {'|Δt|/|t|':>9} | {'|ΔF|/F':>9}")
+    for total in args.totals:
+        tables = []
+        for shift in (0.0, 0.05):
+            values = np.round(rng.normal(100 + shift, 15, args.distinct), 2)
+            p = rng.dirichlet(np.ones(args.distinct))
+            tables.append((values, rng.multinomial(total, p)))
+
+        def weighted():
+            return [moments.from_weighted(v, c) for v, c in tables]
+
+        def expanded():
+            return [moments.from_array(np.repeat(v, c)) for v, c in tables]
+
+        rows = []
+        for label, func in (("frekuensi", weighted), ("ekspansi", expanded)):
+            (m1, m2), seconds, peak = measure(func)
+            stat = (engine.welch_t_test(m1, m2, 0.05, "Two-sided").stat, engine.f_test(m1, m2, 0.05).stat)
+            rows.append((label, seconds, peak, stat))
+        (t_w, f_w), (t_e, f_e) = rows[0][3], rows[1][3]
+        diff = (abs(t_w - t_e) / abs(t_e), abs(f_w - f_e) / f_e)
+        for label, seconds, peak, _ in rows:
+            delta = f"{diff[0]:>9.1e} | {diff[1]:>9.1e}" if label == "frekuensi" else f"{'-':>9} | {'-':>9}"
+            print(f"{total:>11,} | {label:>9} | {seconds * 1000:>9.2f} | {peak:>9.2f} | {delta}")
+
+if __name__ == "__main__":
+    main()
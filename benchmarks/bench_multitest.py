@@ -0,0 +1,40 @@
+# benchmarks/bench_multitest.py
+"""
+Latensi koreksi multiple testing (multitest.adjust) terhadap jumlah p-value m.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_multitest --sizes 1000 100000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+import multitest
+
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10**5, 10**6])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'m':>9} | " + " | ".join(f"{m + ' ms':>13}" for m in multitest.METHODS))
+    for m in args.sizes:
+        p = rng.uniform(size=m) ** 2
+        times = [timed(lambda: multitest.adjust(p, method), args.repeat) for method in multitest.METHODS]
+        print(f"{m:>9} | " + " | ".join(f"{t:>13.2f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
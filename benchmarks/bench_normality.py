@@ -0,0 +1,53 @@
+# benchmarks/bench_normality.py
+"""
+Latensi metode uji normalitas terhadap ukuran sampel.
+
+- shapiro            : scipy.stats.shapiro pada data penuh (cara lama untuk semua n)
+- dagostino (momen)  : normality.run(..., 'dagostino'), termasuk menghitung Moments
+- dagostino (cache)  : hanya rumus K² dari Moments yang sudah ada (data streaming/cache)
+- anderson (subsampel): normality.run(..., 'anderson'), subsampel ber-seed 5000 titik
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_normality --sizes 1000 5000 100000 1000000
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+from scipy import stats
+
+import moments
+import normality
+
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10**5, 10**6])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    warnings.simplefilter("ignore")
+
+    print(f"{'n':>9} | {'shapiro ms':>10} | {'dagostino ms':>12} | {'dag. cache ms':>13} | {'anderson ms':>11}")
+    for n in args.sizes:
+        x = rng.normal(50, 10, n)
+        m = moments.from_array(x)
+        t_sw = timed(lambda: stats.shapiro(x), args.repeat)
+        t_dag = timed(lambda: normality.run(x, "dagostino"), args.repeat)
+        t_cache = timed(lambda: normality.run(m, "dagostino"), args.repeat)
+        t_ad = timed(lambda: normality.run(x, "anderson"), args.repeat)
+        print(f"{n:>9} | {t_sw:>10.2f} | {t_dag:>12.2f} | {t_cache:>13.3f} | {t_ad:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
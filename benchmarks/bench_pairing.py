@@ -0,0 +1,84 @@
+# benchmarks/bench_pairing.py
+"""
+Waktu dan puncak memori (RSS) pemasangan paired berdasarkan ID (pairing.py)
+terhadap jumlah subjek, dibandingkan pandas.merge yang memuat kedua file.
+
+File Pre berisi semua subjek dalam urutan acak; file Post berisi 95% subjek
+dalam urutan acak lain (hash join), serta versi terurut keduanya (merge
+join). Setiap metode dijalankan di proses baru (spawn) agar puncak RSS terpisah.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_pairing --subjects 1000000 10000000
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import pairing
+
+
+def make_files(tmp, n, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = rng.permutation(n).astype(np.int64)
+    values = rng.normal(50, 10, n).round(3)
+    keep = rng.random(n) < 0.95
+    post_order = rng.permutation(np.flatnonzero(keep))
+    post_values = (values[post_order] + rng.normal(0.5, 3, len(post_order))).round(3)
+    paths = {}
+    for name, pid, pval in [("pre", ids, values), ("post", ids[post_order], post_values)]:
+        for sort in (False, True):
+            order = np.argsort(pid, kind="stable") if sort else slice(None)
+            path = os.path.join(tmp, f"{name}{'_sorted' if sort else ''}.csv")
+            pd.DataFrame({"id": pid[order], "nilai": pval[order]}).to_csv(path, index=False, chunksize=1_000_000)
+            paths[name, sort] = path
+    return paths
+
+
+def peak_rss_mb():
+    """VmHWM proses ini (ru_maxrss ikut terwarisi lewat fork/exec, VmHWM tidak)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def run(method, p1, p2):
+    start = time.perf_counter()
+    if method == "pandas.merge":
+        df = pd.read_csv(p1).merge(pd.read_csv(p2), on="id")
+        n, mean = len(df), float((df["nilai_x"] - df["nilai_y"]).mean())
+    else:
+        join = pairing.hash_join_moments if method == "hash join" else pairing.merge_join_moments
+        res = join(p1, p2, "id", "nilai")
+        n, mean = res.n_matched, float(res.moments.mean)
+    seconds = time.perf_counter() - start
+    return seconds, peak_rss_mb(), n, mean
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subjects", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--skip-pandas", action="store_true", help="lewati baseline pandas.merge (butuh RAM besar)")
+    args = parser.parse_args()
+
+    methods = ["hash join", "merge join"] + ([] if args.skip_pandas else ["pandas.merge"])
+    print(f"{'subjek':>11} | {'metode':>12} | {'detik':>7} | {'puncak RSS MB':>13} | {'pasangan':>11} | {'mean selisih':>12}")
+    for n in args.subjects:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = make_files(tmp, n)
+            for method in methods:
+                sort = method == "merge join"
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    seconds, rss, pairs, mean = pool.submit(run, method, paths["pre", sort], paths["post", sort]).result()
+                print(f"{n:>11,} | {method:>12} | {seconds:>7.2f} | {rss:>13.0f} | {pairs:>11,} | {mean:>12.5f}")
+
+
+if __name__ == "__main__":
+    main()
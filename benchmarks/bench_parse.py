@@ -0,0 +1,64 @@
+# benchmarks/bench_parse.py
+"""
+Throughput parser input manual: parse_data lama (loop float per token) vs ingest.parse_numbers.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_parse
+    python -m benchmarks.bench_parse --sizes 10000 1000000
+"""
+import argparse
+import re
+import time
+
+import numpy as np
+
+import ingest
+
+
+def legacy_parse(input_text):
+    clean_text = re.sub(r'[;,\t\n]', ' ', input_text)
+    data_list = []
+    for x in clean_text.split():
+        try:
+            data_list.append(float(x))
+        except ValueError:
+            continue
+    return np.array(data_list)
+
+
+def make_text(n_tokens, junk_every=0, seed=0):
+    rng = np.random.default_rng(seed)
+    tokens = rng.normal(50, 10, n_tokens).round(3).astype(str)
+    if junk_every:
+        tokens[::junk_every] = "n/a"
+    return ", ".join(tokens)
+
+
+def timed(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**6, 10**7])
+    parser.add_argument("--junk-every", type=int, default=0,
+                        help="sisipkan satu token non-angka setiap N token (0 = tidak ada)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tokens':>10} | {'lama (s)':>9} | {'baru (s)':>9} | {'baru Mtok/s':>11} | {'speedup':>7}")
+    for n in args.sizes:
+        text = make_text(n, args.junk_every)
+        repeat = args.repeat if n < 10**7 else 1
+        t_old = timed(legacy_parse, text, repeat)
+        t_new = timed(ingest.parse_numbers, text, repeat)
+        print(f"{n:>10} | {t_old:>9.4f} | {t_new:>9.4f} | {n / t_new / 1e6:>11.2f} | {t_old / t_new:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
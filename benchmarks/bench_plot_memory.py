@@ -0,0 +1,124 @@
+# benchmarks/bench_plot_memory.py
+"""
+Pertumbuhan memori saat halaman hasil uji di-rerun 1000 kali.
+
+Membandingkan plot_distribution lama (pyplot tanpa plt.close) dengan
+plots.render_png. Skenario "sama" memakai input yang identik (setiap rerun
+mengenai cache), skenario "acak" memakai statistik berbeda setiap rerun
+(cache terus terisi sampai batas LRU). Prosesnya dijalankan di interpreter
+terpisah supaya RSS tidak saling memengaruhi.
+
+Untuk plots.render_png skrip gagal (AssertionError) bila ada figure yang
+tertinggal terbuka, RSS bertambah lebih dari MAX_GROWTH_MB selama seluruh
+rerun, atau lebih dari MAX_LATE_GROWTH_MB pada paruh kedua rerun (setelah
+cache LRU penuh memori harus datar). tests/test_plots.py hanya memeriksa
+jumlah figure terbuka, tanpa mengukur RSS.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_plot_memory --reruns 1000
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MAX_GROWTH_MB = 64
+MAX_LATE_GROWTH_MB = 8
+
+CHILD = r"""
+import gc, io, resource, sys, time
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+mode, scenario, reruns = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / 1024**2
+
+
+def legacy(stat_val, crit_val, df1):
+    import matplotlib.pyplot as plt
+    from scipy import stats
+    fig, ax = plt.subplots(figsize=(10, 4))
+    limit = max(4, abs(stat_val) + 1, abs(crit_val) + 1)
+    x = np.linspace(-limit, limit, 1000)
+    y = stats.t.pdf(x, df1)
+    ax.plot(x, y, label=f'Distribusi t (df={df1:.2f})', color='#2563EB', linewidth=2)
+    ax.fill_between(x, y, alpha=0.1, color='#2563EB')
+    ax.fill_between(x, y, where=(x <= -crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
+    ax.fill_between(x, y, where=(x >= crit_val), color='#EF4444', alpha=0.5)
+    ax.axvline(-crit_val, color='red', linestyle=':')
+    ax.axvline(crit_val, color='red', linestyle=':')
+    ax.axvline(stat_val, color='#10B981', linestyle='--', linewidth=2.5, label=f'Statistik Hitung ({stat_val:.2f})')
+    ax.set_title("Visualisasi Daerah Keputusan")
+    ax.legend()
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    fig.savefig(io.BytesIO(), format="png")  # st.pyplot(fig) merender PNG tanpa menutup figure
+
+
+def new(stat_val, crit_val, df1):
+    import plots
+    plots.render_png('t', stat_val, crit_val, 'two', df1)
+
+
+func = legacy if mode == "lama" else new
+rng = np.random.default_rng(0)
+func(2.0, 2.05, 29)
+gc.collect()
+start_rss = rss_mb()
+start = time.perf_counter()
+for i in range(reruns):
+    if i == reruns // 2:
+        gc.collect()
+        half_rss = rss_mb()
+    stat = 2.0 if scenario == "sama" else float(rng.normal(0, 2))
+    func(stat, 2.05, 29)
+elapsed = time.perf_counter() - start
+gc.collect()
+import matplotlib.pyplot as plt
+print(f"{rss_mb() - start_rss:.1f} {rss_mb() - half_rss:.1f} {elapsed / reruns * 1000:.2f} {len(plt.get_fignums())}")
+"""
+
+
+def measure(mode, scenario, reruns):
+    """(ΔRSS total MB, ΔRSS paruh kedua MB, ms/rerun, figure terbuka) di interpreter baru."""
+    out = subprocess.run([sys.executable, "-c", CHILD, mode, scenario, str(reruns)],
+                         capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    growth, late, ms, figs = out.stdout.split()
+    return float(growth), float(late), float(ms), int(figs)
+
+
+def check_bounded(scenario, growth, late, figs):
+    assert figs == 0, f"{scenario}: {figs} figure matplotlib tertinggal terbuka"
+    assert growth < MAX_GROWTH_MB, f"{scenario}: RSS bertambah {growth:.1f} MB (batas {MAX_GROWTH_MB} MB)"
+    assert late < MAX_LATE_GROWTH_MB, \
+        f"{scenario}: RSS masih bertambah {late:.1f} MB di paruh kedua (batas {MAX_LATE_GROWTH_MB} MB)"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reruns", type=int, default=1000)
+
+    parser.add_argument("--skip-legacy", action="store_true", help="lewati implementasi lama (lambat, ~2.6 GB)")
+    args = parser.parse_args()
+
+    print(f"{'implementasi':<12} | {'skenario':<8} | {'ΔRSS (MB)':>9} | {'ΔRSS paruh 2':>12} | "
+          f"{'ms/rerun':>8} | {'figure terbuka':>14}")
+    results = {}
+    for mode in ("baru",) if args.skip_legacy else ("lama", "baru"):
+        for scenario in ("sama", "acak"):
+            growth, late, ms, figs = results[mode, scenario] = measure(mode, scenario, args.reruns)
+            print(f"{mode:<12} | {scenario:<8} | {growth:>9.1f} | {late:>12.1f} | {ms:>8.2f} | {figs:>14}")
+    for scenario in ("sama", "acak"):
+        growth, late, _, figs = results["baru", scenario]
+        check_bounded(scenario, growth, late, figs)
+    print(f"OK: render_png tanpa figure terbuka, ΔRSS < {MAX_GROWTH_MB} MB, paruh kedua < {MAX_LATE_GROWTH_MB} MB.")
+
+
+if __name__ == "__main__":
+    main()
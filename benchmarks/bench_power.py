@@ -0,0 +1,60 @@
+# benchmarks/bench_power.py
+"""
+Waktu menghitung grid power (effect x n x alpha) per uji.
+
+- analitik : power.analytic_power untuk seluruh grid dalam satu panggilan
+- simulasi : power.simulate_power (--sims per sel) dengan 1..k workers
+
+Selisih maksimum analitik vs simulasi ikut dicetak sebagai pemeriksaan rumus.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_power --effects 10 --ns 50 --sims 2000 --workers 1 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+import power
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--effects", type=int, default=10)
+    parser.add_argument("--ns", type=int, default=50)
+    parser.add_argument("--alphas", type=float, nargs="+", default=[0.01, 0.05, 0.10])
+    parser.add_argument("--sims", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    ns = np.unique(np.geomspace(5, 500, args.ns).round())
+    effect_ranges = {"f": (1.2, 3.0), "proportion_1": (0.02, 0.2), "proportion_2": (0.02, 0.2)}
+    cells = args.effects * len(ns) * len(args.alphas)
+    print(f"grid {args.effects} x {len(ns)} x {len(args.alphas)} = {cells} sel, {args.sims} simulasi per sel")
+    print(f"{'uji':<13} | {'analitik ms':>11} | " + " | ".join(f"{'sim w=' + str(w) + ' s':>10}" for w in args.workers) + " | max |selisih|")
+
+    for test in power.TESTS:
+        effects = np.linspace(*effect_ranges.get(test, (0.1, 1.0)), args.effects)
+        row = f"{test:<13} | "
+        exact = None
+        if test in power.CLOSED_FORM:
+            t, exact = timed(lambda: power.power_grid(test, effects, ns, args.alphas))
+            row += f"{t * 1000:>11.1f} | "
+        else:
+            row += f"{'-':>11} | "
+        for w in args.workers:
+            t, sim = timed(lambda: power.power_grid(test, effects, ns, args.alphas, method="simulate",
+                                                    n_sims=args.sims, seed=1, workers=w))
+            row += f"{t:>10.2f} | "
+        row += "-" if exact is None else f"{np.max(np.abs(sim - exact)):.3f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_pvalues.py
+"""
+P-value ekor atas: rumus lama (1 - cdf) vs sf vs log_p_value.
+
+Untuk n statistik acak dengan rentang lebar dicetak waktu (ms) dan jumlah
+p-value yang runtuh ke 0 (log p = -inf), sehingga tidak bisa diurutkan.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_pvalues --n 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy import stats
+
+import critical_values
+
+
+CASES = {
+    "normal": (stats.norm, (), 60.0),
+    "t (df=30)": (stats.t, (30,), 1e4),
+    "t (df=10^4)": (stats.t, (10_000,), 300.0),
+    "F (5, 50)": (stats.f, (5, 50), 1e6),
+}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=10**6)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'distribusi':<12} | {'1-cdf ms':>9} | {'nol':>7} | {'sf ms':>8} | {'nol':>7} | {'log_p ms':>9} | {'-inf':>5}")
+    for label, (dist, args_, top) in CASES.items():
+        name = "normal" if dist is stats.norm else "t" if dist is stats.t else "f"
+        stat = np.exp(rng.uniform(0, np.log(top), args.n))
+        df1, df2 = (args_ + (None, None))[:2]
+
+        t_old, p_old = timed(lambda: 1 - dist.cdf(stat, *args_))
+        t_sf, p_sf = timed(lambda: dist.sf(stat, *args_))
+        t_log, log_p = timed(lambda: critical_values.log_p_value(name, stat, "right", df1, df2))
+        print(f"{label:<12} | {t_old:>9.1f} | {np.sum(p_old <= 0):>7} | {t_sf:>8.1f} | {np.sum(p_sf <= 0):>7} | "
+              f"{t_log:>9.1f} | {np.sum(np.isinf(log_p)):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/bench_render.py
+"""
+Waktu server dan ukuran respons per render grafik: PNG matplotlib vs spesifikasi Vega-Lite.
+
+Cache PNG dilewati (fungsi asli dipanggil langsung) agar yang terukur
+adalah biaya render sebenarnya; spesifikasi Vega-Lite diukur sampai
+diserialisasi menjadi JSON seperti yang dikirim Streamlit ke browser.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_render --renders 50
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+import plots
+
+
+CASES = [
+    ("normal", 2.3, 1.96, "two", None, None),
+    ("t", -1.2, -1.699, "left", 29, None),
+    ("f", 3.1, 2.5, "two", 9, 14),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--renders", type=int, default=50)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'dist':<7} | {'PNG ms':>7} | {'PNG KB':>7} | {'Vega ms':>7} | {'Vega KB':>7}")
+    for dist, stat, crit, tail, df1, df2 in CASES:
+        stats_ = stat + rng.normal(0, 0.5, args.renders)
+
+        start = time.perf_counter()
+        for s in stats_:
+            png = plots._render_png.__wrapped__(dist, float(s), crit, tail, df1, df2)
+        t_png = (time.perf_counter() - start) / args.renders
+
+        plots.pdf_curve.cache_clear()
+        start = time.perf_counter()
+        for s in stats_:
+            spec = json.dumps(plots.vega_lite_spec(dist, s, crit, tail, df1, df2))
+        t_vega = (time.perf_counter() - start) / args.renders
+
+        print(f"{dist:<7} | {t_png * 1000:>7.1f} | {len(png) / 1024:>7.1f} | {t_vega * 1000:>7.2f} | {len(spec) / 1024:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_sequential.py
+"""
+Throughput monitoring sekuensial A/B (sequential.py) dalam event per detik.
+
+Mengukur empat jalur: event tunggal tanpa NumPy (sequential.step), batch
+array di memori (beberapa ukuran batch), queue lokal (queue.Queue + sequential.drain), dan
+file CSV event (sequential.read_updates).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_sequential --events 2000000 --method msprt
+"""
+import argparse
+import io
+import queue
+import time
+
+import numpy as np
+
+import sequential
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--method", choices=list(sequential.METHODS), default="msprt")
+    parser.add_argument("--batches", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    kw = dict(method=args.method, alpha=0.05, planned_n=args.events)
+
+    n = args.events
+    arm = rng.integers(0, 2, n)
+    success = (rng.random(n) < 0.1).astype(np.int64)
+
+    print(f"{'jalur':>24} | {'event':>10} | {'detik':>7} | {'event/detik':>12}")
+
+    def report(label, count, seconds):
+        print(f"{label:>24} | {count:>10,} | {seconds:>7.3f} | {count / seconds:>12,.0f}")
+
+    count = min(n, 500_000)
+    events = list(zip(arm[:count].tolist(), success[:count].tolist()))
+    state = sequential.EMPTY
+    start = time.perf_counter()
+    for a, s in events:
+        state = sequential.step(state, a, s, **kw)
+    report("event tunggal (step)", count, time.perf_counter() - start)
+
+    for batch in args.batches:
+        count = min(n, batch * 20_000) if batch < 100 else n
+        state = sequential.EMPTY
+        start = time.perf_counter()
+        for i in range(0, count, batch):
+            state = sequential.update_events(state, arm[i:i + batch], success[i:i + batch], **kw)
+        report(f"batch {batch:,}", count, time.perf_counter() - start)
+
+    q = queue.Queue()
+    for item in zip(arm[:n // 4].tolist(), success[:n // 4].tolist()):
+        q.put(item)
+    state = sequential.EMPTY
+    start = time.perf_counter()
+    while not q.empty():
+        state = sequential.drain(q, state, **kw)
+    report("queue lokal (drain)", state.n_events, time.perf_counter() - start)
+
+    buf = io.StringIO("grup,sukses\n" + "\n".join(f"{'AB'[a]},{s}" for a, s in zip(arm, success)))
+    state = sequential.EMPTY
+    start = time.perf_counter()
+    for update in sequential.read_updates(buf):
+        state = sequential.update_counts(state, *update, **kw)
+    report("file CSV (grup,sukses)", state.n_events, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_sharded.py
+"""
+Skalabilitas ingest.sharded_moments untuk 1, 2, 4, 8 proses, dibandingkan
+dengan pembacaan streaming satu proses (ingest.stream_csv_moments).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_sharded --rows 20000000
+    python -m benchmarks.bench_sharded --path data.csv --column nilai
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import ingest
+import moments
+
+
+def make_csv(path, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    block = 1_000_000
+    for i, start in enumerate(range(0, rows, block)):
+        size = min(block, rows - start)
+        df = pd.DataFrame({
+            "id": np.arange(start, start + size),
+            "nilai": rng.normal(1e4, 25, size).round(4),
+        })
+        df.to_csv(path, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path")
+    parser.add_argument("--column", default="nilai")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--shard-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    tmp = None
+    path = args.path
+    if path is None:
+        tmp = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+        tmp.close()
+        path = tmp.name
+        make_csv(path, args.rows)
+
+    try:
+        size_mb = os.path.getsize(path) / 1024**2
+        print(f"File: {path} ({size_mb:.0f} MB), CPU tersedia: {os.cpu_count()}")
+
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            ref, _ = ingest.stream_csv_moments(f, args.column)
+        t_ref = time.perf_counter() - start
+        print(f"{'streaming 1 proses':>20} | {t_ref:8.2f} s | {size_mb / t_ref:8.1f} MB/s")
+
+        for w in args.workers:
+            start = time.perf_counter()
+            m, _ = ingest.sharded_moments(path, args.column, workers=w, shard_bytes=args.shard_mb * 1024**2)
+            elapsed = time.perf_counter() - start
+            rel_mean = abs(m.mean - ref.mean) / abs(ref.mean)
+            rel_var = abs(moments.variance(m) / moments.variance(ref) - 1)
+            assert m.n == ref.n and rel_mean < 1e-12 and rel_var < 1e-9, (m, ref)
+            print(f"{f'sharded {w} proses':>20} | {elapsed:8.2f} s | {size_mb / elapsed:8.1f} MB/s "
+                  f"| speedup {t_ref / elapsed:4.2f}x | rel.err mean {rel_mean:.1e} var {rel_var:.1e}")
+    finally:
+        if tmp is not None:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
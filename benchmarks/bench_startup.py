@@ -0,0 +1,55 @@
+# benchmarks/bench_startup.py
+"""
+Waktu impor (cold start) per halaman, sebelum dan sesudah impor dipindah ke halaman.
+
+Setiap pengukuran berjalan di interpreter baru agar cache modul tidak ikut
+terhitung. "Sebelum" meniru main.py lama yang mengimpor content beserta
+scipy.stats, matplotlib.pyplot, pandas dan google.generativeai untuk
+semua halaman.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+BEFORE = ["streamlit", "numpy", "pandas", "scipy.stats", "matplotlib.pyplot", "google.generativeai", "styles"]
+
+PAGES = {
+    "🏠 Home": ["streamlit", "styles"],
+    "🤖 AI Consultant": ["streamlit", "styles", "consultant"],
+    "📚 Analisis Statistik": ["streamlit", "styles", "content"],
+    "📚 Analisis + upload/plot": ["streamlit", "styles", "content", "pandas", "matplotlib.pyplot"],
+    "🤖 AI Consultant + klik": ["streamlit", "styles", "consultant", "google.generativeai"],
+}
+
+
+def import_time(modules):
+    code = (
+        "import time; t = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modules)
+        + "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure(modules, repeat):
+    return statistics.median(import_time(modules) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    before = measure(BEFORE, args.repeat)
+    print(f"{'halaman':<28} | {'sebelum (s)':>11} | {'sesudah (s)':>11}")
+    for page, modules in PAGES.items():
+        print(f"{page:<28} | {before:>11.3f} | {measure(modules, args.repeat):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_watch.py
+"""
+Latensi pembaruan mode watch (ingest.tail_csv_moments) terhadap ukuran file.
+
+Untuk setiap ukuran, file CSV dibuat lalu diringkas sekali; kemudian
+--append baris ditambahkan beberapa kali dan waktu melipat baris baru
+diukur. Pembanding: membaca ulang seluruh file (ingest.sharded_moments,
+1 proses) seperti sebelum ada mode watch.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_watch --rows 100000 1000000 10000000 --append 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ingest
+
+
+def write_rows(f, rng, n):
+    np.savetxt(f, np.column_stack([np.arange(n), rng.normal(50, 10, n)]), fmt=["%d", "%.4f"], delimiter=",")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--append", type=int, default=1000, help="baris baru per pembaruan")
+    parser.add_argument("--updates", type=int, default=5)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'baris':>11} | {'MB':>7} | {'watch ms (median)':>17} | {'baca ulang ms':>13} | {'rasio':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"data_{rows}.csv")
+            with open(path, "w") as f:
+                f.write("id,nilai\n")
+                write_rows(f, rng, rows)
+            state = ingest.tail_csv_moments(path, "nilai")
+
+            times = []
+            for _ in range(args.updates):
+                with open(path, "a") as f:
+                    write_rows(f, rng, args.append)
+                start = time.perf_counter()
+                state = ingest.tail_csv_moments(path, "nilai", state)
+                times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            full, _ = ingest.sharded_moments(path, "nilai", workers=1)
+            t_full = time.perf_counter() - start
+            assert full.n == state.moments.n and np.isclose(full.mean, state.moments.mean)
+
+            t_watch = np.median(times)
+            print(f"{rows:>11,} | {os.path.getsize(path) / 1024**2:>7.1f} | {t_watch * 1000:>17.2f} | "
+                  f"{t_full * 1000:>13.1f} | {t_full / t_watch:>6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# consultant.py
+import queue
+import threading
+import time
+from functools import lru_cache
+
+import streamlit as st
+
+import ai_cache
+
+
+MODEL_NAME = 'models/gemini-2.5-flash'
+
+# Batas panggilan model yang berjalan bersamaan per proses, berapa lama
+# sesi menunggu slot, dan tenggat total satu jawaban (detik).
+MAX_CONCURRENT = 4
+SLOT_WAIT_SECONDS = 10
+TIMEOUT_SECONDS = 60
+
+_slots = threading.BoundedSemaphore(MAX_CONCURRENT)
+
+
+class ConsultantBusy(RuntimeError):
+    """Semua slot model sedang dipakai sesi lain."""
+
+
+def build_prompt(user_case):
+    return f"""
+            Kamu adalah Asisten Ahli Statistik (Metode Levine).
+            Tugas: Pilih SATU uji statistik yang tepat untuk kasus user dari daftar ini:
+            1. Uji Proporsi 1 Sampel
+            2. Uji Proporsi 2 Sampel
+            3. Uji Rata-rata 1 Sampel (Z-test)
+            4. Uji Rata-rata 1 Sampel (t-test)
+            5. Uji Rata-rata 2 Sampel Independen (Pooled t-test)
+            6. Uji Rata-rata 2 Sampel Independen (Welch t-test)
+            7. Uji Rata-rata 2 Sampel Dependen (Paired t-test)
+            8. Uji Kesamaan Varians (F-test)
+            
+            KASUS USER: "{user_case}"
+            
+            Jawab dengan format Markdown:
+            1. **Rekomendasi Uji**: [Nama Uji]
+            2. **Alasan**: [Penjelasan singkat]
+            3. **Langkah**: Pilih menu [Nama Menu] di sidebar.
+            """
+
+
+@lru_cache(maxsize=4)
+def get_model(api_key, model_name=MODEL_NAME):
+    """
+    Model dibuat sekali per proses per API key lalu dipakai ulang. Setiap model
+    punya klien sendiri dengan API key-nya (client_options); genai.configure
+    bersifat global, sehingga model yang di-cache akan ikut memakai key terakhir.
+    """
+    import google.generativeai as genai
+    from google.ai import generativelanguage as glm
+
+    model = genai.GenerativeModel(model_name)
+    model._client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+    return model
+
+
+def _finished(response):
+    """False bila model berhenti sebelum jawaban selesai (mis. MAX_TOKENS, SAFETY); tanpa info dianggap selesai."""
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return True
+    reason = getattr(candidates[0], "finish_reason", None)
+    return reason is None or getattr(reason, "name", reason) in ("STOP", 1)
+
+
+def _pump(model, prompt, timeout, out, cancel):
+    """Thread pekerja: meneruskan potongan stream ke `out`; slot dilepas saat panggilan benar-benar selesai."""
+    try:
+        response = model.generate_content(prompt, stream=True, request_options={"timeout": timeout})
+        for chunk in response:
+            if cancel.is_set():
+                return
+            out.put(("chunk", chunk.text))
+        out.put(("done", _finished(response)))
+    except Exception as e:
+        out.put(("error", e))
+    finally:
+        _slots.release()
+
+
+def stream_case(user_case, model, model_name=MODEL_NAME, timeout=None, slot_wait=None):
+    """
+    Generator potongan teks jawaban. Jawaban dari cache dikirim utuh; selain itu
+    model dipanggil dengan stream=True di thread pekerja, dibatasi MAX_CONCURRENT
+    slot. Tenggat dihitung sejak permintaan (termasuk menunggu slot); melewatinya
+    memunculkan TimeoutError dan membatalkan stream. Hanya jawaban yang selesai
+    dan tidak kosong yang disimpan ke cache.
+    """
+    cached = ai_cache.get(user_case, model_name)
+    if cached is not None:
+        yield cached
+        return
+
+    timeout = TIMEOUT_SECONDS if timeout is None else timeout
+    slot_wait = SLOT_WAIT_SECONDS if slot_wait is None else slot_wait
+    deadline = time.monotonic() + timeout
+    if not _slots.acquire(timeout=min(slot_wait, timeout)):
+        raise ConsultantBusy("Terlalu banyak permintaan AI yang sedang berjalan.")
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        _slots.release()
+        raise TimeoutError(f"AI tidak selesai menjawab dalam {timeout:g} detik.")
+
+    out, cancel = queue.Queue(), threading.Event()
+    threading.Thread(target=_pump, args=(model, build_prompt(user_case), remaining, out, cancel), daemon=True).start()
+    parts, complete = [], False
+    try:
+        while True:
+            try:
+                kind, value = out.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise TimeoutError(f"AI tidak selesai menjawab dalam {timeout:g} detik.") from None
+            if kind == "error":
+                raise value
+            if kind == "done":
+                complete = value
+                break
+            parts.append(value)
+            yield value
+    finally:
+        cancel.set()
+    text = "".join(parts)
+    if complete and text.strip():
+        ai_cache.put(user_case, model_name, text)
+
+
+def load_ai_consultant():
+    st.header("🤖 AI Statistical Consultant")
+    
+    st.markdown("""
+    <div style="background-color:#F0F9FF; padding:20px; border-radius:10px; border-left:5px solid #0284C7; margin-bottom: 20px;">
+        <h4 style="color:#0369A1; margin-top:0;">Bingung Memilih Uji Statistik?</h4>
+        <p style="color:#334155; margin-bottom:0;">
+            Ceritakan masalah penelitian Anda. AI akan menganalisis berdasarkan buku Levine.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if "GEMINI_API_KEY" in st.secrets:
+        api_key = st.secrets["GEMINI_API_KEY"]
+        has_valid_key = True
+        st.caption("✅ Terhubung menggunakan System API Key")
+    else:
+        try:
+            import os
+            if os.environ.get("GEMINI_API_KEY"):
+                api_key = os.environ.get("GEMINI_API_KEY")
+                has_valid_key = True
+            else:
+                api_key = st.text_input("🔑 Masukkan Google Gemini API Key:", type="password")
+                has_valid_key = bool(api_key)
+        except:
+             api_key = st.text_input("🔑 Masukkan Google Gemini API Key:", type="password")
+             has_valid_key = bool(api_key)
+
+    user_case = st.text_area("📝 Deskripsikan Studi Kasus Anda:", height=150)
+
+    if st.button("🔍 Analisis Kasus", type="primary"):
+        if not has_valid_key:
+            st.error("⚠️ API Key tidak ditemukan.")
+            return
+        
+        if not user_case:
+            st.warning("⚠️ Mohon tuliskan deskripsi kasus Anda.")
+            return
+
+        try:
+            st.markdown("---")
+            st.subheader("💡 Hasil Analisis")
+            st.write_stream(stream_case(user_case, get_model(api_key)))
+            st.success("✅ Silakan pilih uji tersebut di menu sidebar.")
+
+        except ConsultantBusy:
+            st.warning("⏳ Server AI sedang sibuk melayani pengguna lain. Silakan coba lagi sebentar lagi.")
+        except TimeoutError as e:
+            st.error(f"⏱️ {e} Silakan coba lagi.")
+        except Exception as e:
+            st.error(f"Terjadi kesalahan: {e}")
+            st.info("Tips: Pastikan API Key benar. Jika error model 404, coba update library 'google-generativeai'.")
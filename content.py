@@ -1,30 +1,34 @@
 # content.py
+import hashlib
+import os
 import streamlit as st
 import numpy as np
-import pandas as pd
-from scipy import stats
-import matplotlib.pyplot as plt
-import google.generativeai as genai
-import re 
+import anova
+import critical_values
+import engine
+import ingest
+import moments
+import multitest
+import normality
+import pairing
+import plots
+import resampling
+import sequential
+import summary_cache
 
 def parse_data(input_text):
     if not input_text: 
         return None
     
     try:
-        clean_text = re.sub(r'[;,\t\n]', ' ', input_text)
-        data_list = []
-        for x in clean_text.split():
-            try:
-                data_list.append(float(x))
-            except ValueError:
-                continue 
-        
-        data = np.array(data_list)
+        data, n_dropped = ingest.parse_numbers(input_text)
         
         if len(data) == 0:
             st.error("⚠️ Tidak ada angka valid yang ditemukan.")
             return None
+
+        if n_dropped:
+            st.caption(f"ℹ️ {n_dropped} token non-angka diabaikan.")
             
         return data
 
@@ -33,7 +37,104 @@ def parse_data(input_text):
         return None
 
 
-def get_data_input(label, default_text, key_suffix):
+@st.cache_data(show_spinner=False, max_entries=32)
+def read_local_moments(path, mtime, workers, column=None):
+    return ingest.sharded_moments(path, column, workers=workers)
+
+
+def local_data_dir():
+    """
+    Direktori file lokal yang boleh dibaca aplikasi, dari env atau st.secrets
+    STATLAB_DATA_DIR. Tanpa pengaturan ini (mis. deploy publik) fitur path
+    lokal dimatikan; None.
+    """
+    path = os.environ.get("STATLAB_DATA_DIR")
+    if not path:
+        try:
+            path = st.secrets.get("STATLAB_DATA_DIR")
+        except Exception:  # tidak ada secrets.toml
+            path = None
+    return os.path.realpath(path) if path else None
+
+
+def resolve_local_path(path):
+    """Path absolut di dalam local_data_dir(); path relatif dihitung dari direktori itu."""
+    base = local_data_dir()
+    if base is None:
+        raise ValueError("Akses file lokal tidak diaktifkan di server ini.")
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError("Path berada di luar direktori data.")
+    if not os.path.isfile(resolved):
+        raise ValueError("File tidak ditemukan di direktori data.")
+    return resolved
+
+
+def max_workers():
+    return os.cpu_count() or 1
+
+
+WATCH_INTERVAL = 2
+
+
+@st.fragment(run_every=WATCH_INTERVAL)
+def _watch_poll(path, size_seen):
+    """Hanya mengecek ukuran file; seluruh halaman dijalankan ulang bila file bertambah/berubah."""
+    try:
+        changed = os.path.getsize(path) != size_seen
+    except OSError:
+        return
+    if changed:
+        st.rerun()
+
+
+def watch_local_csv(path, column, key_suffix):
+    """Mode watch: Moments file CSV lokal yang diperbarui dengan baris baru saja."""
+    try:
+        path = resolve_local_path(path)
+    except ValueError as e:
+        st.error(str(e))
+        return None
+    if not path.endswith('.csv'):
+        st.error("Mode watch hanya untuk file CSV.")
+        return None
+    state_key = f"tail_{key_suffix}"
+    prev = st.session_state.get(state_key)
+    state = ingest.tail_csv_moments(path, column, prev)
+    st.session_state[state_key] = state
+    same = prev is not None and prev.column == state.column and state.moments.n >= prev.moments.n
+    added = state.moments.n - (prev.moments.n if same else 0)
+    _watch_poll(path, state.size)
+    st.success(f"👁️ Watch: {path} (Kolom: {state.column}, n={state.moments.n:,}, +{added:,} baris baru)")
+    return state.moments
+
+
+def watch_active(key_suffixes):
+    """Mode watch aktif pada salah satu input halaman ini (key_suffix get_data_input)."""
+    return local_data_dir() is not None and any(st.session_state.get(f"watch_{s}") for s in key_suffixes)
+
+
+def watched_sources(key_suffixes):
+    """(path, kolom) file yang sedang diawasi pada input halaman ini; tuple kosong bila tidak ada."""
+    if not watch_active(key_suffixes):
+        return ()
+    states = (st.session_state.get(f"tail_{s}") for s in key_suffixes if st.session_state.get(f"watch_{s}"))
+    return tuple((state.path, state.column) for state in states if state is not None)
+
+
+def run_button(label, key, watch=(), **kwargs):
+    """
+    st.button yang tetap dianggap ditekan selama mode watch aktif pada input
+    halaman ini (`watch`: key_suffix input), sehingga hasil uji dirender
+    ulang setiap kali file yang diawasi bertambah.
+    """
+    clicked = st.button(label, key=key, **kwargs)
+    if clicked:
+        st.session_state[f"ran_{key}"] = True
+    return clicked or (watch_active(watch) and st.session_state.get(f"ran_{key}", False))
+
+
+def get_data_input(label, default_text, key_suffix, allow_stream=True):
     st.markdown(f"**Data {label}**")
     key_text_area = f"text_{key_suffix}"
     
@@ -74,10 +175,20 @@ def get_data_input(label, default_text, key_suffix):
             st.session_state[key_text_area] = ", ".join(map(str, new_data))
             st.rerun()
 
-    tab_manual, tab_upload = st.tabs(["✍️ Input Manual", "📂 Upload File (CSV/Excel)"])
+    tabs = ["✍️ Input Manual", "📂 Upload File"]
+    if allow_stream and local_data_dir():
+        tabs.append("🗄️ File Lokal Besar")
+    if allow_stream:
+        tabs.append("📊 Tabel Frekuensi")
+    tab_by_name = dict(zip(tabs, st.tabs(tabs)))
+    tab_manual, tab_upload = tab_by_name["✍️ Input Manual"], tab_by_name["📂 Upload File"]
+    tab_local = [tab_by_name["🗄️ File Lokal Besar"]] if "🗄️ File Lokal Besar" in tab_by_name else []
+    tab_freq = [tab_by_name["📊 Tabel Frekuensi"]] if "📊 Tabel Frekuensi" in tab_by_name else []
     
     manual_input_str = None
     uploaded_file_obj = None
+    local_path = None
+    watch = False
 
     with tab_manual:
         manual_input_str = st.text_area(
@@ -89,25 +200,78 @@ def get_data_input(label, default_text, key_suffix):
 
     with tab_upload:
         uploaded_file_obj = st.file_uploader(
-            f"Upload CSV/Excel ({label})", 
-            type=['csv', 'xlsx', 'xls'], 
-            key=f"up_{key_suffix}"
+            f"Upload CSV/Excel/Parquet/Arrow/.npy ({label})", 
+            type=['csv', 'xlsx', 'xls', 'parquet', 'arrow', 'feather', 'npy'], 
+            key=f"up_{key_suffix}",
+            help="Parquet, Arrow/Feather, dan .npy hanya membaca kolom yang dipilih, tanpa parsing teks."
+        )
+        stream_mode = allow_stream and st.checkbox(
+            "⚡ Mode streaming (hemat memori, khusus CSV besar)",
+            key=f"stream_{key_suffix}",
+            help="File dibaca per blok dan hanya statistik cukup (n, mean, momen, min, max) yang disimpan. Uji normalitas memakai D'Agostino-Pearson dari momen."
         )
 
+    if tab_local:
+        with tab_local[0]:
+            local_path = st.text_input(
+                "Path file CSV/Parquet/Arrow/.npy (relatif terhadap direktori data server):",
+                key=f"path_{key_suffix}",
+                help="Untuk file berukuran GB. File dibagi menjadi shard dan diringkas paralel di beberapa proses."
+            )
+            workers = st.number_input("Jumlah proses", 1, max_workers(), min(4, max_workers()), key=f"workers_{key_suffix}")
+            watch = st.checkbox(
+                "👁️ Mode watch (ikuti baris baru)",
+                key=f"watch_{key_suffix}",
+                help=f"Khusus CSV. File dicek setiap {WATCH_INTERVAL} detik; hanya baris yang baru ditambahkan yang dibaca dan digabung ke statistik cukup, lalu hasil uji dihitung ulang otomatis."
+            )
+
+    freq_result = None
+    if tab_freq:
+        with tab_freq[0]:
+            freq_result = frequency_table_input(key_suffix)
+
     if uploaded_file_obj is not None:
+        import pandas as pd
+
         try:
+            if stream_mode and uploaded_file_obj.name.endswith('.csv'):
+                numeric_cols = ingest.peek_numeric_columns(uploaded_file_obj)
+                if not numeric_cols:
+                    st.error("File tidak memiliki kolom angka.")
+                    return None
+                with tab_upload:
+                    col_name = st.selectbox("Kolom", numeric_cols, key=f"col_{key_suffix}")
+                summary, col_name = ingest.stream_csv_moments(uploaded_file_obj, col_name)
+                if summary.n == 0:
+                    st.error("Kolom angka pada file kosong.")
+                    return None
+                st.success(f"✅ Streaming dari file: {uploaded_file_obj.name} (Kolom: {col_name}, n={summary.n})")
+                return summary
+
+            if ingest.is_columnar(uploaded_file_obj.name):
+                numeric_cols = ingest.column_names(uploaded_file_obj, uploaded_file_obj.name)
+                if not numeric_cols:
+                    st.error("File tidak memiliki kolom angka.")
+                    return None
+                with tab_upload:
+                    col_name = st.selectbox("Kolom", numeric_cols, key=f"col_{key_suffix}")
+                data_result, col_name = ingest.read_column_values(uploaded_file_obj, uploaded_file_obj.name, col_name)
+                st.success(f"✅ Menggunakan data dari file: {uploaded_file_obj.name} (Kolom: {col_name}, n={len(data_result)})")
+                return data_result
+
             if uploaded_file_obj.name.endswith('.csv'):
                 df = pd.read_csv(uploaded_file_obj)
             else:
                 df = pd.read_excel(uploaded_file_obj)
             
-            numeric_cols = df.select_dtypes(include=np.number).columns.tolist()
+            numeric_cols = ingest.numeric_columns(df)
             
             if not numeric_cols:
                 st.error("File tidak memiliki kolom angka.")
                 return None
             else:
-                col_name = numeric_cols[0]
+                with tab_upload:
+                    col_name = st.selectbox("Kolom", numeric_cols, key=f"col_{key_suffix}")
                 data_result = df[col_name].dropna().to_numpy()
                 st.success(f"✅ Menggunakan data dari file: {uploaded_file_obj.name} (Kolom: {col_name}, n={len(data_result)})")
                 return data_result
@@ -116,35 +280,179 @@ def get_data_input(label, default_text, key_suffix):
             st.error(f"Gagal membaca file: {e}")
             return None
 
+    if local_path:
+        try:
+            local_path = resolve_local_path(local_path)
+            with tab_local[0]:
+                col_name = st.selectbox("Kolom", ingest.peek_numeric_columns(local_path), key=f"lcol_{key_suffix}")
+            if watch:
+                return watch_local_csv(local_path, col_name, key_suffix)
+            with st.spinner("Meringkas file secara paralel..."):
+                summary, col_name = read_local_moments(local_path, os.path.getmtime(local_path),
+                                                     min(int(workers), max_workers()), col_name)
+            st.success(f"✅ Menggunakan file lokal: {local_path} (Kolom: {col_name}, n={summary.n})")
+            return summary
+        except Exception as e:
+            st.error(f"Gagal membaca file: {e}")
+            return None
+
+    if freq_result is not None:
+        return freq_result
+
     if manual_input_str:
         return parse_data(manual_input_str)
     
     return None
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def read_frequency_moments(file_bytes, name, value_col, count_col):
+    """Moments tabel frekuensi dari file; CSV dibaca per blok."""
+    import io
+    import pandas as pd
+
+    buf = io.BytesIO(file_bytes)
+    if name.endswith('.csv'):
+        return ingest.stream_csv_frequency_moments(buf, value_col, count_col)
+    df = pd.read_excel(buf)
+    return ingest.frequency_moments(pd.to_numeric(df[value_col], errors="coerce"),
+                                    pd.to_numeric(df[count_col], errors="coerce").fillna(0))
+
+
+def frequency_table_input(key_suffix):
+    """
+    Input data teragregasi (nilai, frekuensi) dari teks atau file. Data tidak
+    diekspansi; hasilnya Moments berbobot, atau None bila kosong.
+    """
+    import io
+    import pandas as pd
+
+    st.caption("Untuk data yang sudah berupa histogram: setiap nilai beserta jumlah kemunculannya. "
+               "Hasil uji sama persis dengan data mentah yang diekspansi.")
+    text = st.text_area("Satu baris per nilai: `nilai, frekuensi`", key=f"freq_txt_{key_suffix}", height=100,
+                        placeholder="10, 4\n12, 7\n15, 2")
+    uploaded = st.file_uploader("Atau upload CSV/Excel (kolom nilai + kolom frekuensi)", type=['csv', 'xlsx', 'xls'],
+                                key=f"freq_up_{key_suffix}")
+    try:
+        if uploaded is not None:
+            buf = io.BytesIO(uploaded.getvalue())
+            head = pd.read_csv(buf, nrows=1000) if uploaded.name.endswith('.csv') else pd.read_excel(buf, nrows=1000)
+            cols = ingest.numeric_columns(head)
+            c1, c2 = st.columns(2)
+            value_col = c1.selectbox("Kolom Nilai", cols, key=f"freq_val_{key_suffix}")
+            count_col = c2.selectbox("Kolom Frekuensi", [c for c in cols if c != value_col], key=f"freq_cnt_{key_suffix}")
+            if value_col is None or count_col is None:
+                st.error("File membutuhkan dua kolom angka: nilai dan frekuensi.")
+                return None
+            m = read_frequency_moments(uploaded.getvalue(), uploaded.name, value_col, count_col)
+            source = uploaded.name
+        elif text and text.strip():
+            m, rows = ingest.parse_frequency_text(text)
+            source = f"{rows} baris tabel"
+        else:
+            return None
+    except Exception as e:
+        st.error(f"Gagal membaca tabel frekuensi: {e}")
+        return None
+
+    if m.n == 0:
+        st.error("Total frekuensi adalah 0.")
+        return None
+    st.success(f"✅ Tabel frekuensi: {source} (n={int(m.n):,})")
+    return m
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def read_group_moments(file_bytes, name, value_col, group_col):
+    """Moments per grup (format panjang); CSV dibaca per blok."""
+    import io
+    import pandas as pd
+
+    buf = io.BytesIO(file_bytes)
+    if name.endswith('.csv'):
+        return ingest.stream_csv_group_moments(buf, value_col, group_col)
+    df = pd.read_parquet(buf) if name.endswith('.parquet') else pd.read_excel(buf)
+    return ingest.frame_group_moments(df, value_col, group_col)
+
+
+def get_long_format_groups(key_suffix):
+    """
+    Input format panjang (kolom grup + kolom nilai) untuk uji dua sampel.
+    Mengembalikan (Moments grup 1, Moments grup 2) atau None.
+    """
+    import io
+    import pandas as pd
+
+    with st.expander("📋 Data Format Panjang (Kolom Grup + Kolom Nilai)", expanded=False):
+        uploaded = st.file_uploader("Upload CSV/Excel/Parquet", type=['csv', 'xlsx', 'xls', 'parquet'],
+                                    key=f"long_{key_suffix}")
+        if uploaded is None:
+            return None
+        try:
+            buf = io.BytesIO(uploaded.getvalue())
+            if uploaded.name.endswith('.csv'):
+                head = pd.read_csv(buf, nrows=1000)
+            elif uploaded.name.endswith('.parquet'):
+                head = pd.read_parquet(buf)
+            else:
+                head = pd.read_excel(buf, nrows=1000)
+
+            c1, c2 = st.columns(2)
+            value_col = c1.selectbox("Kolom Nilai", ingest.numeric_columns(head), key=f"lval_{key_suffix}")
+            group_col = c2.selectbox("Kolom Grup", [c for c in head.columns if c != value_col], key=f"lgrp_{key_suffix}")
+            if value_col is None or group_col is None:
+                st.error("File membutuhkan satu kolom angka dan satu kolom grup.")
+                return None
+
+            m, labels = read_group_moments(uploaded.getvalue(), uploaded.name, value_col, group_col)
+            if len(labels) < 2:
+                st.error("Kolom grup harus memiliki minimal 2 grup.")
+                return None
+            c1, c2 = st.columns(2)
+            g1 = c1.selectbox("Grup 1", range(len(labels)), format_func=lambda i: str(labels[i]), key=f"lg1_{key_suffix}")
+            g2 = c2.selectbox("Grup 2", range(len(labels)), index=1, format_func=lambda i: str(labels[i]), key=f"lg2_{key_suffix}")
+        except Exception as e:
+            st.error(f"Gagal membaca file: {e}")
+            return None
+
+        m1, m2 = moments.take(m, g1), moments.take(m, g2)
+        st.success(f"✅ {len(labels):,} grup terbaca. Grup 1: {labels[g1]} (n={m1.n}), Grup 2: {labels[g2]} (n={m2.n})")
+        return m1, m2
+
+
+def summarize(data):
+    return summary_cache.summary(data)
+
+
 def check_normality(data, label):
-    if len(data) < 3:
+    m = summarize(data)
+    if m.n < 3:
         st.warning(f"⚠️ Data {label} terlalu sedikit untuk uji normalitas.")
         return True 
-        
-    stat, p = stats.shapiro(data)
+
+    if isinstance(data, moments.Moments) or m.n > normality.SHAPIRO_MAX_N:
+        result = normality.run(m, "dagostino")
+    else:
+        result = summary_cache.lookup(data, "shapiro", lambda: normality.run(data, "shapiro"))
+
+    if result is None:
+        st.info(f"ℹ️ Uji normalitas ({label}) dilewati: data streaming dengan n < 20.")
+        return True
+
+    method = normality.METHOD_LABELS[result.method]
+    p = result.p_val
     alpha = 0.05
     
     if p > alpha:
-        st.success(f"✅ Asumsi Normalitas Terpenuhi ({label})\n(Shapiro-Wilk p={p:.4f} > 0.05)")
+        st.success(f"✅ Asumsi Normalitas Terpenuhi ({label})\n({method} p={p:.4f} > 0.05, n={result.n_used})")
         return True
     else:
-        st.warning(f"⚠️ Asumsi Normalitas TIDAK Terpenuhi ({label})\n(Shapiro-Wilk p={p:.4f} < 0.05). Hasil mungkin bias jika n < 30.")
+        st.warning(f"⚠️ Asumsi Normalitas TIDAK Terpenuhi ({label})\n({method} p={p:.4f} < 0.05, n={result.n_used}). Hasil mungkin bias jika n < 30.")
         return False
 
 
 def calculate_cohens_d(d1, d2):
-    n1, n2 = len(d1), len(d2)
-    s1, s2 = np.var(d1, ddof=1), np.var(d2, ddof=1)
-    s_pooled = np.sqrt(((n1 - 1) * s1 + (n2 - 1) * s2) / (n1 + n2 - 2))
-    
-    if s_pooled == 0: return 0
-    return (np.mean(d1) - np.mean(d2)) / s_pooled
+    return engine.cohens_d_from_moments(*engine.sample_moments(d1), *engine.sample_moments(d2))
 
 
 def interpret_effect_size(d):
@@ -178,63 +486,120 @@ def render_hypotheses(test_name, param_latex, val_latex, direction):
     st.latex(h1)
 
 
+RENDERERS = ["Matplotlib (server)", "Vega-Lite (browser)"]
+
+
 def plot_distribution(dist_name, stat_val, crit_val, alpha, test_type, df1=None, df2=None):
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    if dist_name == 'normal':
-        limit = max(4, abs(stat_val) + 1, abs(crit_val) + 1)
-        x = np.linspace(-limit, limit, 1000)
-        y = stats.norm.pdf(x, 0, 1)
-        label_dist = 'Distribusi Normal Standar (Z)'
-    elif dist_name == 't':
-        limit = max(4, abs(stat_val) + 1, abs(crit_val) + 1)
-        x = np.linspace(-limit, limit, 1000)
-        y = stats.t.pdf(x, df1)
-        label_dist = f'Distribusi t (df={df1:.2f})'
-    elif dist_name == 'f':
-        limit = max(5, stat_val + 2, crit_val + 2)
-        x = np.linspace(0, limit, 1000)
-        y = stats.f.pdf(x, df1, df2)
-        label_dist = f'Distribusi F (df1={df1}, df2={df2})'
-    
-    ax.plot(x, y, label=label_dist, color='#2563EB', linewidth=2)
-    ax.fill_between(x, y, alpha=0.1, color='#2563EB')
+    tail = engine.tail_of(test_type)
+    if st.session_state.get("renderer", RENDERERS[0]) == RENDERERS[1]:
+        st.vega_lite_chart(plots.vega_lite_spec(dist_name, stat_val, crit_val, tail, df1, df2))
+    else:
+        st.image(plots.render_png(dist_name, stat_val, crit_val, tail, df1, df2))
 
-    type_lower = test_type.lower()
-    
-    if dist_name in ['normal', 't']:
-        crit = abs(crit_val)
-        if "two" in type_lower or "dua" in type_lower:
-            ax.fill_between(x, y, where=(x <= -crit), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
-            ax.fill_between(x, y, where=(x >= crit), color='#EF4444', alpha=0.5)
-            ax.axvline(-crit, color='red', linestyle=':')
-            ax.axvline(crit, color='red', linestyle=':')
-        elif "right" in type_lower or "kanan" in type_lower:
-            ax.fill_between(x, y, where=(x >= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
-            ax.axvline(crit_val, color='red', linestyle=':')
-        elif "left" in type_lower or "kiri" in type_lower:
-            ax.fill_between(x, y, where=(x <= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
-            ax.axvline(crit_val, color='red', linestyle=':')
-            
-    elif dist_name == 'f':
-        ax.fill_between(x, y, where=(x >= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
-        ax.axvline(crit_val, color='red', linestyle=':')
 
-    ax.axvline(stat_val, color='#10B981', linestyle='--', linewidth=2.5, label=f'Statistik Hitung ({stat_val:.2f})')
-    
-    ax.set_title("Visualisasi Daerah Keputusan")
-    ax.legend()
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    st.pyplot(fig)
+RESAMPLING_METHODS = {"Permutasi": "permutation", "Bootstrap": "bootstrap"}
 
 
-def display_test_result(stat_val, crit_val, p_val, alpha, test_type, model_label='Z', reject=False, dist_name='normal', df1=None, df2=None):
+def resampling_options(key_suffix):
+    """Opsi p-value resampling; mengembalikan dict argumen atau None bila tidak diaktifkan."""
+    with st.expander("🎲 P-Value Resampling (Permutasi / Bootstrap)", expanded=False):
+        if not st.checkbox("Hitung juga p-value resampling", key=f"rs_on_{key_suffix}",
+                           help="Berguna saat asumsi normalitas diragukan. Butuh data mentah (bukan mode streaming)."):
+            return None
+        c1, c2, c3 = st.columns(3)
+        method = c1.selectbox("Metode", list(RESAMPLING_METHODS), key=f"rs_m_{key_suffix}")
+        n_resamples = c2.number_input("Jumlah Resample", 1000, 1_000_000, 10_000, step=1000, key=f"rs_b_{key_suffix}")
+        seed = c3.number_input("Seed", 0, 2**31 - 1, 2024, key=f"rs_s_{key_suffix}")
+        return {"method": RESAMPLING_METHODS[method], "n_resamples": int(n_resamples), "seed": int(seed),
+                "workers": os.cpu_count() or 1, "tol": 0.001}
+
+
+def show_resampling(run, d1, d2, options, alpha):
+    if options is None:
+        return
+    if isinstance(d1, moments.Moments) or isinstance(d2, moments.Moments):
+        st.warning("P-value resampling membutuhkan data mentah; dilewati untuk data streaming.")
+        return
+    with st.spinner("Menjalankan resampling..."):
+        res = run(d1, d2, **options)
+    label = "Permutasi" if res.method == "permutation" else "Bootstrap"
+    keputusan = "Tolak H0" if res.p_val < alpha else "Gagal Tolak H0"
+    st.info(f"**P-Value {label}:** {res.p_val:.4f} (± {res.mc_se:.4f}, {res.n_resamples:,} resample"
+            f"{', berhenti lebih awal' if res.stopped_early else ''}) → {keputusan}")
+
+
+def record_test(title, stat_val, p_val, alpha, reject, key=None, replace=False):
+    """
+    Menyimpan hasil uji ke riwayat sesi untuk koreksi multiple testing.
+    Rerun Streamlit (poll mode watch, interaksi widget lain) merender ulang
+    hasil yang sama; hasil hanya dicatat sekali per `key`, default
+    (judul, statistik, p-value, alpha), yang berubah bila datanya berubah.
+    Dengan `replace=True` entri ber-`key` sama ditimpa (hasil mode watch:
+    satu uji yang terus diperbarui, bukan uji baru).
+    """
+    key = (title, float(stat_val), float(p_val), alpha) if key is None else key
+    index = st.session_state.setdefault("riwayat_kunci", {})
+    riwayat = st.session_state.setdefault("riwayat_uji", [])
+    entry = {"Uji": title, "Statistik": float(stat_val), "P-Value": float(p_val), "Alpha": alpha, "Tolak H0": bool(reject)}
+    if key not in index:
+        index[key] = len(riwayat)
+        riwayat.append(entry)
+    elif replace:
+        riwayat[index[key]] = entry
+
+
+def show_multiple_testing():
+    """Panel keputusan terkoreksi; tampil bila lebih dari satu uji sudah dijalankan di sesi ini."""
+    riwayat = st.session_state.get("riwayat_uji", [])
+    if len(riwayat) < 2:
+        return
+    import pandas as pd
+
+    st.markdown("---")
+    with st.expander(f"🧮 Koreksi Multiple Testing ({len(riwayat)} uji di sesi ini)", expanded=False):
+        c1, c2 = st.columns(2)
+        method = c1.selectbox("Metode Koreksi", list(multitest.METHODS), format_func=multitest.METHODS.get,
+                              index=1, key="mt_method")
+        alpha = c2.number_input("Alpha Keluarga / FDR", 0.001, 0.20, 0.05, key="mt_alpha")
+
+        table = pd.DataFrame(riwayat)
+        reject, p_adj = multitest.decide(table["P-Value"].to_numpy(), alpha, method)
+        table["P-Value Terkoreksi"] = p_adj
+        table["Tolak H0 (Terkoreksi)"] = reject
+        st.dataframe(table)
+        if st.button("🗑️ Hapus Riwayat", key="mt_reset"):
+            st.session_state["riwayat_uji"] = []
+            st.session_state["riwayat_kunci"] = {}
+            st.rerun()
+
+
+def format_small_p(log_p):
+    """P-value kecil dari log p dalam notasi ilmiah, juga di bawah batas float64 (mis. 3.2e-512)."""
+    log10_p = float(log_p) / np.log(10)
+    if np.isnan(log10_p):
+        return "tidak terdefinisi"
+    if np.isinf(log10_p):
+        return "0" if log10_p < 0 else "1"
+    exponent = int(np.floor(log10_p))
+    mantissa = 10 ** (log10_p - exponent)
+    if mantissa >= 9.995:
+        mantissa, exponent = 1.0, exponent + 1
+    return f"{mantissa:.2f}e{exponent}"
+
+
+def display_test_result(stat_val, crit_val, p_val, alpha, test_type, model_label='Z', reject=False, dist_name='normal', df1=None, df2=None, title=None, watch=()):
+    title = title or f"{model_label}-Test"
+    sources = watched_sources(watch)
+    if sources:
+        record_test(title, stat_val, p_val, alpha, reject, key=(title, sources, alpha), replace=True)
+    else:
+        record_test(title, stat_val, p_val, alpha, reject)
     st.markdown("---")
     st.subheader(f"📊 Hasil Perhitungan Statistik ({model_label}-Test)")
 
     if p_val < 0.0001:
-        p_str = "< 0.0001"
+        log_p = critical_values.log_p_value(dist_name, stat_val, engine.tail_of(test_type), df1, df2)
+        p_str = format_small_p(log_p)
     else:
         p_str = f"{p_val:.4f}"
 
@@ -254,82 +619,6 @@ def display_test_result(stat_val, crit_val, p_val, alpha, test_type, model_label
         st.write(f"Karena {model_label}-Hitung TIDAK berada di daerah penolakan (atau P-Value {p_str} > Alpha {alpha}), maka bukti belum cukup untuk menolak Hipotesis Nol.")
 
 
-def load_ai_consultant():
-    st.header("🤖 AI Statistical Consultant")
-    
-    st.markdown("""
-    <div style="background-color:#F0F9FF; padding:20px; border-radius:10px; border-left:5px solid #0284C7; margin-bottom: 20px;">
-        <h4 style="color:#0369A1; margin-top:0;">Bingung Memilih Uji Statistik?</h4>
-        <p style="color:#334155; margin-bottom:0;">
-            Ceritakan masalah penelitian Anda. AI akan menganalisis berdasarkan buku Levine.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    if "GEMINI_API_KEY" in st.secrets:
-        api_key = st.secrets["GEMINI_API_KEY"]
-        has_valid_key = True
-        st.caption("✅ Terhubung menggunakan System API Key")
-    else:
-        try:
-            import os
-            if os.environ.get("GEMINI_API_KEY"):
-                api_key = os.environ.get("GEMINI_API_KEY")
-                has_valid_key = True
-            else:
-                api_key = st.text_input("🔑 Masukkan Google Gemini API Key:", type="password")
-                has_valid_key = bool(api_key)
-        except:
-             api_key = st.text_input("🔑 Masukkan Google Gemini API Key:", type="password")
-             has_valid_key = bool(api_key)
-
-    user_case = st.text_area("📝 Deskripsikan Studi Kasus Anda:", height=150)
-
-    if st.button("🔍 Analisis Kasus", type="primary"):
-        if not has_valid_key:
-            st.error("⚠️ API Key tidak ditemukan.")
-            return
-        
-        if not user_case:
-            st.warning("⚠️ Mohon tuliskan deskripsi kasus Anda.")
-            return
-
-        try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('models/gemini-2.5-flash') 
-            
-            system_prompt = f"""
-            Kamu adalah Asisten Ahli Statistik (Metode Levine).
-            Tugas: Pilih SATU uji statistik yang tepat untuk kasus user dari daftar ini:
-            1. Uji Proporsi 1 Sampel
-            2. Uji Proporsi 2 Sampel
-            3. Uji Rata-rata 1 Sampel (Z-test)
-            4. Uji Rata-rata 1 Sampel (t-test)
-            5. Uji Rata-rata 2 Sampel Independen (Pooled t-test)
-            6. Uji Rata-rata 2 Sampel Independen (Welch t-test)
-            7. Uji Rata-rata 2 Sampel Dependen (Paired t-test)
-            8. Uji Kesamaan Varians (F-test)
-            
-            KASUS USER: "{user_case}"
-            
-            Jawab dengan format Markdown:
-            1. **Rekomendasi Uji**: [Nama Uji]
-            2. **Alasan**: [Penjelasan singkat]
-            3. **Langkah**: Pilih menu [Nama Menu] di sidebar.
-            """
-            
-            with st.spinner("🤖 AI sedang berpikir..."):
-                response = model.generate_content(system_prompt)
-                st.markdown("---")
-                st.subheader("💡 Hasil Analisis")
-                st.markdown(response.text)
-                st.success("✅ Silakan pilih uji tersebut di menu sidebar.")
-
-        except Exception as e:
-            st.error(f"Terjadi kesalahan: {e}")
-            st.info("Tips: Pastikan API Key benar. Jika error model 404, coba update library 'google-generativeai'.")
-
-
 def load_home():
     st.title("📊 Statistical Analysis Tool")
     st.write("Selamat datang! Silakan pilih menu di sidebar untuk memulai analisis statistik.")
@@ -358,28 +647,14 @@ def load_uji_proporsi_1_sampel(title):
         render_hypotheses("Proporsi 1 Sampel", r"\pi", f"{pi0}", jenis_uji)
 
         p_hat = x / n
-        denom = np.sqrt((pi0 * (1 - pi0)) / n)
         
         if n*pi0 < 5 or n*(1-pi0) < 5:
             st.warning("⚠️ Peringatan: Asumsi nπ ≥ 5 atau n(1-π) ≥ 5 mungkin tidak terpenuhi.")
 
-        z_score = (p_hat - pi0) / denom
-        
-        if "Two" in jenis_uji:
-            z_crit = stats.norm.ppf(1 - alpha/2)
-            p_val = 2 * (1 - stats.norm.cdf(abs(z_score)))
-            reject = abs(z_score) > z_crit
-        elif "Right" in jenis_uji:
-            z_crit = stats.norm.ppf(1 - alpha)
-            p_val = 1 - stats.norm.cdf(z_score)
-            reject = z_score > z_crit
-        else:
-            z_crit = stats.norm.ppf(alpha)
-            p_val = stats.norm.cdf(z_score)
-            reject = z_score < z_crit
+        res = engine.proportion_test_1(x, n, pi0, alpha, jenis_uji)
 
         st.info(f"Proporsi Sampel (p) = {p_hat:.4f}")
-        display_test_result(z_score, z_crit, p_val, alpha, jenis_uji, 'Z', reject, 'normal')
+        display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 'Z', res.reject, 'normal', title=title)
 
 
 def load_uji_proporsi_2_sampel(title):
@@ -390,6 +665,11 @@ def load_uji_proporsi_2_sampel(title):
         Uji ini digunakan untuk menguji apakah terdapat perbedaan yang signifikan antara proporsi dua populasi independen.
         """)
         st.latex(r"Z_{STAT} = \frac{p_1 - p_2}{\sqrt{\bar{p}(1-\bar{p})\left(\frac{1}{n_1} + \frac{1}{n_2}\right)}}")
+
+    mode = st.radio("Mode", ["Snapshot", "Monitoring Sekuensial (A/B)"], horizontal=True, key="mode_prop2")
+    if mode != "Snapshot":
+        load_sequential_ab(title)
+        return
     
     c1, c2 = st.columns(2)
     with c1:
@@ -408,25 +688,95 @@ def load_uji_proporsi_2_sampel(title):
         render_hypotheses("Proporsi 2 Sampel", r"\pi_1 - \pi_2", "0", jenis_uji)
 
         p1, p2 = x1/n1, x2/n2
-        p_pool = (x1 + x2) / (n1 + n2)
-        denom = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
-        z_score = (p1 - p2) / denom
-        
-        if "Two" in jenis_uji:
-            z_crit = stats.norm.ppf(1 - alpha/2)
-            p_val = 2 * (1 - stats.norm.cdf(abs(z_score)))
-            reject = abs(z_score) > z_crit
-        elif "Right" in jenis_uji:
-            z_crit = stats.norm.ppf(1 - alpha)
-            p_val = 1 - stats.norm.cdf(z_score)
-            reject = z_score > z_crit
-        else:
-            z_crit = stats.norm.ppf(alpha)
-            p_val = stats.norm.cdf(z_score)
-            reject = z_score < z_crit
+        res = engine.proportion_test_2(x1, n1, x2, n2, alpha, jenis_uji)
             
         st.info(f"Selisih Proporsi: {p1-p2:.4f}")
-        display_test_result(z_score, z_crit, p_val, alpha, jenis_uji, 'Z', reject, 'normal')
+        display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 'Z', res.reject, 'normal', title=title)
+
+
+def sequential_chart(trace, max_points=2000):
+    """Spesifikasi Vega-Lite z vs batas penolakan; trace di-downsample agar ringan."""
+    import pandas as pd
+
+    step = max(1, len(trace.n_events) // max_points)
+    idx = np.r_[np.arange(0, len(trace.n_events), step), len(trace.n_events) - 1]
+    df = pd.DataFrame({"Event": trace.n_events[idx], "Z": trace.z[idx], "Batas": trace.bound[idx]})
+    df = df.replace([np.inf, -np.inf], np.nan).melt("Event", var_name="Seri", value_name="Nilai").dropna()
+    return {
+        "width": "container",
+        "data": {"values": df.to_dict("records")},
+        "mark": "line",
+        "encoding": {
+            "x": {"field": "Event", "type": "quantitative"},
+            "y": {"field": "Nilai", "type": "quantitative", "scale": {"domain": [-8, 8], "clamp": True}},
+            "color": {"field": "Seri", "type": "nominal"},
+        },
+    }
+
+
+def load_sequential_ab(title):
+    import io
+
+    with st.expander("📘 Monitoring Sekuensial", expanded=False):
+        st.write("""
+        Untuk eksperimen A/B yang masih berjalan. Hitungan diperbarui per event dan keputusan
+        tetap valid walaupun hasil dilihat berkali-kali (tidak seperti mengulang uji Z biasa setiap jam).
+        **mSPRT** tidak butuh ukuran sampel rencana; **O'Brien-Fleming** butuh total sampel rencana dan
+        sangat ketat di awal eksperimen.
+
+        Format CSV: kolom `grup` (A/B atau 1/2) dan `sukses` (0/1) per event, atau kolom
+        `x1, n1, x2, n2` berisi pertambahan hitungan per baris.
+        """)
+
+    uploaded = st.file_uploader("Upload CSV event/pembaruan", type=['csv'], key="seq_up")
+    c1, c2, c3 = st.columns(3)
+    method = c1.selectbox("Batas", list(sequential.METHODS), format_func=sequential.METHODS.get, key="seq_m")
+    alpha = c2.number_input("Alpha", 0.001, 0.2, 0.05, key="seq_a")
+    if method == "msprt":
+        tau = c3.number_input("Tau (skala efek, selisih proporsi)", 0.001, 0.5, 0.02, format="%.3f", key="seq_tau")
+        planned_n, jenis_uji = None, "Two-sided"
+    else:
+        tau = 0.02
+        planned_n = c3.number_input("Total sampel rencana (n1 + n2)", 2, value=100_000, key="seq_n")
+        jenis_uji = st.selectbox("Jenis Uji", ("Two-sided", "Right-sided", "Left-sided"), key="seq_t")
+    if uploaded is None:
+        return
+
+    state, traces = sequential.EMPTY, []
+    try:
+        for dx1, dn1, dx2, dn2 in sequential.read_updates(io.BytesIO(uploaded.getvalue())):
+            state, tr = sequential.update_counts(state, dx1, dn1, dx2, dn2, method=method, alpha=alpha, tau=tau,
+                                                 planned_n=planned_n, jenis_uji=jenis_uji, trace=True)
+            traces.append(tr)
+    except Exception as e:
+        st.error(f"Gagal membaca file: {e}")
+        return
+    if state.n1 == 0 or state.n2 == 0:
+        st.warning("Kedua grup membutuhkan minimal satu event.")
+        return
+
+    trace = sequential.Trace(*(np.concatenate(f) for f in zip(*traces)))
+    z, bound = trace.z[-1], trace.bound[-1]
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Event", f"{state.n_events:,}")
+    c2.metric("p1 / p2", f"{state.x1 / state.n1:.4f} / {state.x2 / state.n2:.4f}")
+    c3.metric("Z saat ini", f"{z:.4f}")
+    c4.metric("Batas saat ini", f"{bound:.4f}" if np.isfinite(bound) else "∞")
+    if method == "msprt":
+        st.caption(f"P-value selalu-valid: {state.p_always:.4g}")
+    st.vega_lite_chart(sequential_chart(trace))
+
+    reject = state.reject_at > 0
+    # O'Brien-Fleming tidak punya p-value; mSPRT dicatat sekali per file + pengaturan, bukan per rerun
+    if np.isfinite(state.p_always):
+        digest = hashlib.blake2b(uploaded.getvalue(), digest_size=16).hexdigest()
+        record_test(title + " (sekuensial)", z, state.p_always, alpha, reject,
+                    key=("sekuensial", digest, method, alpha, tau, planned_n, jenis_uji))
+    if reject:
+        st.error(f"**Keputusan: Tolak H0** — batas terlewati pada event ke-{state.reject_at:,}. "
+                 "Eksperimen dapat dihentikan.")
+    else:
+        st.success("**Belum Tolak H0** — batas belum terlewati; eksperimen dapat dilanjutkan.")
 
 
 def load_z_test_1(title):
@@ -444,29 +794,16 @@ def load_z_test_1(title):
     
     data = get_data_input("Sampel", "50, 52, 51, 54, 53", "z1")
 
-    if st.button("Hitung Z-Test"):
+    if run_button("Hitung Z-Test", "run_z1", watch=("z1",)):
         if data is not None:
             render_hypotheses("Z-Test 1 Sampel", r"\mu", f"{mu0}", jenis_uji)
 
-            n = len(data)
-            xbar = np.mean(data)
-            z_score = (xbar - mu0) / (sigma / np.sqrt(n))
-            
-            if "Two" in jenis_uji:
-                z_crit = stats.norm.ppf(1 - alpha/2)
-                p_val = 2 * (1 - stats.norm.cdf(abs(z_score)))
-                reject = abs(z_score) > z_crit
-            elif "Right" in jenis_uji:
-                z_crit = stats.norm.ppf(1 - alpha)
-                p_val = 1 - stats.norm.cdf(z_score)
-                reject = z_score > z_crit
-            else:
-                z_crit = stats.norm.ppf(alpha)
-                p_val = stats.norm.cdf(z_score)
-                reject = z_score < z_crit
+            m = summarize(data)
+            xbar = m.mean
+            res = engine.z_test_1(m, mu0, sigma, alpha, jenis_uji)
 
             st.info(f"Mean Sampel: {xbar:.4f}")
-            display_test_result(z_score, z_crit, p_val, alpha, jenis_uji, 'Z', reject, 'normal')
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 'Z', res.reject, 'normal', title=title, watch=("z1",))
 
 
 def load_t_test_1(title):
@@ -485,32 +822,18 @@ def load_t_test_1(title):
     
     data = get_data_input("Sampel", "52, 55, 49, 58, 54, 51", "t1")
 
-    if st.button("Hitung t-Test"):
-        if data is not None and len(data) > 1:
+    if run_button("Hitung t-Test", "run_t1", watch=("t1",)):
+        m = summarize(data) if data is not None else None
+        if m is not None and m.n > 1:
             check_normality(data, "Sampel") 
             render_hypotheses("t-Test 1 Sampel", r"\mu", f"{mu0}", jenis_uji)
             
-            n = len(data)
-            x_bar = np.mean(data)
-            s = np.std(data, ddof=1)
-            t_stat = (x_bar - mu0) / (s / np.sqrt(n))
-            df = n - 1
-            
-            if "Two" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha/2, df)
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-                reject = abs(t_stat) > t_crit
-            elif "Right" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha, df)
-                p_val = 1 - stats.t.cdf(t_stat, df)
-                reject = t_stat > t_crit
-            else:
-                t_crit = stats.t.ppf(alpha, df)
-                p_val = stats.t.cdf(t_stat, df)
-                reject = t_stat < t_crit
+            x_bar = m.mean
+            s = moments.std(m)
+            res = engine.t_test_1(m, mu0, alpha, jenis_uji)
 
             st.info(f"Mean: {x_bar:.4f} | Std Dev: {s:.4f}")
-            display_test_result(t_stat, t_crit, p_val, alpha, jenis_uji, 't', reject, 't', df1=df)
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 't', res.reject, 't', df1=res.df1, title=title, watch=("t1",))
 
 
 def load_pooled_t_test(title):
@@ -534,10 +857,18 @@ def load_pooled_t_test(title):
         tab1, tab2 = st.tabs(["Grup 1", "Grup 2"])
         with tab1: d1 = get_data_input("Sampel 1", "52, 55, 50, 58, 54", "p1")
         with tab2: d2 = get_data_input("Sampel 2", "50, 48, 51, 49, 52", "p2")
+        long_groups = get_long_format_groups("pool")
+        if long_groups:
+            d1, d2 = long_groups
+
+    rs_opts = resampling_options("pool")
 
-    if st.button("🚀 Jalankan Analisis Lengkap", type="primary"):
+    if run_button("🚀 Jalankan Analisis Lengkap", "run_pool", watch=("p1", "p2"), type="primary"):
         if d1 is not None and d2 is not None:
-            n1, n2 = len(d1), len(d2)
+            import pandas as pd
+
+            m1, m2 = summarize(d1), summarize(d2)
+            n1, n2 = m1.n, m2.n
             
             st.markdown("---")
             render_hypotheses("Pooled t-Test", r"\mu_1 - \mu_2", "0", jenis_uji)
@@ -547,31 +878,14 @@ def load_pooled_t_test(title):
             with c1: check_normality(d1, "Grup 1")
             with c2: check_normality(d2, "Grup 2")
             
-            x1, x2 = np.mean(d1), np.mean(d2)
-            s1, s2 = np.std(d1, ddof=1), np.std(d2, ddof=1)
+            x1, x2 = m1.mean, m2.mean
+            s1, s2 = moments.std(m1), moments.std(m2)
             
-            sp2 = ((n1 - 1)*s1**2 + (n2 - 1)*s2**2) / (n1 + n2 - 2)
-            se = np.sqrt(sp2 * (1/n1 + 1/n2))
-            t_stat = (x1 - x2) / se
-            df = n1 + n2 - 2
+            res = engine.pooled_t_test(m1, m2, alpha, jenis_uji)
+            cohen_d = calculate_cohens_d(m1, m2)
             
-            if "Two" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha/2, df)
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-                reject = abs(t_stat) > t_crit
-            elif "Right" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha, df)
-                p_val = 1 - stats.t.cdf(t_stat, df)
-                reject = t_stat > t_crit
-            else:
-                t_crit = stats.t.ppf(alpha, df)
-                p_val = stats.t.cdf(t_stat, df)
-                reject = t_stat < t_crit
-
-            cohen_d = calculate_cohens_d(d1, d2)
-            
-            t_ci = stats.t.ppf(1 - 0.05/2, df)
-            moe = t_ci * se
+            t_ci = critical_values.critical_value("t", 0.05, "two", res.df1)
+            moe = t_ci * res.se
             ci_low = (x1-x2) - moe
             ci_high = (x1-x2) + moe
 
@@ -581,11 +895,13 @@ def load_pooled_t_test(title):
             })
             st.table(summ)
             
-            display_test_result(t_stat, t_crit, p_val, alpha, jenis_uji, 't', reject, 't', df1=df)
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 't', res.reject, 't', df1=res.df1, title=title, watch=("p1", "p2"))
             
             st.markdown("### 3. Estimasi Tambahan")
             st.info(f"**Confidence Interval (95%):** [{ci_low:.4f}, {ci_high:.4f}]")
             st.success(f"**Effect Size (Cohen's d):** {abs(cohen_d):.4f} ({interpret_effect_size(cohen_d)})")
+            show_resampling(lambda a, b, **kw: resampling.two_sample_test(a, b, statistic="pooled", jenis_uji=jenis_uji, **kw),
+                            d1, d2, rs_opts, alpha)
 
         else:
             st.error("Data kosong.")
@@ -604,38 +920,97 @@ def load_welch_t_test(title):
     c1, c2 = st.columns(2)
     with c1: d1 = get_data_input("Grup 1", "78, 85, 80, 92, 75", "w1")
     with c2: d2 = get_data_input("Grup 2", "70, 72, 68, 71, 69", "w2")
+    long_groups = get_long_format_groups("welch")
+    if long_groups:
+        d1, d2 = long_groups
     
     alpha = st.number_input("Alpha", 0.05, key='a_welch')
     jenis_uji = st.selectbox("Jenis Uji", ["Two-sided", "Right-sided", "Left-sided"], key='t_welch')
+    rs_opts = resampling_options("welch")
 
-    if st.button("Hitung Welch t-Test"):
+    if run_button("Hitung Welch t-Test", "run_w", watch=("w1", "w2")):
         if d1 is not None and d2 is not None:
             render_hypotheses("Welch t-Test", r"\mu_1 - \mu_2", "0", jenis_uji)
 
-            n1, n2 = len(d1), len(d2)
-            v1, v2 = np.var(d1, ddof=1), np.var(d2, ddof=1)
-            se = np.sqrt(v1/n1 + v2/n2)
-            t_stat = (np.mean(d1) - np.mean(d2)) / se
-            
-            num = (v1/n1 + v2/n2)**2
-            den = ((v1/n1)**2 / (n1-1)) + ((v2/n2)**2 / (n2-1))
-            df = num / den
-            
-            if "Two" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha/2, df)
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-                reject = abs(t_stat) > t_crit
-            elif "Right" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha, df)
-                p_val = 1 - stats.t.cdf(t_stat, df)
-                reject = t_stat > t_crit
-            else:
-                t_crit = stats.t.ppf(alpha, df)
-                p_val = stats.t.cdf(t_stat, df)
-                reject = t_stat < t_crit
+            m1, m2 = summarize(d1), summarize(d2)
+            res = engine.welch_t_test(m1, m2, alpha, jenis_uji)
             
-            st.info(f"Selisih Mean: {np.mean(d1)-np.mean(d2):.4f} | df: {df:.2f}")
-            display_test_result(t_stat, t_crit, p_val, alpha, jenis_uji, 't', reject, 't', df1=df)
+            st.info(f"Selisih Mean: {m1.mean-m2.mean:.4f} | df: {res.df1:.2f}")
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 't', res.reject, 't', df1=res.df1, title=title, watch=("w1", "w2"))
+            show_resampling(lambda a, b, **kw: resampling.two_sample_test(a, b, statistic="welch", jenis_uji=jenis_uji, **kw),
+                            d1, d2, rs_opts, alpha)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def pair_by_id(src1, src2, id_col1, val_col1, id_col2, val_col2, presorted, mtimes=None):
+    """Join dua file menurut ID; src berupa bytes (upload) atau path lokal. `mtimes` hanya kunci cache."""
+    import io
+
+    if isinstance(src1, bytes):
+        src1, src2 = io.BytesIO(src1), io.BytesIO(src2)
+    join = pairing.merge_join_moments if presorted else pairing.hash_join_moments
+    return join(src1, src2, id_col1, val_col1, id_col2, val_col2)
+
+
+def get_id_pairing(key_suffix):
+    """
+    Input paired berdasarkan kolom ID (dua file CSV, urutan/jumlah baris boleh berbeda).
+    Mengembalikan PairResult atau None.
+    """
+    import io
+    import pandas as pd
+
+    with st.expander("🔑 Pasangkan Berdasarkan ID (Pre/Post dari Dua File)", expanded=False):
+        sources = ["Upload CSV"] + (["Path file lokal"] if local_data_dir() else [])
+        source = st.radio("Sumber", sources, horizontal=True, key=f"idsrc_{key_suffix}")
+        c1, c2 = st.columns(2)
+        if source == "Upload CSV":
+            up1 = c1.file_uploader("File Pre", type=['csv'], key=f"idup1_{key_suffix}")
+            up2 = c2.file_uploader("File Post", type=['csv'], key=f"idup2_{key_suffix}")
+            if up1 is None or up2 is None:
+                return None
+            src1, src2, mtimes = up1.getvalue(), up2.getvalue(), None
+            heads = [pd.read_csv(io.BytesIO(b), nrows=1000) for b in (src1, src2)]
+        else:
+            src1 = c1.text_input("Path file Pre", key=f"idpath1_{key_suffix}")
+            src2 = c2.text_input("Path file Post", key=f"idpath2_{key_suffix}")
+            if not src1 or not src2:
+                return None
+            try:
+                src1, src2 = resolve_local_path(src1), resolve_local_path(src2)
+                mtimes = (os.path.getmtime(src1), os.path.getmtime(src2))
+                heads = [pd.read_csv(p, nrows=1000) for p in (src1, src2)]
+            except Exception as e:
+                st.error(f"Gagal membaca file: {e}")
+                return None
+
+        cols = []
+        for c, head, label, i in zip((c1, c2), heads, ("Pre", "Post"), (1, 2)):
+            id_col = c.selectbox(f"Kolom ID ({label})", list(head.columns), key=f"idcol{i}_{key_suffix}")
+            val_col = c.selectbox(f"Kolom Nilai ({label})", [x for x in ingest.numeric_columns(head) if x != id_col],
+                                  key=f"idval{i}_{key_suffix}")
+            cols += [id_col, val_col]
+        if None in cols:
+            st.error("Setiap file membutuhkan kolom ID dan satu kolom angka.")
+            return None
+        presorted = st.checkbox("File sudah terurut menurut ID (sorted-merge join, tanpa file sementara)",
+                                key=f"idsorted_{key_suffix}")
+
+        try:
+            with st.spinner("Memasangkan data berdasarkan ID..."):
+                res = pair_by_id(src1, src2, *cols, presorted, mtimes)
+        except Exception as e:
+            st.error(f"Gagal memasangkan data: {e}")
+            return None
+
+        st.success(f"✅ {res.n_matched:,} pasangan cocok.")
+        st.caption(f"Tanpa pasangan: {res.unmatched_1:,} ID hanya di Pre, {res.unmatched_2:,} ID hanya di Post. "
+                   f"Duplikat diabaikan: {res.duplicates_1:,} (Pre), {res.duplicates_2:,} (Post). "
+                   f"Baris kosong dibuang: {res.dropped:,}.")
+        if res.n_matched < 2:
+            st.error("Dibutuhkan minimal 2 pasangan yang cocok.")
+            return None
+        return res
 
 
 def load_paired_t_test(title):
@@ -649,40 +1024,40 @@ def load_paired_t_test(title):
         st.latex(r"t_{STAT} = \frac{\bar{D} - \mu_D}{S_D / \sqrt{n}}")
     
     c1, c2 = st.columns(2)
-    with c1: d1 = get_data_input("Sebelum (Pre)", "50, 60, 70", "pair1")
-    with c2: d2 = get_data_input("Sesudah (Post)", "60, 65, 75", "pair2")
+    with c1: d1 = get_data_input("Sebelum (Pre)", "50, 60, 70", "pair1", allow_stream=False)
+    with c2: d2 = get_data_input("Sesudah (Post)", "60, 65, 75", "pair2", allow_stream=False)
+    paired = get_id_pairing("pair")
+    with st.expander("📊 Tabel Frekuensi Selisih (D = Pre - Post, frekuensi)", expanded=False):
+        diff_freq = frequency_table_input("pairdiff")
     
     alpha = st.number_input("Alpha", 0.05, key='a_pair')
     jenis_uji = st.selectbox("Jenis Uji", ["Two-sided", "Right-sided", "Left-sided"], key='t_pair')
+    rs_opts = resampling_options("pair")
 
     if st.button("Hitung Paired t"):
-        if d1 is not None and d2 is not None and len(d1) == len(d2):
+        if paired is not None or diff_freq is not None:
+            diff_m = paired.moments if paired is not None else diff_freq
+            source = f"{paired.n_matched:,} pasangan berdasarkan ID" if paired is not None else "tabel frekuensi selisih"
+            render_hypotheses("Paired t-Test", r"\mu_D", "0", jenis_uji)
+            check_normality(diff_m, "Selisih Data (Diff)")
+            res = engine.t_test_1(diff_m, 0, alpha, jenis_uji)
+            st.info(f"Rata-rata Selisih: {diff_m.mean:.4f} (n={int(diff_m.n):,}, {source})")
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 't', res.reject, 't', df1=res.df1, title=title)
+            if rs_opts is not None:
+                st.warning("⚠️ Resampling membutuhkan data mentah; dilewati untuk data teragregasi.")
+        elif d1 is not None and d2 is not None and len(d1) == len(d2):
             render_hypotheses("Paired t-Test", r"\mu_D", "0", jenis_uji)
 
             diff = d1 - d2
             check_normality(diff, "Selisih Data (Diff)")
             
-            n = len(diff)
             d_bar = np.mean(diff)
-            sd = np.std(diff, ddof=1)
-            t_stat = d_bar / (sd / np.sqrt(n))
-            df = n - 1
-            
-            if "Two" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha/2, df)
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-                reject = abs(t_stat) > t_crit
-            elif "Right" in jenis_uji:
-                t_crit = stats.t.ppf(1 - alpha, df)
-                p_val = 1 - stats.t.cdf(t_stat, df)
-                reject = t_stat > t_crit
-            else:
-                t_crit = stats.t.ppf(alpha, df)
-                p_val = stats.t.cdf(t_stat, df)
-                reject = t_stat < t_crit
+            res = engine.paired_t_test(d1, d2, alpha, jenis_uji)
                 
             st.info(f"Rata-rata Selisih: {d_bar:.4f}")
-            display_test_result(t_stat, t_crit, p_val, alpha, jenis_uji, 't', reject, 't', df1=df)
+            display_test_result(res.stat, res.crit, res.p_val, alpha, jenis_uji, 't', res.reject, 't', df1=res.df1, title=title)
+            show_resampling(lambda a, b, **kw: resampling.paired_test(a, b, jenis_uji=jenis_uji, **kw),
+                            d1, d2, rs_opts, alpha)
         else:
             st.error("Jumlah data harus sama.")
 
@@ -700,28 +1075,295 @@ def load_f_test(title):
     c1, c2 = st.columns(2)
     with c1: d1 = get_data_input("Grup 1", "7, 9, 12, 10, 8", "f1")
     with c2: d2 = get_data_input("Grup 2", "8, 8, 9, 7, 8", "f2")
+    long_groups = get_long_format_groups("f")
+    if long_groups:
+        d1, d2 = long_groups
     
     alpha = st.number_input("Alpha", 0.05, key='a_f')
     
-    if st.button("Hitung F-Test"):
+    if run_button("Hitung F-Test", "run_f", watch=("f1", "f2")):
         if d1 is not None and d2 is not None:
             st.markdown("### 1. Hipotesis Statistik")
             st.latex(r"H_0: \sigma_1^2 = \sigma_2^2")
             st.latex(r"H_1: \sigma_1^2 \neq \sigma_2^2")
 
-            v1, v2 = np.var(d1, ddof=1), np.var(d2, ddof=1)
-            n1, n2 = len(d1), len(d2)
+            res = engine.f_test(summarize(d1), summarize(d2), alpha)
             
-            if v1 >= v2:
-                f_stat = v1 / v2
-                df1, df2 = n1 - 1, n2 - 1
+            st.info(f"Rasio Varians (F): {res.stat:.4f}")
+            display_test_result(res.stat, res.crit, res.p_val, alpha, "Two-sided", 'F', res.reject, 'f', df1=res.df1, df2=res.df2, title=title, watch=("f1", "f2"))
+
+
+POWER_TESTS = {
+    "Uji Rata-rata 1 Sampel (Z-test)": ("z", "Effect size d = (μ - μ₀)/σ", 0.1, 0.8),
+    "Uji Rata-rata 1 Sampel (t-test)": ("t", "Effect size d = (μ - μ₀)/σ", 0.1, 0.8),
+    "Uji Rata-rata 2 Sampel Independen (Pooled t-test)": ("pooled", "Effect size d = (μ₁ - μ₂)/σ", 0.2, 1.0),
+    "Uji Rata-rata 2 Sampel Independen (Welch t-test)": ("welch", "Effect size d = (μ₁ - μ₂)/σ₁", 0.2, 1.0),
+    "Uji Rata-rata 2 Sampel Dependen (Paired t-test)": ("paired", "Effect size d = μ_D/σ_D", 0.1, 0.8),
+    "Uji Kesamaan Varians (F-test)": ("f", "Rasio varians σ₁²/σ₂²", 1.5, 4.0),
+    "Uji Proporsi 1 Sampel": ("proportion_1", "Selisih proporsi π₁ - π₀", 0.05, 0.2),
+    "Uji Proporsi 2 Sampel": ("proportion_2", "Selisih proporsi π₁ - π₂", 0.05, 0.2),
+}
+
+
+def load_power_analysis(title):
+    import pandas as pd
+    import power
+
+    st.header(title)
+    with st.expander("📘 Penjelasan", expanded=False):
+        st.write("""
+        **Power** adalah peluang menolak H0 ketika H1 benar. Halaman ini memakai rumus uji yang sama
+        dengan halaman-halaman uji: rumus tertutup (normal, t non-sentral, F) bila tersedia, dan
+        simulasi Monte Carlo untuk Welch t-Test.
+        """)
+
+    test_label = st.selectbox("Uji", list(POWER_TESTS), key="pw_test")
+    test, effect_label, e_lo, e_hi = POWER_TESTS[test_label]
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        effects = st.slider(effect_label, 0.01 if test != "f" else 1.01, 1.0 if "proportion" in test else 5.0,
+                            (e_lo, e_hi), key="pw_effect")
+        n_effects = st.number_input("Jumlah kurva effect", 1, 10, 4, key="pw_ne")
+    with c2:
+        n_range = st.slider("Rentang n (grup 1)", 2, 2000, (5, 200), key="pw_n")
+        alphas = st.multiselect("Alpha", list(critical_values.COMMON_ALPHAS), [0.05], key="pw_alpha")
+    with c3:
+        jenis_uji = "Two-sided" if test == "f" else st.selectbox("Jenis Uji", ["Two-sided", "Right-sided", "Left-sided"], key="pw_tail")
+        extra = {}
+        if test in ("pooled", "welch", "f", "proportion_2"):
+            extra["ratio"] = st.number_input("Rasio n₂/n₁", 0.1, 10.0, 1.0, key="pw_ratio")
+        if test == "welch":
+            extra["sd_ratio"] = st.number_input("Rasio σ₂/σ₁", 0.1, 10.0, 1.5, key="pw_sd")
+            extra.update(n_sims=st.number_input("Jumlah simulasi per titik", 500, 100_000, 2000, step=500, key="pw_sims"),
+                         seed=2024, workers=os.cpu_count() or 1)
+        if "proportion" in test:
+            extra["p0"] = st.number_input("Proporsi dasar (π₀ / π₂)", 0.01, 0.99, 0.5, key="pw_p0")
+
+    if st.button("📈 Hitung Kurva Power", type="primary") and alphas:
+        effect_grid = np.round(np.linspace(effects[0], effects[1], int(n_effects)), 4)
+        n_grid = np.unique(np.linspace(n_range[0], n_range[1], 60).round().astype(int))
+        with st.spinner("Menghitung grid power..."):
+            grid = power.power_grid(test, effect_grid, n_grid, alphas, jenis_uji, **extra)
+
+        table = pd.DataFrame(
+            [(e, n, a, grid[i, j, k]) for i, e in enumerate(effect_grid)
+             for j, n in enumerate(n_grid) for k, a in enumerate(alphas)],
+            columns=["effect", "n", "alpha", "power"],
+        )
+        for a in alphas:
+            st.markdown(f"**Kurva Power (α = {a})**")
+            st.line_chart(table[table.alpha == a].pivot(index="n", columns="effect", values="power"))
+        st.download_button("⬇️ Unduh grid (CSV)", table.to_csv(index=False), "power_grid.csv", "text/csv")
+
+    st.markdown("### 🎯 Ukuran Sampel Minimum")
+    c1, c2, c3 = st.columns(3)
+    effect = c1.number_input("Effect size target", value=float(e_lo + e_hi) / 2, key="pw_ss_effect")
+    target = c2.number_input("Power target", 0.5, 0.99, 0.8, key="pw_ss_target")
+    alpha = c3.number_input("Alpha", 0.001, 0.2, 0.05, key="pw_ss_alpha")
+    if st.button("Hitung Ukuran Sampel"):
+        n = power.sample_size(test, effect, target, alpha, jenis_uji, **extra)
+        if n is None:
+            st.error("Power target tidak tercapai pada n yang masuk akal.")
+        elif "ratio" in extra:
+            st.success(f"**n₁ = {n}**, n₂ = {int(max(round(n * extra['ratio']), 2))}")
+        else:
+            st.success(f"**n = {n}**")
+
+
+PAIRWISE_TESTS = {"Welch t-Test": "welch", "Pooled t-Test": "pooled", "F-Test (Varians)": "f"}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def read_all_columns(file_bytes, name, stream):
+    """Moments semua kolom angka dalam satu kali baca."""
+    import io
+    import pandas as pd
+
+    buf = io.BytesIO(file_bytes)
+    if stream and name.endswith('.csv'):
+        return ingest.stream_csv_columns_moments(buf)
+    if name.endswith('.csv'):
+        df = pd.read_csv(buf)
+    elif name.endswith('.parquet'):
+        df = pd.read_parquet(buf)
+    else:
+        df = pd.read_excel(buf)
+    return ingest.frame_moments(df)
+
+
+def pairwise_heatmap(table, value, title):
+    return {
+        "title": title,
+        "width": "container",
+        "height": {"step": 14} if table["Kolom 1"].nunique() <= 40 else 560,
+        "data": {"values": table.to_dict("records")},
+        "mark": "rect",
+        "encoding": {
+            "x": {"field": "Kolom 2", "type": "nominal", "sort": None, "axis": {"labelLimit": 80}},
+            "y": {"field": "Kolom 1", "type": "nominal", "sort": None, "axis": {"labelLimit": 80}},
+            "color": {"field": value, "type": "quantitative", "scale": {"scheme": "orangered"}},
+            "tooltip": [{"field": c} for c in table.columns],
+        },
+    }
+
+
+def load_compare_all(title):
+    import pandas as pd
+
+    st.header(title)
+    with st.expander("📘 Penjelasan", expanded=False):
+        st.write("""
+        Membandingkan **setiap pasangan kolom angka** dalam satu file. Statistik cukup semua kolom dihitung
+        dalam satu kali baca, lalu seluruh matriks uji (Welch, Pooled, atau F) dihitung sekaligus.
+        Warna heat map menunjukkan -log10(p-value): semakin gelap, semakin signifikan.
+        """)
+
+    uploaded = st.file_uploader("Upload CSV/Excel/Parquet", type=['csv', 'xlsx', 'xls', 'parquet'], key="up_all")
+    stream = st.checkbox("⚡ Mode streaming (CSV besar)", key="stream_all")
+    if uploaded is None:
+        return
+
+    try:
+        m_all, all_cols = read_all_columns(uploaded.getvalue(), uploaded.name, stream)
+    except Exception as e:
+        st.error(f"Gagal membaca file: {e}")
+        return
+    if not all_cols:
+        st.error("File tidak memiliki kolom angka.")
+        return
+
+    columns = st.multiselect("Kolom yang dibandingkan", all_cols, default=all_cols, key="cols_all")
+    c1, c2, c3, c4 = st.columns(4)
+    test_label = c1.selectbox("Uji", list(PAIRWISE_TESTS), key="test_all")
+    alpha = c2.number_input("Alpha", 0.001, 0.20, 0.05, key="a_all")
+    jenis_uji = c3.selectbox("Jenis Uji", ["Two-sided", "Right-sided", "Left-sided"], key="t_all",
+                             disabled=PAIRWISE_TESTS[test_label] == "f")
+    correction = c4.selectbox("Koreksi", ["(tanpa)"] + list(multitest.METHODS),
+                              format_func=lambda k: multitest.METHODS.get(k, k), key="mt_all")
+
+    if st.button("🔁 Bandingkan Semua Pasangan", type="primary") and len(columns) >= 2:
+        idx = [all_cols.index(c) for c in columns]
+        m = moments.take(m_all, idx)
+        test = PAIRWISE_TESTS[test_label]
+        tail = "two" if test == "f" else engine.tail_of(jenis_uji)
+        res = engine.pairwise_tests(m, alpha, jenis_uji, test)
+
+        st.markdown("### Ringkasan Kolom")
+        st.dataframe(pd.DataFrame({"Kolom": columns, "N": m.n, "Mean": m.mean, "Std.Dev": moments.std(m)}))
+
+        i, j = np.triu_indices(len(columns), k=1)
+        dist = "f" if test == "f" else "t"
+        df1 = np.broadcast_to(res.df1, res.stat.shape)[i, j]
+        df2 = None if res.df2 is None else np.broadcast_to(res.df2, res.stat.shape)[i, j]
+        log_p = critical_values.log_p_value(dist, res.stat[i, j], tail, df1, df2)
+        table = pd.DataFrame({
+            "Kolom 1": np.asarray(columns)[i], "Kolom 2": np.asarray(columns)[j],
+            "Statistik": res.stat[i, j], "df1": df1, "P-Value": res.p_val[i, j],
+            "-log10(p)": -np.atleast_1d(log_p) / np.log(10), "Tolak H0": res.reject[i, j],
+        })
+        if df2 is not None:
+            table.insert(4, "df2", df2)
+        if correction != "(tanpa)":
+            reject, p_adj = multitest.decide(table["P-Value"].to_numpy(), alpha, correction)
+            table["P-Value Terkoreksi"] = p_adj
+            table["Tolak H0 (Terkoreksi)"] = reject
+
+        n_reject = int(table.iloc[:, -1].sum())
+        st.info(f"{len(table):,} pasangan diuji; {n_reject:,} menolak H0.")
+        st.vega_lite_chart(pairwise_heatmap(table[["Kolom 1", "Kolom 2", "-log10(p)", "P-Value"]],
+                                            "-log10(p)", f"Matriks {test_label}"))
+        st.download_button("⬇️ Unduh tabel pasangan (CSV)", table.to_csv(index=False),
+                           "pairwise.csv", "text/csv")
+
+
+POST_HOC_METHODS = {"Tukey-HSD (varians sama)": "tukey", "Games-Howell (varians tidak sama)": "games_howell"}
+
+
+def load_anova(title):
+    import io
+    import pandas as pd
+
+    st.header(title)
+    with st.expander("📘 Penjelasan", expanded=False):
+        st.write("""
+        **ANOVA satu arah** menguji apakah rata-rata k grup sama (H0: μ1 = μ2 = ... = μk).
+        Bila H0 ditolak, uji **post-hoc** menunjukkan pasangan grup mana yang berbeda:
+        **Tukey-HSD** mengasumsikan varians sama, **Games-Howell** tidak.
+        Semua pasangan dihitung sekaligus dari statistik cukup per grup (n, mean, varians).
+        """)
+
+    uploaded = st.file_uploader("Upload CSV/Excel/Parquet", type=['csv', 'xlsx', 'xls', 'parquet'], key="up_anova")
+    layout = st.radio("Format data", ["Format panjang (kolom grup + kolom nilai)", "Setiap kolom angka = satu grup"],
+                      key="fmt_anova", horizontal=True)
+    if uploaded is None:
+        return
+
+    try:
+        if layout.startswith("Format panjang"):
+            buf = io.BytesIO(uploaded.getvalue())
+            if uploaded.name.endswith('.csv'):
+                head = pd.read_csv(buf, nrows=1000)
+            elif uploaded.name.endswith('.parquet'):
+                head = pd.read_parquet(buf)
             else:
-                f_stat = v2 / v1
-                df1, df2 = n2 - 1, n1 - 1
-            
-            f_crit = stats.f.ppf(1 - alpha/2, df1, df2)
-            p_val = 2 * (1 - stats.f.cdf(f_stat, df1, df2))
-            reject = f_stat > f_crit
-            
-            st.info(f"Rasio Varians (F): {f_stat:.4f}")
-            display_test_result(f_stat, f_crit, p_val, alpha, "Two-sided", 'F', reject, 'f', df1=df1, df2=df2)
+                head = pd.read_excel(buf, nrows=1000)
+            c1, c2 = st.columns(2)
+            value_col = c1.selectbox("Kolom Nilai", ingest.numeric_columns(head), key="aval_anova")
+            group_col = c2.selectbox("Kolom Grup", [c for c in head.columns if c != value_col], key="agrp_anova")
+            if value_col is None or group_col is None:
+                st.error("File membutuhkan satu kolom angka dan satu kolom grup.")
+                return
+            m, labels = read_group_moments(uploaded.getvalue(), uploaded.name, value_col, group_col)
+        else:
+            m, labels = read_all_columns(uploaded.getvalue(), uploaded.name, False)
+    except Exception as e:
+        st.error(f"Gagal membaca file: {e}")
+        return
+
+    labels = [str(g) for g in labels]
+    if len(labels) < 2:
+        st.error("Dibutuhkan minimal 2 grup.")
+        return
+    if np.any(np.asarray(m.n) < 2):
+        st.error("Setiap grup membutuhkan minimal 2 observasi.")
+        return
+
+    c1, c2 = st.columns(2)
+    alpha = c1.number_input("Alpha", 0.001, 0.20, 0.05, key="a_anova")
+    method_label = c2.selectbox("Uji Post-hoc", list(POST_HOC_METHODS), key="ph_anova")
+
+    if st.button("🚀 Jalankan ANOVA", type="primary"):
+        res = anova.one_way_from_moments(m, alpha)
+
+        st.markdown("### Ringkasan Grup")
+        st.dataframe(pd.DataFrame({"Grup": labels, "N": m.n, "Mean": m.mean, "Std.Dev": moments.std(m)}))
+
+        st.markdown("### Tabel ANOVA")
+        st.table(pd.DataFrame({
+            "SS": [res.ss_between, res.ss_within, res.ss_between + res.ss_within],
+            "df": [res.df1, res.df2, res.df1 + res.df2],
+            "MS": [res.ms_between, res.ms_within, None],
+            "F": [res.stat, None, None],
+        }, index=["Antar Grup", "Dalam Grup", "Total"]))
+        display_test_result(res.stat, res.crit, res.p_val, alpha, "Right-sided", 'F', res.reject,
+                            'f', res.df1, res.df2, title=title)
+
+        ph = anova.post_hoc(m, alpha, POST_HOC_METHODS[method_label])
+        i, j = np.triu_indices(len(labels), k=1)
+        crit = np.broadcast_to(ph.crit, ph.q.shape)[i, j]
+        df = np.broadcast_to(ph.df, ph.q.shape)[i, j]
+        table = pd.DataFrame({
+            "Grup 1": np.asarray(labels)[i], "Grup 2": np.asarray(labels)[j],
+            "Selisih Mean": ph.diff[i, j], "SE": ph.se[i, j], "q": ph.q[i, j], "df": df,
+            "q Kritis": crit, "P-Value": ph.p_val[i, j], "Tolak H0": ph.reject[i, j],
+        })
+        st.markdown(f"### Post-hoc: {method_label}")
+        st.info(f"{len(table):,} pasangan diuji; {int(table['Tolak H0'].sum()):,} berbeda signifikan.")
+        st.dataframe(table[table["Tolak H0"]].sort_values("P-Value").head(1000))
+        if len(labels) <= 200:
+            table["-log10(p)"] = -np.log10(np.maximum(table["P-Value"], 1e-300))
+            heat = table.rename(columns={"Grup 1": "Kolom 1", "Grup 2": "Kolom 2"})
+            st.vega_lite_chart(pairwise_heatmap(heat[["Kolom 1", "Kolom 2", "-log10(p)", "P-Value"]],
+                                                "-log10(p)", f"Matriks {method_label}"))
+        st.download_button("⬇️ Unduh tabel post-hoc (CSV)", table.to_csv(index=False), "posthoc.csv", "text/csv")
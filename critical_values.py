@@ -0,0 +1,245 @@
+# critical_values.py
+"""
+Layanan lookup critical value dan p-value untuk distribusi Z, t dan F.
+
+- Critical value skalar dimemoisasi (lru_cache) per kombinasi (alpha, arah, df).
+- Tabel opsional (precompute) untuk alpha umum dan df bulat dipakai lebih
+  dulu bila tersedia.
+- Input array dihitung tervektorisasi; kombinasi (alpha, df) yang sama
+  hanya dihitung sekali.
+
+Arah uji: 'two' / 'right' / 'left' (lihat engine.tail_of). Untuk 'two',
+critical value yang dikembalikan adalah kuantil atas 1 - alpha/2.
+
+P-value dihitung dari survival function (sf), bukan 1 - cdf, sehingga
+tidak runtuh ke 0 di sekitar 1e-16. log_p_value memberi log p-value yang
+tetap hingga jauh di bawah batas float64 (ekor t dan F lewat pecahan
+berlanjut fungsi beta tak lengkap, juga untuk df besar).
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy import special, stats
+
+
+COMMON_ALPHAS = (0.001, 0.01, 0.025, 0.05, 0.10)
+
+_UNIQUE_PROBE = 1024
+_LOG_TINY = -690.0  # ~log(1e-300); di bawahnya sf scipy mulai underflow
+
+_DISTS = {"normal": stats.norm, "t": stats.t, "f": stats.f}
+_tables = {}
+
+
+def _level(alpha, tail):
+    if tail == "two":
+        return 1 - alpha/2
+    if tail == "right":
+        return 1 - alpha
+    return alpha
+
+
+def _args(dist, df1, df2):
+    if dist == "normal":
+        return ()
+    if dist == "t":
+        return (df1,)
+    return (df1, df2)
+
+
+def precompute(alphas=COMMON_ALPHAS, max_df_t=1000, max_df_f=120):
+    """Membangun tabel critical value t (df 1..max_df_t) dan F (df1, df2 1..max_df_f)."""
+    df_t = np.arange(1, max_df_t + 1)
+    df_f = np.arange(1, max_df_f + 1)
+    for alpha in alphas:
+        for tail in ("two", "right", "left"):
+            q = _level(alpha, tail)
+            _tables[("t", float(alpha), tail)] = stats.t.ppf(q, df_t)
+            _tables[("f", float(alpha), tail)] = stats.f.ppf(q, df_f[:, None], df_f[None, :])
+
+
+def clear():
+    _tables.clear()
+    _critical_scalar.cache_clear()
+
+
+def _table_lookup(dist, alpha, tail, df1, df2):
+    table = _tables.get((dist, alpha, tail))
+    if table is None:
+        return None
+    dfs = (df1,) if dist == "t" else (df1, df2)
+    if not all(float(d).is_integer() and 1 <= d <= table.shape[0] for d in dfs):
+        return None
+    return float(table[tuple(int(d) - 1 for d in dfs)])
+
+
+@lru_cache(maxsize=8192)
+def _critical_scalar(dist, alpha, tail, df1, df2):
+    if dist == "normal":
+        return float(stats.norm.ppf(_level(alpha, tail)))
+    value = _table_lookup(dist, alpha, tail, df1, df2)
+    if value is None:
+        value = float(_DISTS[dist].ppf(_level(alpha, tail), *_args(dist, df1, df2)))
+    return value
+
+
+def _unique_apply(func, *arrays):
+    """Menerapkan func hanya pada kombinasi unik dari array-array yang di-broadcast."""
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in arrays))
+    shape = arrays[0].shape
+    flat = np.stack([a.ravel() for a in arrays], axis=-1)
+    if len(flat) > _UNIQUE_PROBE:
+        # df kontinu (mis. Welch hasil simulasi) hampir selalu unik; sort tidak sepadan.
+        probe = flat[:: len(flat) // _UNIQUE_PROBE][:_UNIQUE_PROBE]
+        if len(np.unique(probe, axis=0)) > 0.9 * len(probe):
+            return np.asarray(func(*flat.T)).reshape(shape)
+    uniq, inverse = np.unique(flat, axis=0, return_inverse=True)
+    values = func(*uniq.T)
+    return np.asarray(values)[inverse.ravel()].reshape(shape)
+
+
+def critical_value(dist, alpha, tail, df1=None, df2=None):
+    """Critical value untuk dist 'normal' / 't' / 'f'; alpha dan df boleh berupa array."""
+    if np.ndim(alpha) == 0 and np.ndim(df1) == 0 and np.ndim(df2) == 0:
+        return _critical_scalar(dist, float(alpha), tail,
+                                None if df1 is None else float(df1),
+                                None if df2 is None else float(df2))
+
+    def compute(alpha, df1=None, df2=None):
+        return _DISTS[dist].ppf(_level(alpha, tail), *_args(dist, df1, df2))
+
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (alpha, df1, df2) if x is not None))
+    values = np.empty(arrays[0].shape)
+    todo = np.ones(values.shape, dtype=bool)
+
+    if dist != "normal":
+        for a in np.unique(arrays[0]):
+            table = _tables.get((dist, float(a), tail))
+            if table is None:
+                continue
+            hit = arrays[0] == a
+            for d in arrays[1:]:
+                hit &= (d == np.round(d)) & (d >= 1) & (d <= table.shape[0])
+            values[hit] = table[tuple(d[hit].astype(int) - 1 for d in arrays[1:])]
+            todo &= ~hit
+
+    if todo.any():
+        values[todo] = _unique_apply(compute, *(a[todo] for a in arrays))
+    return values
+
+
+_CF_MAX_ITER = 5000
+_CF_EPS = 1e-15
+_CF_TINY = 1e-300
+
+
+def _beta_cf(x, a, b):
+    """Pecahan berlanjut Lentz untuk I_x(a, b) (Numerical Recipes betacf), tervektorisasi; NaN bila tidak konvergen."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 - qab * x / qap
+    d = 1.0 / np.where(np.abs(d) < _CF_TINY, _CF_TINY, d)
+    h = d.copy()
+    done = np.zeros(x.shape, dtype=bool)
+    for m in range(1, _CF_MAX_ITER + 1):
+        m2 = 2.0 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                   -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1.0 + aa * d
+            d = 1.0 / np.where(np.abs(d) < _CF_TINY, _CF_TINY, d)
+            c = 1.0 + aa / c
+            c = np.where(np.abs(c) < _CF_TINY, _CF_TINY, c)
+            delta = np.where(done, 1.0, d * c)
+            h = h * delta
+        done |= np.abs(delta - 1.0) < _CF_EPS
+        if done.all():
+            break
+    return np.where(done, h, np.nan)
+
+
+def _log_beta_tail(x, a, b):
+    """
+    log I_x(a, b) untuk x di bawah rata-rata beta: x^a (1-x)^b / (a B(a,b)) * cf.
+    Pecahan berlanjut tetap stabil untuk a + b besar, tempat hyp2f1 overflow.
+    """
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        return (a*np.log(x) + b*np.log1p(-x) - np.log(a) - special.betaln(a, b)
+                + np.log(_beta_cf(x, a, b)))
+
+
+def _log_sf_asymptotic(dist, stat, df1, df2):
+    """Cadangan bila pecahan berlanjut gagal: ekor normal dari transformasi Wallace (t) / Wilson-Hilferty (F)."""
+    if dist == "t":
+        z = np.sqrt(df1 * np.log1p(stat*stat / df1)) * (1 - 1 / (8 * df1)) / (1 + 1 / (8 * df1))
+    else:
+        c = np.cbrt(stat)
+        z = ((1 - 2/(9*df2)) * c - (1 - 2/(9*df1))) / np.sqrt(2/(9*df1) + 2/(9*df2) * c*c)
+    return stats.norm.logsf(z)
+
+
+def _log_sf(dist, stat, df1=None, df2=None):
+    """log P(X > stat), tervektorisasi."""
+    if dist == "normal":
+        return stats.norm.logsf(stat)
+    stat, df1, df2 = np.broadcast_arrays(np.asarray(stat, dtype=float), np.asarray(df1, dtype=float),
+                                         np.asarray(1.0 if df2 is None else df2, dtype=float))
+    # stats.f.logsf lewat jalur generik (~10x lebih lambat) dengan hasil yang sama dengan log(sf).
+    # Keduanya -inf begitu sf underflow; ekor itu dihitung ulang di bawah.
+    with np.errstate(divide="ignore"):
+        out = np.array(stats.t.logsf(stat, df1) if dist == "t" else np.log(stats.f.sf(stat, df1, df2)), dtype=float)
+    deep = ~np.isnan(stat) & ~(out >= _LOG_TINY)
+    if deep.any():
+        s, d1, d2 = stat[deep], df1[deep], df2[deep]
+        if dist == "t":
+            # sf(t; v) = I_x(v/2, 1/2) / 2, x = v / (v + t^2), untuk t > 0
+            tail = np.log(0.5) + _log_beta_tail(d1 / (d1 + s*s), d1/2, 0.5)
+        else:
+            # sf(f; d1, d2) = I_x(d2/2, d1/2), x = d2 / (d2 + d1 f)
+            tail = _log_beta_tail(d2 / (d2 + d1*s), d2/2, d1/2)
+        bad = ~np.isfinite(tail)
+        if bad.any():
+            tail[bad] = _log_sf_asymptotic(dist, s[bad], d1[bad], d2[bad])
+        out[deep] = tail
+    return out
+
+
+def _mirror(dist, stat):
+    """Statistik cermin: P(X < stat) = P(X' > mirror) (F: df ikut ditukar)."""
+    return 1 / stat if dist == "f" else -stat
+
+
+def log_p_value(dist, stat, tail, df1=None, df2=None):
+    """log natural p-value; tetap terhingga untuk statistik ekstrem (p jauh < 1e-308)."""
+    stat = np.asarray(stat, dtype=float)
+    if tail == "two":
+        if dist == "f":
+            return np.minimum(np.log(2) + _log_sf(dist, stat, df1, df2), 0.0)[()]
+        return (np.log(2) + _log_sf(dist, np.abs(stat), df1, df2))[()]
+    if tail == "right":
+        return _log_sf(dist, stat, df1, df2)[()]
+    if dist == "f":
+        return _log_sf(dist, _mirror(dist, stat), df2, df1)[()]
+    return _log_sf(dist, _mirror(dist, stat), df1, df2)[()]
+
+
+def _p_value_array(dist, stat, tail, df1=None, df2=None):
+    d = _DISTS[dist]
+    args = _args(dist, df1, df2)
+    stat = np.asarray(stat, dtype=float)
+    if tail == "two":
+        if dist == "f":
+            return np.minimum(2 * d.sf(stat, *args), 1.0)
+        return 2 * d.sf(np.abs(stat), *args)
+    if tail == "right":
+        return d.sf(stat, *args)
+    return d.cdf(stat, *args)
+
+
+def p_value(dist, stat, tail, df1=None, df2=None):
+    """
+    P-value statistik uji; untuk F dua arah memakai 2 x ekor atas (rasio
+    varians terbesar), maks. 1. Tidak dimemoisasi: statistik uji kontinu
+    hampir tidak pernah berulang. Input skalar menghasilkan float.
+    """
+    p = _p_value_array(dist, stat, tail, df1, df2)
+    return float(p) if np.ndim(p) == 0 else p
@@ -0,0 +1,199 @@
+# engine.py
+"""
+Mesin uji hipotesis tanpa UI (headless).
+
+Semua fungsi menerima array 1-D (satu eksperimen) atau 2-D (satu baris per
+eksperimen) dan menghitung seluruh baris dalam satu panggilan tervektorisasi.
+Baris dengan panjang berbeda dapat di-padding dengan NaN.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+import critical_values
+import moments
+
+
+TestResult = namedtuple(
+    "TestResult",
+    ["stat", "crit", "p_val", "reject", "df1", "df2", "se"],
+    defaults=(None, None, None),
+)
+
+
+def tail_of(jenis_uji):
+    """Normalisasi label 'Two-sided (Dua Arah)' dst. menjadi 'two' / 'right' / 'left'."""
+    d = jenis_uji.lower()
+    if "two" in d or "dua" in d:
+        return "two"
+    if "right" in d or "kanan" in d:
+        return "right"
+    return "left"
+
+
+def _scalar(x):
+    if x is None:
+        return None
+    return np.asarray(x)[()]
+
+
+def _result(stat, crit, p_val, reject, df1=None, df2=None, se=None):
+    return TestResult(_scalar(stat), _scalar(crit), _scalar(p_val), _scalar(reject),
+                      _scalar(df1), _scalar(df2), _scalar(se))
+
+
+def sample_moments(data):
+    """
+    Mengembalikan (n, mean, var ddof=1) per baris; NaN diabaikan.
+    `data` juga boleh berupa moments.Moments hasil pembacaan streaming.
+    """
+    if isinstance(data, moments.Moments):
+        return data.n, data.mean, moments.variance(data)
+    data = np.asarray(data, dtype=float)
+    if np.isnan(data).any():
+        n = np.sum(~np.isnan(data), axis=-1)
+        mean = np.nanmean(data, axis=-1)
+        var = np.nanvar(data, axis=-1, ddof=1)
+    else:
+        n = np.full(data.shape[:-1], data.shape[-1])
+        mean = np.mean(data, axis=-1)
+        var = np.var(data, axis=-1, ddof=1)
+    return n, mean, var
+
+
+def decide(stat, alpha, jenis_uji, dist="normal", df1=None, df2=None):
+    """Critical value, p-value dan keputusan untuk statistik Z atau t (lihat critical_values)."""
+    tail = tail_of(jenis_uji)
+    crit = critical_values.critical_value(dist, alpha, tail, df1, df2)
+    p_val = critical_values.p_value(dist, stat, tail, df1, df2)
+
+    if tail == "two":
+        reject = np.abs(stat) > crit
+    elif tail == "right":
+        reject = stat > crit
+    else:
+        reject = stat < crit
+    return crit, p_val, reject
+
+
+# --- Uji dari statistik cukup (n, mean, var) ---
+
+def z_test_from_moments(n, mean, mu0, sigma, alpha, jenis_uji):
+    se = sigma / np.sqrt(n)
+    z_score = (mean - mu0) / se
+    crit, p_val, reject = decide(z_score, alpha, jenis_uji, "normal")
+    return _result(z_score, crit, p_val, reject, se=se)
+
+
+def t_test_from_moments(n, mean, var, mu0, alpha, jenis_uji):
+    se = np.sqrt(var / n)
+    t_stat = (mean - mu0) / se
+    df = n - 1
+    crit, p_val, reject = decide(t_stat, alpha, jenis_uji, "t", df)
+    return _result(t_stat, crit, p_val, reject, df1=df, se=se)
+
+
+def pooled_t_test_from_moments(n1, mean1, var1, n2, mean2, var2, alpha, jenis_uji):
+    df = n1 + n2 - 2
+    sp2 = ((n1 - 1)*var1 + (n2 - 1)*var2) / df
+    se = np.sqrt(sp2 * (1/n1 + 1/n2))
+    t_stat = (mean1 - mean2) / se
+    crit, p_val, reject = decide(t_stat, alpha, jenis_uji, "t", df)
+    return _result(t_stat, crit, p_val, reject, df1=df, se=se)
+
+
+def welch_t_test_from_moments(n1, mean1, var1, n2, mean2, var2, alpha, jenis_uji):
+    a, b = var1/n1, var2/n2
+    se = np.sqrt(a + b)
+    t_stat = (mean1 - mean2) / se
+    df = (a + b)**2 / (a**2 / (n1 - 1) + b**2 / (n2 - 1))
+    crit, p_val, reject = decide(t_stat, alpha, jenis_uji, "t", df)
+    return _result(t_stat, crit, p_val, reject, df1=df, se=se)
+
+
+def f_test_from_moments(n1, var1, n2, var2, alpha):
+    """Uji F dua arah; varians yang lebih besar selalu di pembilang (Levine)."""
+    n1, var1, n2, var2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (n1, var1, n2, var2)))
+    swap = var1 < var2
+    f_stat = np.where(swap, var2 / var1, var1 / var2)
+    df1 = np.where(swap, n2 - 1, n1 - 1)
+    df2 = np.where(swap, n1 - 1, n2 - 1)
+    df1, df2, f_stat = df1[()], df2[()], f_stat[()]
+
+    crit = critical_values.critical_value("f", alpha, "two", df1, df2)
+    p_val = critical_values.p_value("f", f_stat, "two", df1, df2)
+    reject = f_stat > crit
+    return _result(f_stat, crit, p_val, reject, df1=np.asarray(df1).astype(int), df2=np.asarray(df2).astype(int))
+
+
+# --- Uji dari data mentah ---
+
+def z_test_1(data, mu0, sigma, alpha, jenis_uji):
+    n, mean, _ = sample_moments(data)
+    return z_test_from_moments(n, mean, mu0, sigma, alpha, jenis_uji)
+
+
+def t_test_1(data, mu0, alpha, jenis_uji):
+    n, mean, var = sample_moments(data)
+    return t_test_from_moments(n, mean, var, mu0, alpha, jenis_uji)
+
+
+def pooled_t_test(d1, d2, alpha, jenis_uji):
+    return pooled_t_test_from_moments(*sample_moments(d1), *sample_moments(d2), alpha, jenis_uji)
+
+
+def welch_t_test(d1, d2, alpha, jenis_uji):
+    return welch_t_test_from_moments(*sample_moments(d1), *sample_moments(d2), alpha, jenis_uji)
+
+
+def paired_t_test(d1, d2, alpha, jenis_uji):
+    diff = np.asarray(d1, dtype=float) - np.asarray(d2, dtype=float)
+    return t_test_1(diff, 0, alpha, jenis_uji)
+
+
+def f_test(d1, d2, alpha):
+    n1, _, var1 = sample_moments(d1)
+    n2, _, var2 = sample_moments(d2)
+    return f_test_from_moments(n1, var1, n2, var2, alpha)
+
+
+def proportion_test_1(x, n, pi0, alpha, jenis_uji):
+    x, n = np.asarray(x, dtype=float), np.asarray(n, dtype=float)
+    se = np.sqrt((pi0 * (1 - pi0)) / n)
+    z_score = (x / n - pi0) / se
+    crit, p_val, reject = decide(z_score, alpha, jenis_uji, "normal")
+    return _result(z_score, crit, p_val, reject, se=se)
+
+
+def proportion_test_2(x1, n1, x2, n2, alpha, jenis_uji):
+    x1, n1, x2, n2 = (np.asarray(v, dtype=float) for v in (x1, n1, x2, n2))
+    p_pool = (x1 + x2) / (n1 + n2)
+    se = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
+    z_score = (x1/n1 - x2/n2) / se
+    crit, p_val, reject = decide(z_score, alpha, jenis_uji, "normal")
+    return _result(z_score, crit, p_val, reject, se=se)
+
+
+def pairwise_tests(m, alpha, jenis_uji="Two-sided", test="welch"):
+    """
+    Matriks uji berpasangan antar kolom; `m` adalah Moments berisi array
+    (satu elemen per kolom). Setiap field hasil berbentuk (k, k), sel [i, j]
+    menguji kolom i terhadap kolom j. test = 'welch' / 'pooled' / 'f'.
+    """
+    n, mean, var = (np.asarray(v, dtype=float) for v in sample_moments(m))
+    row = (n[:, None], mean[:, None], var[:, None])
+    col = (n[None, :], mean[None, :], var[None, :])
+    if test == "welch":
+        return welch_t_test_from_moments(*row, *col, alpha, jenis_uji)
+    if test == "pooled":
+        return pooled_t_test_from_moments(*row, *col, alpha, jenis_uji)
+    if test == "f":
+        return f_test_from_moments(row[0], row[2], col[0], col[2], alpha)
+    raise ValueError(f"Uji berpasangan tidak dikenal: {test}")
+
+
+def cohens_d_from_moments(n1, mean1, var1, n2, mean2, var2):
+    s_pooled = np.sqrt(((n1 - 1)*var1 + (n2 - 1)*var2) / (n1 + n2 - 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d = np.where(s_pooled == 0, 0.0, (mean1 - mean2) / s_pooled)
+    return _scalar(d)
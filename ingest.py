@@ -0,0 +1,551 @@
+# ingest.py
+"""
+Pembacaan data input tanpa UI (headless).
+"""
+import io
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import moments
+
+
+_SEPARATORS = str.maketrans(";,\t\n", "    ")
+_BLOCK = 4096
+
+
+def _to_float(tokens):
+    try:
+        return np.array(tokens, dtype=float)
+    except ValueError:
+        pass
+
+    if len(tokens) > 128:
+        mid = len(tokens) // 2
+        return np.concatenate([_to_float(tokens[:mid]), _to_float(tokens[mid:])])
+
+    values = []
+    for x in tokens:
+        try:
+            values.append(float(x))
+        except ValueError:
+            continue
+    return np.array(values, dtype=float)
+
+
+def parse_numbers(input_text):
+    """
+    Mengubah teks angka (pemisah spasi/koma/titik koma/tab/baris baru) menjadi array.
+
+    Konversi dilakukan sekaligus oleh NumPy per blok token; blok yang
+    mengandung token non-angka dibelah dua sampai token tersebut terisolasi.
+    Mengembalikan (data, jumlah_token_dibuang). Token 'nan' ikut dibuang.
+    """
+    tokens = input_text.translate(_SEPARATORS).split()
+    try:
+        data = np.array(tokens, dtype=float)
+    except ValueError:
+        data = np.concatenate(
+            [_to_float(tokens[i:i + _BLOCK]) for i in range(0, len(tokens), _BLOCK)]
+        )
+
+    if np.isnan(data).any():
+        data = data[~np.isnan(data)]
+    return data, len(tokens) - len(data)
+
+
+def parse_frequency_text(input_text):
+    """
+    Tabel frekuensi dari teks: satu pasangan 'nilai frekuensi' per baris
+    (pemisah spasi/koma/titik koma/tab/titik dua). Mengembalikan (Moments, jumlah baris).
+    """
+    rows = [line.replace(":", " ").translate(_SEPARATORS).split() for line in input_text.splitlines()]
+    rows = [r for r in rows if r]
+    if any(len(r) != 2 for r in rows):
+        raise ValueError("Setiap baris harus berisi tepat dua angka: nilai dan frekuensi.")
+    table = np.array(rows, dtype=float).reshape(-1, 2)
+    return frequency_moments(table[:, 0], table[:, 1]), len(table)
+
+
+def _check_counts(counts):
+    counts = np.asarray(counts, dtype=float)
+    if np.any(counts < 0) or np.any(counts != np.round(counts)):
+        raise ValueError("Frekuensi harus bilangan bulat >= 0.")
+    return counts.astype(np.int64)
+
+
+def frequency_moments(values, counts):
+    """Moments dari kolom nilai dan kolom frekuensi (data tidak diekspansi)."""
+    return moments.from_weighted(values, _check_counts(counts))
+
+
+def stream_csv_frequency_moments(file_obj, value_col, count_col, chunksize=1_000_000):
+    """Versi streaming untuk tabel frekuensi CSV yang sangat panjang; blok digabung dengan moments.merge."""
+    import pandas as pd
+
+    m = moments.EMPTY
+    for chunk in pd.read_csv(file_obj, usecols=[value_col, count_col], chunksize=chunksize):
+        values = pd.to_numeric(chunk[value_col], errors="coerce").to_numpy(dtype=float)
+        counts = pd.to_numeric(chunk[count_col], errors="coerce").fillna(0).to_numpy()
+        m = moments.merge(m, frequency_moments(values, counts))
+    return m
+
+
+def numeric_columns(df):
+    return df.select_dtypes(include=np.number).columns.tolist()
+
+
+def first_numeric_column(df):
+    numeric_cols = numeric_columns(df)
+    return numeric_cols[0] if numeric_cols else None
+
+
+def peek_numeric_columns(source, nrows=1000):
+    """Kolom angka sebuah file CSV/Parquet/Arrow/.npy (path) atau objek file CSV, dari beberapa baris awal."""
+    import pandas as pd
+
+    if isinstance(source, str) and is_columnar(source):
+        return column_names(source)
+    head = pd.read_csv(source, nrows=nrows)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return numeric_columns(head)
+
+
+def stream_csv_moments(file_obj, column=None, chunksize=200_000):
+    """
+    Membaca CSV per blok dan melipatnya ke moments.Moments tanpa menyimpan kolom utuh.
+
+    Jika `column` kosong, dipakai kolom numerik pertama (sama seperti mode biasa).
+    Mengembalikan (Moments, nama_kolom).
+    """
+    import pandas as pd
+
+    if column is None:
+        head = pd.read_csv(file_obj, nrows=1000)
+        column = first_numeric_column(head)
+        if column is None:
+            raise ValueError("File tidak memiliki kolom angka.")
+        file_obj.seek(0)
+
+    m = moments.EMPTY
+    for chunk in pd.read_csv(file_obj, usecols=[column], chunksize=chunksize):
+        values = pd.to_numeric(chunk[column], errors="coerce").to_numpy(dtype=float)
+        m = moments.update(m, values)
+    return m, column
+
+
+def stream_csv_columns_moments(file_obj, columns=None, chunksize=200_000):
+    """
+    Moments banyak kolom sekaligus dalam satu kali baca: setiap field Moments
+    berupa array dengan satu elemen per kolom. Default: semua kolom angka.
+    Mengembalikan (Moments, daftar_kolom).
+    """
+    import pandas as pd
+
+    if columns is None:
+        columns = peek_numeric_columns(file_obj)
+        if not columns:
+            raise ValueError("File tidak memiliki kolom angka.")
+
+    m = moments.EMPTY
+    for chunk in pd.read_csv(file_obj, usecols=columns, chunksize=chunksize):
+        values = chunk[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        m = moments.update(m, values.T)
+    return m, list(columns)
+
+
+def frame_moments(df, columns=None):
+    """Moments banyak kolom DataFrame (NaN diabaikan); mengembalikan (Moments, daftar_kolom)."""
+    columns = numeric_columns(df) if columns is None else list(columns)
+    return moments.from_array(df[columns].to_numpy(dtype=float).T), columns
+
+
+def group_labels(col):
+    """
+    Label grup sebagai teks agar CSV per blok (dibaca dtype=str) dan DataFrame
+    utuh memberi label yang sama: 1, 1.0 dan "1" menjadi "1". NaN tetap NaN.
+    """
+    import pandas as pd
+
+    if pd.api.types.is_float_dtype(col):
+        whole = col.notna() & (col % 1 == 0) & (col.abs() < 2**53)
+        text = col.astype(str)
+        text[whole] = col[whole].astype(np.int64).astype(str)
+    else:
+        text = col.astype(str)
+    return text.where(col.notna())
+
+
+def frame_group_moments(df, value_col, group_col):
+    """
+    Moments per grup dari data format panjang (satu baris = grup, nilai).
+    Mengembalikan (Moments berisi array per grup, label_grup).
+    """
+    import pandas as pd
+
+    codes, labels = pd.factorize(group_labels(df[group_col]), use_na_sentinel=True)
+    values = pd.to_numeric(df[value_col], errors="coerce").to_numpy(dtype=float)
+    keep = codes >= 0
+    return moments.from_groups(codes[keep], values[keep], len(labels)), list(labels)
+
+
+def stream_csv_group_moments(file_obj, value_col, group_col, chunksize=1_000_000):
+    """
+    Versi streaming frame_group_moments untuk CSV besar: tiap blok diringkas
+    per grup lalu digabung (moments.merge) ke ringkasan grup global.
+    """
+    import pandas as pd
+
+    index = {}
+    m = moments.from_groups([], [], 0)
+    for chunk in pd.read_csv(file_obj, usecols=[value_col, group_col],
+                             dtype={group_col: str}, chunksize=chunksize):
+        part, labels = frame_group_moments(chunk, value_col, group_col)
+        for label in labels:
+            index.setdefault(label, len(index))
+        target = np.array([index[label] for label in labels], dtype=np.intp)
+
+        grow = len(index) - np.size(m.n)
+        if grow:
+            m = moments.Moments(*(np.concatenate([f, np.broadcast_to(e, (grow,))]) for f, e in zip(m, moments.EMPTY)))
+        merged = moments.merge(moments.take(m, target), part)
+        fields = [np.array(f, dtype=float if i else np.int64) for i, f in enumerate(m)]
+        for f, new in zip(fields, merged):
+            f[target] = new
+        m = moments.Moments(*fields)
+    return m, list(index)
+
+
+# --- Format kolumnar (Parquet, Arrow IPC/Feather) dan array .npy ---
+#
+# Hanya satu kolom yang dibaca (proyeksi kolom). File Arrow dan .npy lokal
+# dibuka dengan memory map; isi upload dipakai langsung dari buffer-nya.
+# Kolom float64 tanpa null sampai ke engine tanpa salinan; tipe lain
+# (integer, float32, Parquet yang harus didekode) tepat satu salinan.
+
+ARROW_EXT = (".arrow", ".feather", ".ipc")
+COLUMNAR_EXT = (".parquet", ".npy") + ARROW_EXT
+
+
+def is_columnar(name):
+    return name.lower().endswith(COLUMNAR_EXT)
+
+
+def _buffer(source):
+    """Path apa adanya; objek file (mis. UploadedFile) sebagai memoryview tanpa salinan."""
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    if hasattr(source, "getbuffer"):
+        return source.getbuffer()
+    return memoryview(source.read())
+
+
+def _arrow_source(source):
+    import pyarrow as pa
+
+    buf = _buffer(source)
+    if isinstance(buf, memoryview):
+        return pa.BufferReader(pa.py_buffer(buf))
+    return pa.memory_map(buf)
+
+
+def _open_npy(source):
+    """Array .npy: memory map untuk path, view atas buffer untuk objek file."""
+    buf = _buffer(source)
+    if not isinstance(buf, memoryview):
+        return np.load(buf, mmap_mode="r", allow_pickle=False)
+    f = io.BytesIO(buf)  # hanya untuk membaca header
+    fmt = np.lib.format
+    read_header = fmt.read_array_header_1_0 if fmt.read_magic(f) == (1, 0) else fmt.read_array_header_2_0
+    shape, fortran, dtype = read_header(f)
+    if dtype.hasobject:
+        raise ValueError("Array .npy berisi objek Python tidak didukung.")
+    count = int(np.prod(shape, dtype=np.int64))
+    arr = np.frombuffer(buf, dtype=dtype, count=count, offset=f.tell())
+    return arr.reshape(shape, order="F" if fortran else "C")
+
+
+def _npy_names(arr):
+    if arr.dtype.names:
+        return [c for c in arr.dtype.names if np.issubdtype(arr.dtype[c], np.number)]
+    if arr.ndim == 1:
+        return ["nilai"]
+    if arr.ndim == 2:
+        return [f"kolom_{j}" for j in range(arr.shape[1])]
+    raise ValueError("Array .npy harus 1-D, 2-D, atau structured.")
+
+
+def _npy_column(arr, column):
+    if arr.dtype.names:
+        return arr[column]
+    if arr.ndim == 2:
+        return arr[:, int(str(column).rsplit("_", 1)[-1])]
+    return arr
+
+
+def _arrow_to_numpy(chunked):
+    """ChunkedArray -> ndarray; satu chunk tanpa null tidak disalin (ChunkedArray.to_numpy selalu menyalin)."""
+    if chunked.num_chunks == 1:
+        return chunked.chunk(0).to_numpy(zero_copy_only=False)
+    return chunked.to_numpy()
+
+
+def column_names(source, name=None):
+    """Kolom angka file kolumnar dari skema/header saja, tanpa membaca data."""
+    name = name or str(source)
+    if name.lower().endswith(".npy"):
+        return _npy_names(_open_npy(source))
+
+    import pyarrow as pa
+
+    if name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(_arrow_source(source))
+    else:
+        schema = pa.ipc.open_file(_arrow_source(source)).schema
+    return [f.name for f in schema if pa.types.is_integer(f.type) or pa.types.is_floating(f.type)]
+
+
+def read_column(source, name=None, column=None):
+    """
+    (array, nama_kolom) satu kolom file Parquet/Arrow/.npy. Nilai null
+    menjadi NaN. Untuk .npy dan Arrow tanpa kompresi hasilnya bisa berupa
+    view read-only atas memory map / buffer upload.
+    """
+    name = name or str(source)
+    if column is None:
+        names = column_names(source, name)
+        if not names:
+            raise ValueError("File tidak memiliki kolom angka.")
+        column = names[0]
+
+    if name.lower().endswith(".npy"):
+        values = _npy_column(_open_npy(source), column)
+    elif name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        values = _arrow_to_numpy(pq.read_table(_arrow_source(source), columns=[column]).column(0))
+    else:
+        import pyarrow as pa
+
+        # per batch, bukan IpcReadOptions(included_fields): opsi itu menyalin buffer walau tanpa kompresi
+        reader = pa.ipc.open_file(_arrow_source(source))
+        idx = reader.schema.get_field_index(column)
+        batches = [reader.get_batch(i).column(idx) for i in range(reader.num_record_batches)]
+        values = _arrow_to_numpy(pa.chunked_array(batches, type=reader.schema.field(idx).type))
+    if values.dtype != np.float64:
+        values = values.astype(np.float64)
+    return values, column
+
+
+def _without_nan(values):
+    """Membuang NaN; salinan hanya dibuat bila memang ada NaN."""
+    nan = np.isnan(values)
+    return values[~nan] if nan.any() else values
+
+
+def read_column_values(source, name=None, column=None):
+    """Seperti read_column, tetapi tanpa NaN (data mentah untuk engine)."""
+    values, column = read_column(source, name, column)
+    return _without_nan(values), column
+
+
+# --- Komputasi paralel per shard untuk file lokal berukuran besar ---
+
+SHARD_BYTES = 64 * 1024**2
+
+
+def _csv_block_moments(block, col_index):
+    """Moments satu kolom dari blok byte CSV tanpa header (berisi baris utuh)."""
+    import pandas as pd
+
+    if not block.strip():
+        return moments.EMPTY
+    chunk = pd.read_csv(io.BytesIO(block), header=None, usecols=[col_index])
+    values = pd.to_numeric(chunk[col_index], errors="coerce").to_numpy(dtype=float)
+    return moments.from_array(values)
+
+
+def _csv_shard_moments(path, start, end, col_index):
+    with open(path, "rb") as f:
+        f.seek(start)
+        block = f.read(end - start)
+    return _csv_block_moments(block, col_index)
+
+
+def _parquet_shard_moments(path, row_groups, column):
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    m = moments.EMPTY
+    for i in row_groups:
+        values = pf.read_row_group(i, columns=[column]).column(0).to_numpy(zero_copy_only=False)
+        m = moments.update(m, np.asarray(values, dtype=float))
+    return m
+
+
+MAPPED_BLOCK_ROWS = 4 * 1024**2
+
+
+def _npy_shard_moments(path, start, end, column, block_rows=MAPPED_BLOCK_ROWS):
+    """Moments baris [start, end) dari .npy yang di-memory-map, per blok agar memori sementara kecil."""
+    values = _npy_column(_open_npy(path), column)
+    m = moments.EMPTY
+    for i in range(start, end, block_rows):
+        m = moments.update(m, values[i:min(i + block_rows, end)])
+    return m
+
+
+def _arrow_shard_moments(path, batches, column):
+    import pyarrow as pa
+
+    reader = pa.ipc.open_file(pa.memory_map(path))
+    idx = reader.schema.get_field_index(column)
+    m = moments.EMPTY
+    for i in batches:
+        values = reader.get_batch(i).column(idx).to_numpy(zero_copy_only=False)
+        m = moments.update(m, values)
+    return m
+
+
+def _csv_shards(path, shard_bytes):
+    """Batas byte tiap shard, disejajarkan ke awal baris; baris header dilewati."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.readline()
+        bounds = [f.tell()]
+        pos = bounds[0] + shard_bytes
+        while pos < size:
+            f.seek(pos)
+            f.readline()
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+            pos = f.tell() + shard_bytes
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def sharded_moments(path, column=None, workers=None, shard_bytes=SHARD_BYTES):
+    """
+    Menghitung Moments satu kolom file CSV/Parquet/Arrow/.npy lokal secara paralel.
+
+    CSV dibagi per rentang byte (disejajarkan ke baris baru), Parquet per
+    row group, Arrow IPC per record batch, dan .npy per rentang baris
+    (memory map, jadi hanya halaman yang sedang diringkas yang ada di
+    memori). Tiap shard diringkas di proses terpisah lalu digabung dengan
+    moments.merge sesuai urutan shard. CSV tidak boleh memiliki baris baru
+    di dalam field ber-kutip. Mengembalikan (Moments, nama_kolom).
+    """
+    import pandas as pd
+
+    if path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        pf = pq.ParquetFile(path)
+        if column is None:
+            column = first_numeric_column(pf.schema_arrow.empty_table().to_pandas())
+        n_groups = pf.num_row_groups
+        step = max(1, n_groups // (4 * (workers or os.cpu_count() or 1)))
+        tasks = [(path, range(i, min(i + step, n_groups)), column) for i in range(0, n_groups, step)]
+        func = _parquet_shard_moments
+    elif path.lower().endswith(".npy"):
+        if column is None:
+            column = next(iter(column_names(path)), None)
+        n_rows = len(_open_npy(path)) if column is not None else 0
+        step = max(MAPPED_BLOCK_ROWS, -(-n_rows // (4 * (workers or os.cpu_count() or 1))))
+        tasks = [(path, i, min(i + step, n_rows), column) for i in range(0, n_rows, step)]
+        func = _npy_shard_moments
+    elif path.lower().endswith(ARROW_EXT):
+        import pyarrow as pa
+
+        if column is None:
+            column = next(iter(column_names(path)), None)
+        n_batches = pa.ipc.open_file(pa.memory_map(path)).num_record_batches
+        step = max(1, n_batches // (4 * (workers or os.cpu_count() or 1)))
+        tasks = [(path, range(i, min(i + step, n_batches)), column) for i in range(0, n_batches, step)]
+        func = _arrow_shard_moments
+    else:
+        head = pd.read_csv(path, nrows=1000)
+        if column is None:
+            column = first_numeric_column(head)
+        if column is None:
+            raise ValueError("File tidak memiliki kolom angka.")
+        col_index = head.columns.get_loc(column)
+        tasks = [(path, start, end, col_index) for start, end in _csv_shards(path, shard_bytes)]
+        func = _csv_shard_moments
+
+    if column is None:
+        raise ValueError("File tidak memiliki kolom angka.")
+
+    if workers == 1 or len(tasks) <= 1:
+        parts = [func(*t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(func, *zip(*tasks)))
+
+    m = moments.EMPTY
+    for part in parts:
+        m = moments.merge(m, part)
+    return m, column
+
+
+# --- Mode watch: melipat baris yang ditambahkan ke akhir file CSV ---
+
+TAIL_BLOCK_BYTES = 64 * 1024**2
+_TAIL_CHECK = 64
+
+TailState = namedtuple("TailState", ["path", "column", "col_index", "header", "offset", "check", "size", "moments"])
+
+
+def _tail_valid(f, state, header, size):
+    """File masih sama (hanya bertambah): header dan byte tepat sebelum offset tidak berubah."""
+    if state.header != header or size < state.offset:
+        return False
+    f.seek(state.offset - len(state.check))
+    return f.read(len(state.check)) == state.check
+
+
+def tail_csv_moments(path, column=None, state=None, block_bytes=TAIL_BLOCK_BYTES):
+    """
+    Melipat baris baru di akhir file CSV lokal ke Moments dari pemanggilan
+    sebelumnya (`state`), sehingga biayanya sebanding dengan jumlah baris
+    baru, bukan ukuran file. Baris terakhir yang belum diakhiri newline
+    ditunda sampai lengkap. Bila file diganti (header berubah, memendek, atau
+    isi sebelum offset berubah) atau kolom lain dipilih, file dibaca ulang
+    dari awal. Mengembalikan TailState baru; hasil ada di `.moments`.
+    """
+    import pandas as pd
+
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        if (state is None or state.path != path or (column is not None and column != state.column)
+                or not _tail_valid(f, state, header, size)):
+            head = pd.read_csv(path, nrows=1000)
+            column = column or first_numeric_column(head)
+            if column is None:
+                raise ValueError("File tidak memiliki kolom angka.")
+            state = TailState(path, column, head.columns.get_loc(column), header, len(header), b"", 0, moments.EMPTY)
+
+        m, offset, check = state.moments, state.offset, state.check
+        f.seek(offset)
+        pending = b""
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            # Baris yang lebih panjang dari satu blok: sambung blok berikutnya sampai ada newline.
+            end = block.rfind(b"\n") + 1
+            if end == 0:
+                pending += block
+                continue
+            lines, pending = pending + block[:end], block[end:]
+            m = moments.merge(m, _csv_block_moments(lines, state.col_index))
+            check = (check + lines)[-_TAIL_CHECK:]
+            offset += len(lines)
+    return state._replace(offset=offset, check=check, size=size, moments=m)
@@ -1,6 +1,5 @@
 import streamlit as st
 import styles
-import content
 
 
 st.set_page_config(
@@ -88,9 +87,11 @@ if main_menu == "🏠 Home":
 
 
 elif main_menu == "🤖 AI Consultant":   
-    content.load_ai_consultant()
+    import consultant
+    consultant.load_ai_consultant()
     
 elif main_menu == "📚 Analisis Statistik":
+    import content
     
     menu = st.sidebar.selectbox(
         "Pilih Metode Uji:",
@@ -103,10 +104,20 @@ elif main_menu == "📚 Analisis Statistik":
             "Uji Rata-rata 2 Sampel Independen (Pooled t-test)",
             "Uji Rata-rata 2 Sampel Independen (Welch t-test)",
             "Uji Rata-rata 2 Sampel Dependen (Paired t-test)",
-            "Uji Kesamaan Varians (F-test)"
+            "Uji Kesamaan Varians (F-test)",
+            "ANOVA Satu Arah",
+            "Bandingkan Semua Kolom",
+            "Power & Ukuran Sampel"
         ]
     )
     
+    st.sidebar.radio(
+        "Renderer grafik:",
+        content.RENDERERS,
+        key="renderer",
+        help="Vega-Lite mengirim spesifikasi grafik ringkas dan menggambarnya di browser, sehingga server tidak perlu merender PNG."
+    )
+    
     if menu == "--- Pilih Uji ---":
         st.info("Silakan pilih jenis uji statistik dari dropdown di sidebar.")
     elif menu == "Uji Proporsi 1 Sampel":
@@ -125,3 +136,11 @@ elif main_menu == "📚 Analisis Statistik":
         content.load_paired_t_test(menu)
     elif menu == "Uji Kesamaan Varians (F-test)":
         content.load_f_test(menu)
+    elif menu == "ANOVA Satu Arah":
+        content.load_anova(menu)
+    elif menu == "Bandingkan Semua Kolom":
+        content.load_compare_all(menu)
+    elif menu == "Power & Ukuran Sampel":
+        content.load_power_analysis(menu)
+
+    content.show_multiple_testing()
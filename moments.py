@@ -0,0 +1,163 @@
+# moments.py
+"""
+Statistik cukup yang dapat digabung (mergeable): n, mean, M2, M3, M4, min, max.
+
+Mk adalah jumlah pangkat-k simpangan terhadap mean, sehingga varians sampel
+= M2 / (n - 1); M3 dan M4 dipakai untuk skewness/kurtosis (uji normalitas
+D'Agostino-Pearson tanpa data mentah). Setiap field boleh berupa skalar atau
+array (satu elemen per kolom/grup), dan dua ringkasan digabung dengan rumus
+Chan et al. yang diperluas oleh Pébay untuk momen tingkat tinggi.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+Moments = namedtuple("Moments", ["n", "mean", "m2", "m3", "m4", "min", "max"])
+
+EMPTY = Moments(0, 0.0, 0.0, 0.0, 0.0, np.inf, -np.inf)
+
+
+def _moments(*fields):
+    return Moments(*(np.asarray(f)[()] for f in fields))
+
+
+def _central_sums(dev, axis):
+    dev2 = dev * dev
+    return np.sum(dev2, axis=axis), np.sum(dev2 * dev, axis=axis), np.sum(dev2 * dev2, axis=axis)
+
+
+def from_array(data, axis=-1):
+    """Ringkasan satu blok data; NaN diabaikan."""
+    data = np.asarray(data, dtype=float)
+    if data.size and np.isnan(data).any():
+        valid = ~np.isnan(data)
+        n = valid.sum(axis=axis)
+        mean = np.divide(np.nansum(data, axis=axis), n, out=np.zeros(np.shape(n)), where=n > 0)
+        dev = np.where(valid, data - np.expand_dims(mean, axis), 0.0)
+        lo = np.min(np.where(valid, data, np.inf), axis=axis)
+        hi = np.max(np.where(valid, data, -np.inf), axis=axis)
+        return _moments(n, mean, *_central_sums(dev, axis), lo, hi)
+
+    n = data.shape[axis]
+    if n == 0:
+        shape = np.delete(data.shape, axis % data.ndim)
+        zeros = np.zeros(shape)
+        return _moments(np.zeros(shape, dtype=int), zeros, zeros, zeros, zeros,
+                        np.full(shape, np.inf), np.full(shape, -np.inf))
+    mean = np.mean(data, axis=axis)
+    dev = data - np.expand_dims(mean, axis)
+    return _moments(n, mean, *_central_sums(dev, axis), np.min(data, axis=axis), np.max(data, axis=axis))
+
+
+def from_groups(codes, values, n_groups=None):
+    """
+    Ringkasan per grup dalam satu lintasan tanpa menyalin data per grup.
+
+    `codes` berisi indeks grup 0..n_groups-1 untuk setiap nilai (mis. hasil
+    pandas.factorize). Jumlah pangkat dihitung dengan np.bincount setelah
+    setiap nilai digeser dengan satu nilai dari grupnya sendiri, sehingga
+    tidak terjadi cancellation untuk data dengan mean besar. NaN diabaikan.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    if not valid.all():
+        codes, values = codes[valid], values[valid]
+    if n_groups is None:
+        n_groups = int(codes.max()) + 1 if codes.size else 0
+
+    shift = np.zeros(n_groups)
+    shift[codes] = values  # nilai mana pun dari grup tersebut cukup sebagai titik geser
+    dev = values - shift[codes]
+
+    n = np.bincount(codes, minlength=n_groups)
+    dev2 = dev * dev
+    s1 = np.bincount(codes, dev, n_groups)
+    s2 = np.bincount(codes, dev2, n_groups)
+    s3 = np.bincount(codes, dev2 * dev, n_groups)
+    s4 = np.bincount(codes, dev2 * dev2, n_groups)
+
+    d = np.divide(s1, n, out=np.zeros(n_groups), where=n > 0)
+    m2 = np.maximum(s2 - n * d**2, 0.0)
+    m3 = s3 - 3*d*s2 + 2*n*d**3
+    m4 = s4 - 4*d*s3 + 6*d**2*s2 - 3*n*d**4
+
+    lo = np.full(n_groups, np.inf)
+    hi = np.full(n_groups, -np.inf)
+    np.minimum.at(lo, codes, values)
+    np.maximum.at(hi, codes, values)
+    return _moments(n, shift + d, m2, m3, m4, lo, hi)
+
+
+def from_weighted(values, counts):
+    """
+    Ringkasan tabel frekuensi (nilai, jumlah kemunculan) tanpa mengekspansi
+    data: hasilnya sama dengan from_array(np.repeat(values, counts)).
+    Memori sebanding dengan jumlah nilai berbeda. Baris dengan nilai NaN
+    atau frekuensi 0 diabaikan.
+    """
+    values = np.asarray(values, dtype=float)
+    counts = np.asarray(counts)
+    keep = ~np.isnan(values) & (counts > 0)
+    values, counts = values[keep], counts[keep]
+    n = int(counts.sum())
+    if n == 0:
+        return EMPTY
+    w = counts.astype(float)
+    mean = np.dot(w, values) / n
+    dev = values - mean
+    dev2 = dev * dev
+    return _moments(n, mean, np.dot(w, dev2), np.dot(w, dev2 * dev), np.dot(w, dev2 * dev2),
+                    values.min(), values.max())
+
+
+def take(m, index):
+    """Memilih elemen (grup/kolom) tertentu dari Moments berisi array."""
+    size = max(np.size(f) for f in m)
+    return _moments(*(np.broadcast_to(f, (size,))[index] for f in m))
+
+
+def merge(a, b):
+    """Menggabungkan dua ringkasan (rumus paralel Chan/Pébay)."""
+    n = a.n + b.n
+    delta = b.mean - a.mean
+    valid = np.asarray(n) > 0
+    fa = np.divide(a.n, n, out=np.zeros(np.shape(n)), where=valid)
+    fb = np.divide(b.n, n, out=np.zeros(np.shape(n)), where=valid)
+    ab = a.n * fb
+
+    mean = a.mean + delta * fb
+    m2 = a.m2 + b.m2 + delta**2 * ab
+    m3 = (a.m3 + b.m3 + delta**3 * ab * (fa - fb)
+          + 3 * delta * (fa * b.m2 - fb * a.m2))
+    m4 = (a.m4 + b.m4 + delta**4 * ab * (fa * fa - fa * fb + fb * fb)
+          + 6 * delta**2 * (fa * fa * b.m2 + fb * fb * a.m2)
+          + 4 * delta * (fa * b.m3 - fb * a.m3))
+    return _moments(n, mean, m2, m3, m4, np.minimum(a.min, b.min), np.maximum(a.max, b.max))
+
+
+def update(m, chunk):
+    """Welford per blok: melipat satu blok data baru ke ringkasan yang ada."""
+    return merge(m, from_array(chunk))
+
+
+def variance(m, ddof=1):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return m.m2 / (m.n - ddof)
+
+
+def std(m, ddof=1):
+    return np.sqrt(variance(m, ddof))
+
+
+def skewness(m):
+    """Skewness sampel g1 (bias, seperti scipy.stats.skew)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.sqrt(m.n) * m.m3 / m.m2**1.5
+
+
+def kurtosis(m):
+    """Kurtosis sampel b2 (bias, bukan excess; seperti scipy.stats.kurtosis(fisher=False))."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return m.n * m.m4 / m.m2**2
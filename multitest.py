@@ -0,0 +1,55 @@
+# multitest.py
+"""
+Koreksi multiple testing untuk sekumpulan p-value (hasil batch atau riwayat sesi).
+
+Semua metode memakai satu argsort (O(m log m)) dan akumulasi kumulatif
+tervektorisasi; p-value NaN (mis. job yang gagal) diabaikan dan tetap NaN.
+P-value terkoreksi setara statsmodels.stats.multitest.multipletests.
+"""
+import numpy as np
+
+
+METHODS = {
+    "bonferroni": "Bonferroni",
+    "holm": "Holm",
+    "bh": "Benjamini-Hochberg (FDR)",
+    "by": "Benjamini-Yekutieli (FDR)",
+}
+
+
+def adjust(p_values, method="holm"):
+    """P-value terkoreksi (array 1-D, urutan sama dengan input)."""
+    p = np.asarray(p_values, dtype=float)
+    adjusted = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    q = p[valid]
+    m = q.size
+    if m == 0:
+        return adjusted
+
+    if method == "bonferroni":
+        adjusted[valid] = np.minimum(q * m, 1.0)
+        return adjusted
+
+    order = np.argsort(q, kind="stable")
+    ranked = q[order]
+    i = np.arange(1, m + 1)
+    if method == "holm":
+        step = np.maximum.accumulate((m - i + 1) * ranked)
+    elif method in ("bh", "by"):
+        c = np.sum(1.0 / i) if method == "by" else 1.0
+        step = np.minimum.accumulate((ranked * m * c / i)[::-1])[::-1]
+    else:
+        raise ValueError(f"Metode koreksi tidak dikenal: {method}")
+
+    out = np.empty(m)
+    out[order] = np.minimum(step, 1.0)
+    adjusted[valid] = out
+    return adjusted
+
+
+def decide(p_values, alpha=0.05, method="holm"):
+    """(reject, p_adj): keputusan setelah koreksi pada tingkat alpha keluarga/FDR."""
+    p_adj = adjust(p_values, method)
+    with np.errstate(invalid="ignore"):
+        return p_adj <= alpha, p_adj
@@ -0,0 +1,123 @@
+# normality.py
+"""
+Uji normalitas yang menyesuaikan ukuran sampel.
+
+- n <= SHAPIRO_MAX_N : Shapiro-Wilk pada data penuh.
+- n besar            : D'Agostino-Pearson K² dihitung dari momen (M2, M3, M4),
+                       O(n) dan juga berlaku untuk data streaming (Moments).
+- 'anderson'         : Anderson-Darling pada subsampel acak ber-seed.
+
+Shapiro-Wilk di SciPy tidak akurat di atas 5000 titik, sehingga batasnya
+diletakkan di sana.
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy import stats
+
+import moments
+
+
+SHAPIRO_MAX_N = 5000
+SUBSAMPLE_N = 5000
+SEED = 12345
+
+NormalityResult = namedtuple("NormalityResult", ["method", "stat", "p_val", "n_used"])
+
+METHOD_LABELS = {
+    "shapiro": "Shapiro-Wilk",
+    "dagostino": "D'Agostino-Pearson (dari momen)",
+    "anderson": "Anderson-Darling (subsampel)",
+}
+
+
+def _skew_z(g1, n):
+    y = g1 * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+    beta2 = (3.0 * (n**2 + 27*n - 70) * (n + 1) * (n + 3)) / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9))
+    w2 = -1 + np.sqrt(2 * (beta2 - 1))
+    delta = 1 / np.sqrt(0.5 * np.log(w2))
+    alpha = np.sqrt(2.0 / (w2 - 1))
+    y = np.where(y == 0, 1, y)
+    return delta * np.log(y/alpha + np.sqrt((y/alpha)**2 + 1))
+
+
+def _kurtosis_z(b2, n):
+    e = 3.0 * (n - 1) / (n + 1)
+    var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+    x = (b2 - e) / np.sqrt(var_b2)
+    sqrt_beta1 = 6.0 * (n*n - 5*n + 2) / ((n + 7) * (n + 9)) * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))
+    a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1**2))
+    term1 = 1 - 2 / (9.0 * a)
+    denom = 1 + x * np.sqrt(2 / (a - 4.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term2 = np.sign(denom) * np.where(denom == 0.0, np.nan, ((1 - 2.0/a) / np.abs(denom))**(1/3.0))
+    return (term1 - term2) / np.sqrt(2 / (9.0 * a))
+
+
+def dagostino_from_moments(m):
+    """K² D'Agostino-Pearson dari Moments (setara scipy.stats.normaltest); butuh n >= 20."""
+    n = np.asarray(m.n, dtype=float)
+    k2 = _skew_z(moments.skewness(m), n)**2 + _kurtosis_z(moments.kurtosis(m), n)**2
+    return k2, stats.chi2.sf(k2, 2)
+
+
+def anderson_subsample(data, size=SUBSAMPLE_N, seed=SEED):
+    """Anderson-Darling (parameter diestimasi) pada subsampel ber-seed; p-value D'Agostino-Stephens."""
+    data = np.asarray(data, dtype=float)
+    if len(data) > size:
+        data = np.random.default_rng(seed).choice(data, size, replace=False)
+    n = len(data)
+    z = np.sort((data - data.mean()) / data.std(ddof=1))
+    i = np.arange(1, n + 1)
+    logcdf = stats.norm.logcdf(z)
+    logsf = stats.norm.logsf(z)
+    a2 = -n - np.sum((2*i - 1) * (logcdf + logsf[::-1])) / n
+    a2s = a2 * (1 + 0.75/n + 2.25/n**2)
+
+    if a2s >= 0.6:
+        p = np.exp(1.2937 - 5.709*a2s + 0.0186*a2s**2)
+    elif a2s >= 0.34:
+        p = np.exp(0.9177 - 4.279*a2s - 1.38*a2s**2)
+    elif a2s >= 0.2:
+        p = 1 - np.exp(-8.318 + 42.796*a2s - 59.938*a2s**2)
+    else:
+        p = 1 - np.exp(-13.436 + 101.14*a2s - 223.73*a2s**2)
+    return a2, min(max(p, 0.0), 1.0), n
+
+
+def choose_method(n, streaming=False):
+    if streaming or n > SHAPIRO_MAX_N:
+        return "dagostino"
+    return "shapiro"
+
+
+def run(data, method="auto"):
+    """
+    Menjalankan uji normalitas; `data` berupa array atau Moments.
+    Mengembalikan NormalityResult, atau None jika n terlalu kecil untuk metode terpilih.
+    """
+    streaming = isinstance(data, moments.Moments)
+    n = int(data.n) if streaming else len(data)
+    if method == "auto":
+        method = choose_method(n, streaming)
+
+    if method == "shapiro":
+        if n < 3:
+            return None
+        stat, p = stats.shapiro(data)
+        return NormalityResult(method, float(stat), float(p), n)
+
+    if method == "dagostino":
+        if n < 20:
+            return None
+        m = data if streaming else moments.from_array(data)
+        k2, p = dagostino_from_moments(m)
+        return NormalityResult(method, float(k2), float(p), n)
+
+    if method == "anderson":
+        if streaming or n < 8:
+            return None
+        a2, p, n_used = anderson_subsample(data)
+        return NormalityResult(method, float(a2), float(p), n_used)
+
+    raise ValueError(f"Metode normalitas tidak dikenal: {method}")
@@ -0,0 +1,244 @@
+# pairing.py
+"""
+Pemasangan data pre/post berdasarkan kolom ID untuk paired t-test.
+
+Dua file (ID, nilai) digabung per ID tanpa memuat keduanya ke memori;
+hanya Moments selisih (nilai 1 - nilai 2) yang dikumpulkan, ditambah
+jumlah ID yang tidak punya pasangan. ID yang muncul lebih dari sekali
+dalam satu file memakai kemunculan pertama dan dihitung sebagai duplikat;
+baris dengan ID atau nilai kosong dibuang.
+
+Kolom ID selalu dibaca sebagai teks (tanpa spasi di tepi) lalu dinormalisasi
+per nilai, bukan per blok: ID yang berupa bilangan bulat ("7", "007", "7.0")
+menjadi bilangan bulat, ID lain tetap teks. Dengan begitu ID yang sama
+mendapat kunci yang sama walaupun blok atau file lain berisi ID teks seperti
+"S001" atau "NA".
+
+- hash_join_moments: grace hash join. Kedua file dipartisi menurut hash ID
+  ke file sementara (biner: kunci uint64 + nilai float64), lalu setiap
+  partisi digabung di memori dengan sort. Memori sebanding dengan ukuran
+  satu partisi, bukan jumlah subjek. ID bilangan bulat dipakai apa adanya;
+  ID teks diwakili hash 64-bit (peluang tabrakan ~n²/2^65, dapat diabaikan).
+- merge_join_moments: sorted-merge join untuk file yang sudah terurut
+  menurut ID; cukup satu lintasan per file tanpa file sementara. Bila semua
+  ID bilangan bulat urutannya numerik, selain itu urutan teks dari bentuk
+  yang sudah dinormalisasi (ID bilangan bulat ditulis ulang tanpa nol di
+  depan atau ".0"); file yang mencampur keduanya harus memakai hash join.
+"""
+import os
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+
+import moments
+
+
+CHUNK_ROWS = 1_000_000
+PARTITION_BYTES = 32 * 1024**2
+MAX_PARTITIONS = 1024
+
+PairResult = namedtuple(
+    "PairResult",
+    ["moments", "n_matched", "unmatched_1", "unmatched_2", "duplicates_1", "duplicates_2", "dropped"],
+)
+
+_RECORD = np.dtype([("key", "<u8"), ("value", "<f8")])
+
+
+_MAX_EXACT_INT = 2.0**53
+
+
+def _read_chunks(source, id_col, value_col, chunksize):
+    """(id teks, nilai, jumlah baris dibuang) per blok CSV; `source` berupa path atau file object."""
+    import pandas as pd
+
+    for chunk in pd.read_csv(source, usecols=[id_col, value_col], dtype={id_col: str}, chunksize=chunksize):
+        ids = chunk[id_col].str.strip()
+        values = pd.to_numeric(chunk[value_col], errors="coerce")
+        valid = ids.notna() & (ids != "") & values.notna()
+        yield ids[valid].to_numpy(dtype=object), values[valid].to_numpy(dtype=float), int((~valid).sum())
+
+
+def _integer_ids(ids):
+    """(mask ID bilangan bulat, nilainya sebagai int64); keputusan per nilai, tidak tergantung blok."""
+    import pandas as pd
+
+    try:
+        values = ids.astype(np.int64)  # jalur cepat: semua ID berupa literal bilangan bulat
+    except (ValueError, OverflowError):
+        pass
+    else:
+        is_int = np.abs(values) < _MAX_EXACT_INT
+        return is_int, np.where(is_int, values, 0)
+    num = pd.to_numeric(pd.Series(ids, dtype=object), errors="coerce").to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        is_int = np.isfinite(num) & (num == np.round(num)) & (np.abs(num) < _MAX_EXACT_INT)
+    return is_int, np.where(is_int, num, 0).astype(np.int64)
+
+
+def _keys(ids):
+    """Kunci uint64: ID bilangan bulat apa adanya, ID teks lain hash 64-bit."""
+    import pandas as pd
+
+    is_int, values = _integer_ids(ids)
+    keys = values.view(np.uint64)
+    if not is_int.all():
+        keys[~is_int] = pd.util.hash_array(ids[~is_int], categorize=False)
+    return keys
+
+
+def _first_unique(keys, values):
+    """(kunci unik terurut, nilai kemunculan pertama, jumlah duplikat)."""
+    keys, first = np.unique(keys, return_index=True)
+    return keys, values[first], len(values) - len(keys)
+
+
+def _join(k1, v1, k2, v2):
+    """Menggabungkan dua array kunci unik terurut; (Moments selisih, cocok, sisa 1, sisa 2)."""
+    _, i1, i2 = np.intersect1d(k1, k2, assume_unique=True, return_indices=True)
+    return moments.from_array(v1[i1] - v2[i2]), len(i1), len(k1) - len(i1), len(k2) - len(i2)
+
+
+def _source_bytes(source):
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if hasattr(source, "getbuffer"):
+        return source.getbuffer().nbytes
+    return PARTITION_BYTES
+
+
+def _partition(source, id_col, value_col, n_parts, prefix, chunksize):
+    """Menulis record (kunci, nilai) ke file partisi `prefix`_p; mengembalikan jumlah baris dibuang."""
+    dropped = 0
+    for ids, values, n_bad in _read_chunks(source, id_col, value_col, chunksize):
+        dropped += n_bad
+        records = np.empty(len(ids), dtype=_RECORD)
+        records["key"] = _keys(ids)
+        records["value"] = values
+        part = records["key"] % np.uint64(n_parts)
+        order = np.argsort(part, kind="stable")
+        bounds = np.r_[0, np.cumsum(np.bincount(part, minlength=n_parts))]
+        records = records[order]
+        for p in np.flatnonzero(np.diff(bounds)):
+            with open(f"{prefix}_{p}", "ab") as f:
+                records[bounds[p]:bounds[p + 1]].tofile(f)
+    return dropped
+
+
+def _load_partition(path):
+    if not os.path.exists(path):
+        return np.empty(0, dtype=_RECORD)
+    return np.fromfile(path, dtype=_RECORD)
+
+
+def hash_join_moments(source1, source2, id_col1, value_col1, id_col2=None, value_col2=None,
+                      partitions=None, chunksize=CHUNK_ROWS, tmpdir=None):
+    """Grace hash join dua file CSV menurut ID; mengembalikan PairResult."""
+    id_col2 = id_col2 or id_col1
+    value_col2 = value_col2 or value_col1
+    if partitions is None:
+        size = _source_bytes(source1) + _source_bytes(source2)
+        partitions = int(np.clip(size // PARTITION_BYTES + 1, 1, MAX_PARTITIONS))
+
+    m, n_matched, un1, un2, dup1, dup2 = moments.EMPTY, 0, 0, 0, 0, 0
+    with tempfile.TemporaryDirectory(dir=tmpdir) as tmp:
+        dropped = _partition(source1, id_col1, value_col1, partitions, os.path.join(tmp, "a"), chunksize)
+        dropped += _partition(source2, id_col2, value_col2, partitions, os.path.join(tmp, "b"), chunksize)
+        for p in range(partitions):
+            r1 = _load_partition(os.path.join(tmp, f"a_{p}"))
+            r2 = _load_partition(os.path.join(tmp, f"b_{p}"))
+            k1, v1, d1 = _first_unique(r1["key"], r1["value"])
+            k2, v2, d2 = _first_unique(r2["key"], r2["value"])
+            part, matched, u1, u2 = _join(k1, v1, k2, v2)
+            m = moments.merge(m, part)
+            n_matched, un1, un2, dup1, dup2 = n_matched + matched, un1 + u1, un2 + u2, dup1 + d1, dup2 + d2
+    return PairResult(m, n_matched, un1, un2, dup1, dup2, dropped)
+
+
+class _SortedReader:
+    """
+    Blok (id, nilai) berurutan dari satu file, memeriksa bahwa ID tidak menurun.
+    Mode urutan ('int' atau 'text') ditetapkan oleh blok pertama; ID teks di
+    file berurutan numerik ditolak dengan pesan yang jelas.
+    """
+
+    def __init__(self, source, id_col, value_col, chunksize):
+        self._chunks = _read_chunks(source, id_col, value_col, chunksize)
+        self.ids = np.empty(0)
+        self.values = np.empty(0)
+        self.done = False
+        self.dropped = 0
+        self.mode = None
+        self._last = None
+
+    def _order_keys(self, ids):
+        is_int, values = _integer_ids(ids)
+        if self.mode is None:
+            self.mode = "int" if is_int.all() else "text"
+        if self.mode == "text":
+            if is_int.any():  # bentuk kanonik yang sama dengan hash join: "7.0" dan "007" menjadi "7"
+                ids = ids.copy()
+                ids[is_int] = values[is_int].astype(str)
+            return ids
+        if not is_int.all():
+            raise ValueError("Kolom ID mencampur bilangan bulat dan teks; gunakan hash join.")
+        return values
+
+    def pull(self):
+        for ids, values, n_bad in self._chunks:
+            self.dropped += n_bad
+            if not len(ids):
+                continue
+            ids = self._order_keys(ids)
+            if np.any(ids[1:] < ids[:-1]) or (self._last is not None and ids[0] < self._last):
+                raise ValueError("File tidak terurut menurut ID; gunakan hash join.")
+            self._last = ids[-1]
+            self.ids = np.concatenate([self.ids, ids]) if len(self.ids) else ids
+            self.values = np.concatenate([self.values, values]) if len(self.values) else values
+            return
+        self.done = True
+
+    def take_below(self, limit):
+        """Memotong semua baris dengan ID < limit (semua baris bila limit None)."""
+        cut = len(self.ids) if limit is None else np.searchsorted(self.ids, limit, side="left")
+        ids, values = self.ids[:cut], self.values[:cut]
+        self.ids, self.values = self.ids[cut:], self.values[cut:]
+        return ids, values
+
+
+def merge_join_moments(source1, source2, id_col1, value_col1, id_col2=None, value_col2=None,
+                       chunksize=CHUNK_ROWS):
+    """
+    Sorted-merge join dua file CSV yang sudah terurut menurut ID; mengembalikan
+    PairResult. Baris dengan ID di bawah ID terakhir yang sudah terbaca di
+    kedua file diproses dan dibuang dari buffer, sehingga memori tetap
+    sebesar beberapa blok.
+    """
+    r1 = _SortedReader(source1, id_col1, value_col1, chunksize)
+    r2 = _SortedReader(source2, id_col2 or id_col1, value_col2 or value_col1, chunksize)
+
+    m, n_matched, un1, un2, dup1, dup2 = moments.EMPTY, 0, 0, 0, 0, 0
+    while True:
+        # isi buffer yang ID terakhirnya paling kecil (atau kosong) agar rentang ID yang sudah pasti lengkap bertambah
+        live = [r for r in (r1, r2) if not r.done]
+        if live:
+            empty = [r for r in live if not len(r.ids)]
+            (empty[0] if empty else min(live, key=lambda r: r.ids[-1])).pull()
+        live = [r for r in (r1, r2) if not r.done]
+        if any(not len(r.ids) for r in live):
+            continue
+        if None not in (r1.mode, r2.mode) and r1.mode != r2.mode:
+            raise ValueError("ID file pertama dan kedua berbeda jenis (angka vs teks); gunakan hash join.")
+        limit = min(r.ids[-1] for r in live) if live else None
+
+        ids1, vals1 = r1.take_below(limit)
+        ids2, vals2 = r2.take_below(limit)
+        k1, v1, d1 = _first_unique(ids1, vals1)
+        k2, v2, d2 = _first_unique(ids2, vals2)
+        part, matched, u1, u2 = _join(k1, v1, k2, v2)
+        m = moments.merge(m, part)
+        n_matched, un1, un2, dup1, dup2 = n_matched + matched, un1 + u1, un2 + u2, dup1 + d1, dup2 + d2
+        if r1.done and r2.done:
+            break
+    return PairResult(m, n_matched, un1, un2, dup1, dup2, r1.dropped + r2.dropped)
@@ -0,0 +1,163 @@
+# plots.py
+"""
+Render grafik daerah keputusan tanpa UI.
+
+Kurva PDF dan PNG hasil render disimpan dalam cache LRU per proses.
+Gambar dibuat dengan matplotlib.figure.Figure (bukan pyplot), sehingga
+tidak ada figure yang tertinggal di registry global pyplot dan setiap
+figure dilepas begitu PNG selesai ditulis.
+"""
+import io
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+def curve_limit(dist_name, stat_val, crit_val):
+    """Batas sumbu x, dibulatkan ke atas ke kelipatan 0.5 agar kurva dapat dipakai ulang."""
+    if dist_name == 'f':
+        limit = max(5, stat_val + 2, crit_val + 2)
+    else:
+        limit = max(4, abs(stat_val) + 1, abs(crit_val) + 1)
+    return math.ceil(limit * 2) / 2
+
+
+@lru_cache(maxsize=256)
+def pdf_curve(dist_name, limit, df1=None, df2=None):
+    """(x, y) kurva PDF 1000 titik; array hanya-baca karena dibagi antar pemanggil."""
+    from scipy import stats
+
+    if dist_name == 'normal':
+        x = np.linspace(-limit, limit, 1000)
+        y = stats.norm.pdf(x, 0, 1)
+    elif dist_name == 't':
+        x = np.linspace(-limit, limit, 1000)
+        y = stats.t.pdf(x, df1)
+    else:
+        x = np.linspace(0, limit, 1000)
+        y = stats.f.pdf(x, df1, df2)
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+def dist_label(dist_name, df1=None, df2=None):
+    if dist_name == 'normal':
+        return 'Distribusi Normal Standar (Z)'
+    if dist_name == 't':
+        return f'Distribusi t (df={df1:.2f})'
+    return f'Distribusi F (df1={df1}, df2={df2})'
+
+
+def render_png(dist_name, stat_val, crit_val, tail, df1=None, df2=None):
+    """PNG grafik daerah keputusan; tail = 'two' / 'right' / 'left' (lihat engine.tail_of)."""
+    if dist_name == 'f':
+        df1, df2 = int(df1), int(df2)
+    elif dist_name == 't':
+        df1 = float(df1)
+    return _render_png(dist_name, float(stat_val), float(crit_val), tail, df1, df2)
+
+
+@lru_cache(maxsize=128)
+def _render_png(dist_name, stat_val, crit_val, tail, df1, df2):
+    from matplotlib.figure import Figure
+
+    x, y = pdf_curve(dist_name, curve_limit(dist_name, stat_val, crit_val), df1, df2)
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+
+    ax.plot(x, y, label=dist_label(dist_name, df1, df2), color='#2563EB', linewidth=2)
+    ax.fill_between(x, y, alpha=0.1, color='#2563EB')
+
+    if dist_name in ['normal', 't']:
+        crit = abs(crit_val)
+        if tail == "two":
+            ax.fill_between(x, y, where=(x <= -crit), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
+            ax.fill_between(x, y, where=(x >= crit), color='#EF4444', alpha=0.5)
+            ax.axvline(-crit, color='red', linestyle=':')
+            ax.axvline(crit, color='red', linestyle=':')
+        elif tail == "right":
+            ax.fill_between(x, y, where=(x >= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
+            ax.axvline(crit_val, color='red', linestyle=':')
+        else:
+            ax.fill_between(x, y, where=(x <= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
+            ax.axvline(crit_val, color='red', linestyle=':')
+
+    elif dist_name == 'f':
+        ax.fill_between(x, y, where=(x >= crit_val), color='#EF4444', alpha=0.5, label='Daerah Penolakan')
+        ax.axvline(crit_val, color='red', linestyle=':')
+
+    ax.axvline(stat_val, color='#10B981', linestyle='--', linewidth=2.5, label=f'Statistik Hitung ({stat_val:.2f})')
+
+    ax.set_title("Visualisasi Daerah Keputusan")
+    ax.legend()
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    fig.clear()
+    return buf.getvalue()
+
+
+def clear():
+    pdf_curve.cache_clear()
+    _render_png.cache_clear()
+
+
+def vega_lite_spec(dist_name, stat_val, crit_val, tail, df1=None, df2=None, points=200):
+    """
+    Spesifikasi Vega-Lite ringkas untuk grafik yang sama; digambar oleh browser.
+
+    Kurva dikirim sekali (top-level `datasets`) dengan `points` titik dan
+    kolom `sisi` yang menandai titik di daerah penolakan.
+    """
+    stat_val, crit_val = float(stat_val), float(crit_val)
+    if dist_name == 'f':
+        df1, df2 = int(df1), int(df2)
+    elif dist_name == 't':
+        df1 = float(df1)
+
+    x, y = pdf_curve(dist_name, curve_limit(dist_name, stat_val, crit_val), df1, df2)
+    step = max(1, len(x) // points)
+    x, y = x[::step], y[::step]
+
+    crit = abs(crit_val)
+    if dist_name == 'f' or tail == "right":
+        crit_lines = [crit_val]
+        sisi = np.where(x >= crit_val, "kanan", None)
+    elif tail == "two":
+        crit_lines = [-crit, crit]
+        sisi = np.where(x <= -crit, "kiri", np.where(x >= crit, "kanan", None))
+    else:
+        crit_lines = [crit_val]
+        sisi = np.where(x <= crit_val, "kiri", None)
+
+    curve = [{"x": round(float(a), 4), "y": round(float(b), 5), "sisi": s}
+             for a, b, s in zip(x, y, sisi)]
+    x_enc = {"field": "x", "type": "quantitative", "title": dist_label(dist_name, df1, df2)}
+    y_enc = {"field": "y", "type": "quantitative", "title": None}
+
+    return {
+        "title": "Visualisasi Daerah Keputusan",
+        "width": "container",
+        "height": 320,
+        "datasets": {"kurva": curve},
+        "layer": [
+            {"data": {"name": "kurva"}, "mark": {"type": "area", "color": "#2563EB", "opacity": 0.1},
+             "encoding": {"x": x_enc, "y": y_enc}},
+            {"data": {"name": "kurva"}, "mark": {"type": "line", "color": "#2563EB", "strokeWidth": 2},
+             "encoding": {"x": x_enc, "y": y_enc}},
+            {"data": {"name": "kurva"}, "transform": [{"filter": "datum.sisi != null"}],
+             "mark": {"type": "area", "color": "#EF4444", "opacity": 0.5},
+             "encoding": {"x": x_enc, "y": y_enc, "detail": {"field": "sisi"}}},
+            {"data": {"values": [{"x": c} for c in crit_lines]},
+             "mark": {"type": "rule", "color": "red", "strokeDash": [2, 2]},
+             "encoding": {"x": {"field": "x", "type": "quantitative"}}},
+            {"data": {"values": [{"x": stat_val, "label": f"Statistik Hitung ({stat_val:.2f})"}]},
+             "mark": {"type": "rule", "color": "#10B981", "strokeDash": [6, 4], "strokeWidth": 2.5},
+             "encoding": {"x": {"field": "x", "type": "quantitative"}, "tooltip": {"field": "label"}}},
+        ],
+    }
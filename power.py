@@ -0,0 +1,206 @@
+# power.py
+"""
+Analisis power dan ukuran sampel untuk semua uji di aplikasi.
+
+Konvensi effect size per uji:
+- 'z', 't', 'paired' : d = (mu - mu0) / sigma (paired: pada selisih)
+- 'pooled', 'welch'  : d = (mu1 - mu2) / sigma1; n2 = ratio * n1,
+                       'welch' memakai sigma2 = sd_ratio * sigma1
+- 'f'                : rasio varians sigma1² / sigma2² (uji dua arah)
+- 'proportion_1'     : pi1 - pi0, dengan pi0 = p0
+- 'proportion_2'     : pi1 - pi2, dengan pi2 = p0
+
+Rumus tertutup (normal, t non-sentral, F) dipakai bila tersedia; Welch
+tidak punya rumus tertutup sehingga disimulasikan. Simulasi menarik
+statistik cukup (mean ~ normal, varians ~ chi-square, X ~ binomial) dan
+memutuskannya dengan fungsi engine.*_from_moments yang sama dengan
+halaman uji. Semua fungsi menerima effect, n dan alpha berupa array yang
+di-broadcast, sehingga satu grid dihitung dalam satu panggilan.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+
+import critical_values
+import engine
+
+
+TESTS = ("z", "t", "paired", "pooled", "welch", "f", "proportion_1", "proportion_2")
+CLOSED_FORM = ("z", "t", "paired", "pooled", "f", "proportion_1", "proportion_2")
+
+CELLS_PER_TASK = 16
+BLOCK_ELEMENTS = 2_000_000
+
+
+def _second_n(n, ratio):
+    return np.maximum(np.round(np.asarray(n, dtype=float) * ratio), 2)
+
+
+def _tail_power(sf, cdf, crit, tail):
+    """P(tolak H0) dari sf/cdf statistik di bawah H1 dan critical value atas/bawah."""
+    if tail == "two":
+        return sf(crit) + cdf(-crit)
+    if tail == "right":
+        return sf(crit)
+    return cdf(crit)
+
+
+def analytic_power(test, effect, n, alpha, jenis_uji="Two-sided", ratio=1.0, sd_ratio=1.0, p0=0.5):
+    """Power dengan rumus tertutup; effect, n dan alpha di-broadcast."""
+    effect, n, alpha = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (effect, n, alpha)))
+    tail = engine.tail_of(jenis_uji)
+
+    if test == "z":
+        delta = effect * np.sqrt(n)
+        crit = critical_values.critical_value("normal", alpha, tail)
+        power = _tail_power(lambda c: stats.norm.sf(c - delta), lambda c: stats.norm.cdf(c - delta), crit, tail)
+
+    elif test in ("t", "paired", "pooled"):
+        if test == "pooled":
+            n2 = _second_n(n, ratio)
+            delta, df = effect / np.sqrt(1/n + 1/n2), n + n2 - 2
+        else:
+            delta, df = effect * np.sqrt(n), n - 1
+        crit = critical_values.critical_value("t", alpha, tail, df)
+        # nct.sf/cdf dapat menghasilkan NaN jauh di ekor (peluang ~0)
+        power = _tail_power(lambda c: np.nan_to_num(stats.nct.sf(c, df, delta)),
+                            lambda c: np.nan_to_num(stats.nct.cdf(c, df, delta)), crit, tail)
+
+    elif test == "f":
+        df1, df2 = n - 1, _second_n(n, ratio) - 1
+        upper = critical_values.critical_value("f", alpha, "two", df1, df2)
+        lower = 1 / critical_values.critical_value("f", alpha, "two", df2, df1)
+        power = stats.f.sf(upper / effect, df1, df2) + stats.f.cdf(lower / effect, df1, df2)
+
+    elif test in ("proportion_1", "proportion_2"):
+        p1 = p0 + effect
+        if test == "proportion_1":
+            se0 = np.sqrt(p0 * (1 - p0) / n)
+            se1 = np.sqrt(p1 * (1 - p1) / n)
+        else:
+            n2 = _second_n(n, ratio)
+            p_bar = (n*p1 + n2*p0) / (n + n2)
+            se0 = np.sqrt(p_bar * (1 - p_bar) * (1/n + 1/n2))
+            se1 = np.sqrt(p1 * (1 - p1) / n + p0 * (1 - p0) / n2)
+        mu, sd = effect / se0, se1 / se0
+        crit = critical_values.critical_value("normal", alpha, tail)
+        power = _tail_power(lambda c: stats.norm.sf((c - mu) / sd), lambda c: stats.norm.cdf((c - mu) / sd), crit, tail)
+
+    else:
+        raise ValueError(f"Tidak ada rumus tertutup untuk uji: {test}")
+
+    return np.clip(power, 0.0, 1.0)[()]
+
+
+def _draw_reject(test, rng, effect, n, alpha, jenis_uji, ratio, sd_ratio, p0, size):
+    """Satu blok simulasi: effect/n/alpha berbentuk (sel, 1), hasil keputusan (sel, size)."""
+    shape = (len(n), size)
+
+    def sample_var(df, scale=1.0):
+        return scale**2 * rng.chisquare(df, shape) / df
+
+    if test == "z":
+        mean = rng.normal(effect, 1 / np.sqrt(n), shape)
+        return engine.z_test_from_moments(n, mean, 0.0, 1.0, alpha, jenis_uji).reject
+    if test in ("t", "paired"):
+        mean = rng.normal(effect, 1 / np.sqrt(n), shape)
+        return engine.t_test_from_moments(n, mean, sample_var(n - 1), 0.0, alpha, jenis_uji).reject
+    if test in ("pooled", "welch"):
+        n2 = _second_n(n, ratio)
+        s2 = sd_ratio if test == "welch" else 1.0
+        mean1 = rng.normal(effect, 1 / np.sqrt(n), shape)
+        mean2 = rng.normal(0.0, s2 / np.sqrt(n2), shape)
+        run = engine.welch_t_test_from_moments if test == "welch" else engine.pooled_t_test_from_moments
+        return run(n, mean1, sample_var(n - 1), n2, mean2, sample_var(n2 - 1, s2), alpha, jenis_uji).reject
+    if test == "f":
+        n2 = _second_n(n, ratio)
+        return engine.f_test_from_moments(n, sample_var(n - 1, np.sqrt(effect)), n2, sample_var(n2 - 1), alpha).reject
+    if test == "proportion_1":
+        x = rng.binomial(n.astype(np.int64), p0 + effect, shape)
+        return engine.proportion_test_1(x, n, p0, alpha, jenis_uji).reject
+    if test == "proportion_2":
+        n2 = _second_n(n, ratio)
+        x1 = rng.binomial(n.astype(np.int64), p0 + effect, shape)
+        x2 = rng.binomial(n2.astype(np.int64), p0, shape)
+        return engine.proportion_test_2(x1, n, x2, n2, alpha, jenis_uji).reject
+    raise ValueError(f"Uji tidak dikenal: {test}")
+
+
+def _simulate_cells(test, effect, n, alpha, jenis_uji, ratio, sd_ratio, p0, n_sims, seed):
+    """Power simulasi untuk sekumpulan sel grid (array 1-D) dengan satu seed."""
+    rng = np.random.default_rng(seed)
+    effect, n, alpha = effect[:, None], n[:, None], alpha[:, None]
+    hits = np.zeros(len(n))
+    step = max(1, BLOCK_ELEMENTS // len(n))
+    for start in range(0, n_sims, step):
+        size = min(step, n_sims - start)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reject = _draw_reject(test, rng, effect, n, alpha, jenis_uji, ratio, sd_ratio, p0, size)
+        hits += np.sum(reject, axis=1)
+    return hits / n_sims
+
+
+def simulate_power(test, effect, n, alpha, jenis_uji="Two-sided", ratio=1.0, sd_ratio=1.0, p0=0.5,
+                   n_sims=10_000, seed=None, workers=1):
+    """
+    Power Monte Carlo; sel grid dibagi menjadi tugas ber-seed (SeedSequence.spawn)
+    sehingga hasilnya sama berapa pun jumlah workers.
+    """
+    effect, n, alpha = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (effect, n, alpha)))
+    shape = effect.shape
+    cells = [a.ravel() for a in (effect, n, alpha)]
+    bounds = list(range(0, len(cells[0]), CELLS_PER_TASK))
+    seeds = np.random.SeedSequence(seed).spawn(len(bounds))
+    tasks = [(test, *(c[b:b + CELLS_PER_TASK] for c in cells), jenis_uji, ratio, sd_ratio, p0, n_sims, s)
+             for b, s in zip(bounds, seeds)]
+
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_cells, *zip(*tasks)))
+    else:
+        parts = [_simulate_cells(*t) for t in tasks]
+    return np.concatenate(parts).reshape(shape)[()]
+
+
+def power(test, effect, n, alpha, jenis_uji="Two-sided", method="auto", **kwargs):
+    """Power uji; method 'auto' memakai rumus tertutup bila ada, selain itu simulasi."""
+    if method == "auto":
+        method = "analytic" if test in CLOSED_FORM else "simulate"
+    if method == "analytic":
+        sim_only = ("n_sims", "seed", "workers")
+        return analytic_power(test, effect, n, alpha, jenis_uji,
+                              **{k: v for k, v in kwargs.items() if k not in sim_only})
+    return simulate_power(test, effect, n, alpha, jenis_uji, **kwargs)
+
+
+def power_grid(test, effects, ns, alphas, jenis_uji="Two-sided", **kwargs):
+    """Power untuk grid effect x n x alpha dalam satu panggilan; hasil berbentuk (E, N, A)."""
+    effects = np.asarray(effects, dtype=float)[:, None, None]
+    ns = np.asarray(ns, dtype=float)[None, :, None]
+    alphas = np.asarray(alphas, dtype=float)[None, None, :]
+    return power(test, effects, ns, alphas, jenis_uji, **kwargs)
+
+
+def sample_size(test, effect, target=0.8, alpha=0.05, jenis_uji="Two-sided", max_n=10**7, **kwargs):
+    """
+    n (grup 1) terkecil dengan power >= target; None bila tidak tercapai hingga max_n.
+    Pencarian eksponensial lalu biseksi; untuk Welch, seed simulasi sebaiknya tetap.
+    """
+    def reach(n):
+        return power(test, effect, n, alpha, jenis_uji, **kwargs) >= target
+
+    lo, hi = 2, 4
+    while not reach(hi):
+        if hi >= max_n:
+            return None
+        lo, hi = hi, min(hi * 2, max_n)
+    if reach(lo):
+        return lo
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if reach(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
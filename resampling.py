@@ -0,0 +1,183 @@
+# resampling.py
+"""
+Uji permutasi dan bootstrap untuk uji t dua sampel (pooled/Welch) dan paired.
+
+Resampling dikerjakan dalam blok besar tervektorisasi dengan
+numpy.random.Generator ber-seed. Total resample dibagi menjadi tugas-tugas
+dengan SeedSequence turunan masing-masing, sehingga hasilnya sama berapa
+pun jumlah proses yang dipakai. Jika `tol` diberikan, perhitungan berhenti
+lebih awal begitu galat Monte Carlo p-value (standard error) < tol.
+
+- Permutasi dua sampel : label grup diacak (rng.permuted per baris).
+- Permutasi paired     : tanda selisih dibalik acak (bit acak + perkalian matriks).
+- Bootstrap            : resample dengan pengembalian dari data yang sudah
+                         digeser ke H0 (Efron & Tibshirani, 1993, bab 16).
+"""
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import engine
+
+
+TASK_SIZE = 2000
+BLOCK_ELEMENTS = 4_000_000
+
+ResamplingResult = namedtuple(
+    "ResamplingResult",
+    ["method", "stat", "p_val", "n_resamples", "mc_se", "stopped_early"],
+)
+
+
+def _t_two_sample(n1, s1, q1, n2, s2, q2, statistic):
+    mean1, mean2 = s1 / n1, s2 / n2
+    var1 = (q1 - s1 * mean1) / (n1 - 1)
+    var2 = (q2 - s2 * mean2) / (n2 - 1)
+    if statistic == "pooled":
+        se = np.sqrt(((n1 - 1)*var1 + (n2 - 1)*var2) / (n1 + n2 - 2) * (1/n1 + 1/n2))
+    else:
+        se = np.sqrt(var1/n1 + var2/n2)
+    return (mean1 - mean2) / se
+
+
+def _t_one_sample(n, s, q):
+    mean = s / n
+    var = (q - s * mean) / (n - 1)
+    return mean / np.sqrt(var / n)
+
+
+def _count_extreme(t_star, t_obs, tail):
+    eps = 1e-12 * max(1.0, abs(t_obs))
+    if tail == "two":
+        return int(np.sum(np.abs(t_star) >= abs(t_obs) - eps))
+    if tail == "right":
+        return int(np.sum(t_star >= t_obs - eps))
+    return int(np.sum(t_star <= t_obs + eps))
+
+
+def _resample_task(kind, statistic, tail, t_obs, arrays, size, seed):
+    """Satu tugas: `size` resample, dikerjakan per blok yang dibatasi memori."""
+    rng = np.random.default_rng(seed)
+    count = 0
+
+    if kind == "perm2":
+        pooled, n1 = arrays
+        n2 = len(pooled) - n1
+        s_tot, q_tot = pooled.sum(), (pooled * pooled).sum()
+        step = max(1, BLOCK_ELEMENTS // len(pooled))
+        for start in range(0, size, step):
+            b = min(step, size - start)
+            g1 = rng.permuted(np.broadcast_to(pooled, (b, len(pooled))), axis=1)[:, :n1]
+            s1, q1 = g1.sum(axis=1), (g1 * g1).sum(axis=1)
+            t_star = _t_two_sample(n1, s1, q1, n2, s_tot - s1, q_tot - q1, statistic)
+            count += _count_extreme(t_star, t_obs, tail)
+
+    elif kind == "boot2":
+        x1, x2 = arrays
+        step = max(1, BLOCK_ELEMENTS // (len(x1) + len(x2)))
+        for start in range(0, size, step):
+            b = min(step, size - start)
+            r1 = x1[rng.integers(0, len(x1), (b, len(x1)), dtype=np.int32)]
+            r2 = x2[rng.integers(0, len(x2), (b, len(x2)), dtype=np.int32)]
+            t_star = _t_two_sample(len(x1), r1.sum(axis=1), (r1 * r1).sum(axis=1),
+                                   len(x2), r2.sum(axis=1), (r2 * r2).sum(axis=1), statistic)
+            count += _count_extreme(t_star, t_obs, tail)
+
+    elif kind == "perm_paired":
+        (d,) = arrays
+        n = len(d)
+        n_bytes = math.ceil(n / 8)
+        s_tot, q = d.sum(), (d * d).sum()
+        d32 = d.astype(np.float32)
+        step = max(1, BLOCK_ELEMENTS // n)
+        for start in range(0, size, step):
+            b = min(step, size - start)
+            bits = np.unpackbits(rng.integers(0, 256, (b, n_bytes), dtype=np.uint8), axis=1, count=n)
+            s = 2 * (bits.astype(np.float32) @ d32).astype(float) - s_tot
+            count += _count_extreme(_t_one_sample(n, s, q), t_obs, tail)
+
+    else:  # boot_paired
+        (d,) = arrays
+        n = len(d)
+        step = max(1, BLOCK_ELEMENTS // n)
+        for start in range(0, size, step):
+            b = min(step, size - start)
+            r = d[rng.integers(0, n, (b, n), dtype=np.int32)]
+            count += _count_extreme(_t_one_sample(n, r.sum(axis=1), (r * r).sum(axis=1)), t_obs, tail)
+
+    return count
+
+
+def _run(kind, statistic, tail, t_obs, arrays, n_resamples, seed, workers, tol):
+    n_tasks = math.ceil(n_resamples / TASK_SIZE)
+    sizes = [min(TASK_SIZE, n_resamples - i * TASK_SIZE) for i in range(n_tasks)]
+    seeds = np.random.SeedSequence(seed).spawn(n_tasks)
+    workers = max(1, workers or 1)
+
+    count = done = 0
+    stopped = False
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for wave in range(0, n_tasks, workers):
+            idx = range(wave, min(wave + workers, n_tasks))
+            args = [(kind, statistic, tail, t_obs, arrays, sizes[i], seeds[i]) for i in idx]
+            if pool is None:
+                counts = [_resample_task(*a) for a in args]
+            else:
+                counts = list(pool.map(_resample_task, *zip(*args)))
+            count += sum(counts)
+            done += sum(sizes[i] for i in idx)
+
+            p = (count + 1) / (done + 1)
+            if tol and done < n_resamples and math.sqrt(p * (1 - p) / done) < tol:
+                stopped = True
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    p = (count + 1) / (done + 1)
+    return p, done, math.sqrt(p * (1 - p) / done), stopped
+
+
+def two_sample_test(d1, d2, method="permutation", statistic="welch", jenis_uji="Two-sided",
+                    n_resamples=10000, seed=None, workers=1, tol=None):
+    """
+    P-value permutasi/bootstrap untuk uji t dua sampel independen.
+    `statistic` = 'welch' atau 'pooled' (rumus sama dengan engine).
+    """
+    d1, d2 = np.asarray(d1, dtype=float), np.asarray(d2, dtype=float)
+    tail = engine.tail_of(jenis_uji)
+    center = np.concatenate([d1, d2]).mean()
+    x1, x2 = d1 - center, d2 - center
+    t_obs = float(_t_two_sample(len(x1), x1.sum(), (x1 * x1).sum(), len(x2), x2.sum(), (x2 * x2).sum(), statistic))
+
+    if method == "permutation":
+        kind, arrays = "perm2", (np.concatenate([x1, x2]), len(x1))
+    elif method == "bootstrap":
+        kind, arrays = "boot2", (x1 - x1.mean(), x2 - x2.mean())
+    else:
+        raise ValueError(f"Metode resampling tidak dikenal: {method}")
+
+    p, done, se, stopped = _run(kind, statistic, tail, t_obs, arrays, n_resamples, seed, workers, tol)
+    return ResamplingResult(method, t_obs, p, done, se, stopped)
+
+
+def paired_test(d1, d2, method="permutation", jenis_uji="Two-sided",
+                n_resamples=10000, seed=None, workers=1, tol=None):
+    """P-value permutasi (sign-flip) / bootstrap untuk paired t-test pada selisih d1 - d2."""
+    diff = np.asarray(d1, dtype=float) - np.asarray(d2, dtype=float)
+    tail = engine.tail_of(jenis_uji)
+    t_obs = float(_t_one_sample(len(diff), diff.sum(), (diff * diff).sum()))
+
+    if method == "permutation":
+        kind, arrays = "perm_paired", (diff,)
+    elif method == "bootstrap":
+        kind, arrays = "boot_paired", (diff - diff.mean(),)
+    else:
+        raise ValueError(f"Metode resampling tidak dikenal: {method}")
+
+    p, done, se, stopped = _run(kind, "t", tail, t_obs, arrays, n_resamples, seed, workers, tol)
+    return ResamplingResult(method, t_obs, p, done, se, stopped)
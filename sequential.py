@@ -0,0 +1,196 @@
+# sequential.py
+"""
+Monitoring sekuensial A/B untuk uji dua proporsi (pooled z).
+
+Setiap event (grup, sukses) atau baris pembaruan hitungan (dx1, dn1, dx2,
+dn2) dilipat ke State berisi X1, n1, X2, n2 dengan biaya O(1) per event:
+sebuah batch diproses dengan cumsum, lalu z dan batas penolakan dihitung
+untuk setiap event sekaligus. Keputusan tetap valid walaupun hasil dilihat
+terus-menerus, karena batasnya dirancang untuk pengamatan kontinu:
+
+- 'msprt': mixture SPRT (prior normal N(0, tau²) pada selisih proporsi).
+  Tolak H0 saat rasio likelihood campuran >= 1/alpha; p-value selalu-valid
+  = min atas waktu dari 1/rasio. Tidak butuh ukuran sampel rencana, hanya
+  dua arah.
+- 'obf': alpha-spending tipe O'Brien-Fleming (Lan-DeMets) terhadap fraksi
+  informasi t = n / planned_n, dengan batas z >= c / sqrt(t). Untuk
+  pengamatan kontinu (gerak Brown) c = z_(alpha/2) memberi peluang
+  menyeberang tepat alpha (prinsip refleksi); dua arah memakai alpha/2 per
+  sisi. Pengamatan diskret membuatnya sedikit konservatif.
+"""
+import math
+import queue
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from scipy import stats
+
+import engine
+
+
+METHODS = {"msprt": "mSPRT (tanpa ukuran sampel rencana)", "obf": "Alpha-spending O'Brien-Fleming"}
+
+State = namedtuple("State", ["x1", "n1", "x2", "n2", "n_events", "p_always", "reject_at"])
+Trace = namedtuple("Trace", ["n_events", "z", "bound", "p_always"])
+
+EMPTY = State(0, 0, 0, 0, 0, 1.0, -1)
+
+
+def pooled_z(x1, n1, x2, n2):
+    """(z, varians selisih di bawah H0); sama dengan engine.proportion_test_2."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p_pool = (x1 + x2) / (n1 + n2)
+        var = p_pool * (1 - p_pool) * (1 / n1 + 1 / n2)
+        z = (x1 / n1 - x2 / n2) / np.sqrt(var)
+    return z, var
+
+
+def _log_mixture_lr(z, var, tau):
+    tau2 = tau * tau
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 0.5 * np.log(var / (var + tau2)) + z * z * tau2 / (2 * (var + tau2))
+
+
+@lru_cache(maxsize=64)
+def _obf_c(alpha, tail):
+    return float(stats.norm.isf(alpha / 4 if tail == "two" else alpha / 2))
+
+
+def boundary(method, var, n_total, alpha=0.05, tau=0.02, planned_n=None, tail="two"):
+    """Batas |z| (atau z searah uji) untuk setiap titik pengamatan."""
+    if method == "msprt":
+        tau2 = tau * tau
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt((var + tau2) / tau2 * (2 * np.log(1 / alpha) + np.log((var + tau2) / var)))
+    if method == "obf":
+        if not planned_n:
+            raise ValueError("Metode 'obf' membutuhkan planned_n (total sampel rencana).")
+        c = _obf_c(alpha, tail)
+        t = np.minimum(np.asarray(n_total, dtype=float) / planned_n, 1.0)
+        with np.errstate(divide="ignore"):
+            return c / np.sqrt(t)
+    raise ValueError(f"Metode sekuensial tidak dikenal: {method}")
+
+
+def update_counts(state, dx1, dn1, dx2, dn2, method="msprt", alpha=0.05, tau=0.02, planned_n=None,
+                  jenis_uji="Two-sided", trace=False):
+    """
+    Melipat satu batch pembaruan hitungan (array sama panjang, satu elemen per
+    event/baris) ke `state`. Mengembalikan State baru, atau (State, Trace)
+    bila trace=True.
+    """
+    tail = "two" if method == "msprt" else engine.tail_of(jenis_uji)
+    x1 = state.x1 + np.cumsum(dx1, dtype=np.int64)
+    n1 = state.n1 + np.cumsum(dn1, dtype=np.int64)
+    x2 = state.x2 + np.cumsum(dx2, dtype=np.int64)
+    n2 = state.n2 + np.cumsum(dn2, dtype=np.int64)
+    if not len(n1):
+        return (state, Trace(*(np.empty(0) for _ in Trace._fields))) if trace else state
+
+    z, var = pooled_z(x1, n1, x2, n2)
+    n_total = n1 + n2
+    bound = boundary(method, var, n_total, alpha, tau, planned_n, tail)
+    valid = (n1 > 0) & (n2 > 0) & (var > 0)
+    with np.errstate(invalid="ignore"):
+        stat = np.abs(z) if tail == "two" else z if tail == "right" else -z
+        hit = valid & (stat >= bound)
+
+    if method == "msprt":
+        p_step = np.where(valid, np.minimum(np.exp(-_log_mixture_lr(z, var, tau)), 1.0), 1.0)
+        p_always = np.minimum.accumulate(np.minimum(p_step, state.p_always))
+    else:
+        p_always = np.full(len(n1), np.nan)
+
+    reject_at = state.reject_at
+    if reject_at < 0 and hit.any():
+        reject_at = state.n_events + int(np.argmax(hit)) + 1
+
+    new = State(int(x1[-1]), int(n1[-1]), int(x2[-1]), int(n2[-1]), state.n_events + len(n1),
+                float(p_always[-1]), reject_at)
+    if trace:
+        return new, Trace(state.n_events + np.arange(1, len(n1) + 1), z, bound, p_always)
+    return new
+
+
+def step(state, arm, success, method="msprt", alpha=0.05, tau=0.02, planned_n=None, jenis_uji="Two-sided"):
+    """Satu event tanpa NumPy (jalur skalar untuk event yang datang satu per satu)."""
+    x1, n1, x2, n2 = state.x1, state.n1, state.x2, state.n2
+    if arm:
+        x2, n2 = x2 + success, n2 + 1
+    else:
+        x1, n1 = x1 + success, n1 + 1
+    p_always, reject_at, n_events = state.p_always, state.reject_at, state.n_events + 1
+    if n1 and n2 and 0 < x1 + x2 < n1 + n2:
+        p_pool = (x1 + x2) / (n1 + n2)
+        var = p_pool * (1 - p_pool) * (1 / n1 + 1 / n2)
+        z = (x1 / n1 - x2 / n2) / math.sqrt(var)
+        if method == "msprt":
+            tau2 = tau * tau
+            log_lr = 0.5 * math.log(var / (var + tau2)) + z * z * tau2 / (2 * (var + tau2))
+            p_always = min(p_always, math.exp(-log_lr))
+            hit = log_lr >= -math.log(alpha)
+        elif method == "obf":
+            p_always = math.nan
+            tail = engine.tail_of(jenis_uji)
+            stat = abs(z) if tail == "two" else z if tail == "right" else -z
+            hit = stat * math.sqrt(min((n1 + n2) / planned_n, 1.0)) >= _obf_c(alpha, tail)
+        else:
+            raise ValueError(f"Metode sekuensial tidak dikenal: {method}")
+        if hit and reject_at < 0:
+            reject_at = n_events
+    return State(x1, n1, x2, n2, n_events, p_always, reject_at)
+
+
+def update_events(state, arm, success, **kwargs):
+    """Event individual: arm 0 = sampel 1 (A), 1 = sampel 2 (B); success 0/1."""
+    arm = np.asarray(arm, dtype=bool)
+    success = np.asarray(success, dtype=np.int64)
+    a = (~arm).astype(np.int64)
+    b = arm.astype(np.int64)
+    return update_counts(state, success * a, a, success * b, b, **kwargs)
+
+
+def drain(q, state, max_batch=65536, **kwargs):
+    """Mengambil semua event (arm, success) yang sudah ada di queue lokal, tanpa menunggu."""
+    items = []
+    try:
+        while len(items) < max_batch:
+            items.append(q.get_nowait())
+    except queue.Empty:
+        pass
+    if not items:
+        return state
+    arm, success = np.array(items, dtype=np.int64).T
+    return update_events(state, arm, success, **kwargs)
+
+
+def to_arm(labels):
+    """Label grup -> 0 (A / 1) atau 1 (B / 2)."""
+    labels = np.char.upper(np.char.strip(np.asarray(labels).astype(str)))
+    arm = np.isin(labels, ["B", "2", "2.0"])
+    if not np.all(arm | np.isin(labels, ["A", "1", "1.0"])):
+        raise ValueError("Kolom grup harus berisi A/B atau 1/2.")
+    return arm
+
+
+def read_updates(file_obj, chunksize=1_000_000):
+    """
+    Membaca file CSV pembaruan per blok. Format yang diterima:
+    kolom 'grup' (A/B atau 1/2) + 'sukses' (0/1) per event, atau
+    kolom x1, n1, x2, n2 berisi pertambahan hitungan per baris.
+    Menghasilkan tuple (dx1, dn1, dx2, dn2) per blok.
+    """
+    import pandas as pd
+
+    for chunk in pd.read_csv(file_obj, chunksize=chunksize):
+        cols = {c.strip().lower(): c for c in chunk.columns}
+        if {"x1", "n1", "x2", "n2"} <= cols.keys():
+            yield tuple(chunk[cols[c]].to_numpy(dtype=np.int64) for c in ("x1", "n1", "x2", "n2"))
+        elif {"grup", "sukses"} <= cols.keys():
+            arm = to_arm(chunk[cols["grup"]].to_numpy())
+            success = chunk[cols["sukses"]].to_numpy(dtype=np.int64)
+            a, b = (~arm).astype(np.int64), arm.astype(np.int64)
+            yield success * a, a, success * b, b
+        else:
+            raise ValueError("File harus memiliki kolom grup & sukses, atau x1, n1, x2, n2.")
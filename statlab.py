@@ -0,0 +1,226 @@
+# statlab.py
+"""
+CLI batch StatLab: menjalankan uji hipotesis tanpa browser.
+
+    python statlab.py run --test welch --config jobs.yaml --output hasil.jsonl
+
+Contoh jobs.yaml (JSON juga diterima):
+
+    test: welch              # default; bisa ditimpa --test atau per job
+    alpha: 0.05
+    jenis_uji: Two-sided
+    jobs:
+      - name: a_vs_b
+        data1: {file: data/a.csv, column: waktu}
+        data2: {file: data/b.csv, column: waktu}
+      - files: "data/harian/*.parquet"   # satu job per file, dua kolom dari file yang sama
+        columns: [kontrol, varian]
+      - test: z
+        data1: {file: data/x.csv}
+        mu0: 50
+        sigma: 10
+      - test: proportion_2
+        x1: 150
+        n1: 200
+        x2: 162
+        n2: 300
+
+Uji: z, t, pooled, welch, paired, f, proportion_1, proportion_2. File (CSV,
+Parquet, Arrow/Feather, atau .npy) dibaca sebagai Moments
+(ingest.sharded_moments), kecuali paired yang butuh data mentah. Job
+dijalankan paralel di ProcessPoolExecutor; hasil ditulis per baris (JSON
+Lines) sesuai urutan job, atau Parquet bila --output berakhiran .parquet. Job yang gagal tetap tercatat dengan kolom "error".
+
+Kolom log10_p berisi log10 p-value yang tetap terhingga untuk statistik
+ekstrem (p_val sendiri bisa 0), sehingga hasil dapat diurutkan/disaring.
+
+Dengan --correction (bonferroni/holm/bh/by) seluruh hasil dikumpulkan dulu,
+lalu ditambah kolom p_adj dan reject_adj (lihat multitest).
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import critical_values
+import engine
+import ingest
+import multitest
+
+
+TESTS = ("z", "t", "pooled", "welch", "paired", "f", "proportion_1", "proportion_2")
+
+
+def load_config(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        import yaml
+
+        return yaml.safe_load(f)
+
+
+def expand_jobs(config, test=None):
+    """Mengurai config menjadi daftar job datar; `files` + `columns` dipecah per file."""
+    defaults = {k: v for k, v in config.items() if k != "jobs"}
+    if test:
+        defaults["test"] = test
+    jobs = []
+    for i, job in enumerate(config.get("jobs", [])):
+        job = {**defaults, **job}
+        pattern = job.pop("files", None)
+        if pattern is None:
+            job.setdefault("name", f"job{i}")
+            jobs.append(job)
+            continue
+        col1, col2 = job.pop("columns", None) or (None, None)
+        prefix = f"{job['name']}:" if "name" in job else ""
+        for path in sorted(glob.glob(pattern)):
+            jobs.append({**job, "name": prefix + os.path.basename(path),
+                         "data1": {"file": path, "column": col1},
+                         "data2": {"file": path, "column": col2}})
+    return jobs
+
+
+def _moments(spec):
+    m, column = ingest.sharded_moments(spec["file"], spec.get("column"), workers=1)
+    return m, column
+
+
+def _raw(spec):
+    import pandas as pd
+
+    if ingest.is_columnar(spec["file"]):
+        return ingest.read_column(spec["file"], column=spec.get("column"))
+    df = pd.read_csv(spec["file"], usecols=[spec["column"]] if spec.get("column") else None)
+    column = spec.get("column") or ingest.first_numeric_column(df)
+    return df[column].to_numpy(dtype=float), column
+
+
+def _plain(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def run_job(job):
+    """Menjalankan satu job; mengembalikan dict hasil (atau dict dengan 'error')."""
+    test = job.get("test")
+    alpha = float(job.get("alpha", 0.05))
+    jenis_uji = job.get("jenis_uji", "Two-sided")
+    record = {"name": job.get("name"), "test": test}
+    try:
+        if test not in TESTS:
+            raise ValueError(f"Uji tidak dikenal: {test}")
+
+        if test == "proportion_1":
+            res = engine.proportion_test_1(job["x"], job["n"], job["pi0"], alpha, jenis_uji)
+            record.update(n1=job["n"])
+        elif test == "proportion_2":
+            res = engine.proportion_test_2(job["x1"], job["n1"], job["x2"], job["n2"], alpha, jenis_uji)
+            record.update(n1=job["n1"], n2=job["n2"])
+        elif test == "paired":
+            d1, col1 = _raw(job["data1"])
+            d2, col2 = _raw(job["data2"])
+            if len(d1) != len(d2):
+                raise ValueError("Jumlah data paired harus sama.")
+            res = engine.paired_t_test(d1, d2, alpha, jenis_uji)
+            record.update(file1=job["data1"]["file"], column1=col1, file2=job["data2"]["file"], column2=col2,
+                          n1=len(d1), n2=len(d2))
+        else:
+            m1, col1 = _moments(job["data1"])
+            record.update(file1=job["data1"]["file"], column1=col1, n1=m1.n)
+            if test == "z":
+                res = engine.z_test_1(m1, float(job.get("mu0", 0)), float(job["sigma"]), alpha, jenis_uji)
+            elif test == "t":
+                res = engine.t_test_1(m1, float(job.get("mu0", 0)), alpha, jenis_uji)
+            else:
+                m2, col2 = _moments(job["data2"])
+                record.update(file2=job["data2"]["file"], column2=col2, n2=m2.n)
+                if test == "pooled":
+                    res = engine.pooled_t_test(m1, m2, alpha, jenis_uji)
+                elif test == "welch":
+                    res = engine.welch_t_test(m1, m2, alpha, jenis_uji)
+                else:
+                    res = engine.f_test(m1, m2, alpha)
+
+        dist = "f" if test == "f" else "normal" if test in ("z", "proportion_1", "proportion_2") else "t"
+        tail = "two" if test == "f" else engine.tail_of(jenis_uji)
+        record.update(alpha=alpha, jenis_uji="Two-sided" if test == "f" else jenis_uji,
+                      **{k: _plain(v) for k, v in res._asdict().items()},
+                      log10_p=float(critical_values.log_p_value(dist, res.stat, tail, res.df1, res.df2)) / np.log(10))
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return {k: _plain(v) for k, v in record.items()}
+
+
+def run_jobs(jobs, workers=None):
+    """Generator hasil sesuai urutan job; workers=1 berjalan serial."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        yield from map(run_job, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_job, jobs, chunksize=max(1, len(jobs) // (4 * workers)))
+
+
+def apply_correction(results, method, alpha=0.05):
+    """Menambahkan p_adj dan reject_adj ke setiap hasil; job gagal mendapat None."""
+    results = list(results)
+    p = np.array([r.get("p_val", np.nan) for r in results], dtype=float)
+    reject, p_adj = multitest.decide(p, alpha, method)
+    for r, rej, adj in zip(results, reject, p_adj):
+        ok = not np.isnan(adj)
+        r.update(correction=method, p_adj=float(adj) if ok else None, reject_adj=bool(rej) if ok else None)
+    return results
+
+
+def write_results(results, output):
+    n = n_err = 0
+    if output.lower().endswith(".parquet"):
+        import pandas as pd
+
+        rows = list(results)
+        pd.DataFrame(rows).to_parquet(output, index=False)
+        n, n_err = len(rows), sum("error" in r for r in rows)
+        return n, n_err
+
+    f = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    try:
+        for r in results:
+            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+            n += 1
+            n_err += "error" in r
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    return n, n_err
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="statlab", description="StatLab batch hypothesis testing")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="jalankan job dari file config")
+    run.add_argument("--config", required=True, help="file YAML/JSON berisi daftar job")
+    run.add_argument("--test", choices=TESTS, help="uji default untuk job tanpa kolom 'test'")
+    run.add_argument("--output", default="-", help="file .jsonl / .parquet (default: stdout)")
+    run.add_argument("--workers", type=int, default=None, help="jumlah proses (default: semua CPU)")
+    run.add_argument("--correction", choices=list(multitest.METHODS), help="koreksi multiple testing atas semua job")
+    run.add_argument("--correction-alpha", type=float, default=0.05, help="alpha keluarga/FDR untuk --correction")
+    args = parser.parse_args(argv)
+
+    jobs = expand_jobs(load_config(args.config), args.test)
+    results = run_jobs(jobs, args.workers)
+    if args.correction:
+        results = apply_correction(results, args.correction, args.correction_alpha)
+    n, n_err = write_results(results, args.output)
+    print(f"{n} job selesai, {n_err} gagal.", file=sys.stderr)
+    return 1 if n_err else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# summary_cache.py
+"""
+Cache ringkasan statistik per dataset, dikunci dengan hash isi data.
+
+Setiap dataset (array NumPy) di-hash (BLAKE2b atas dtype, shape dan byte
+datanya). Di bawah kunci tersebut disimpan hasil-hasil turunan seperti
+Moments dan hasil uji normalitas, sehingga mengganti alpha, arah uji, atau
+berpindah halaman uji dengan data yang sama tidak menghitung ulang apa pun.
+
+Cache berlaku per proses (dibagi antar sesi Streamlit), dibatasi jumlah
+entri (LRU) dan perkiraan total memori.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import moments
+
+
+MAX_ENTRIES = 256
+MAX_BYTES = 32 * 1024**2
+
+_cache = OrderedDict()
+_sizes = {}
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+
+def dataset_key(data):
+    data = np.ascontiguousarray(data)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{data.dtype.str}{data.shape}".encode())
+    h.update(memoryview(data).cast("B"))
+    return h.hexdigest()
+
+
+def _sizeof(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _evict():
+    while _cache and (len(_cache) > MAX_ENTRIES or _stats["bytes"] > MAX_BYTES):
+        key, _ = _cache.popitem(last=False)
+        _stats["bytes"] -= _sizes.pop(key)
+        _stats["evictions"] += 1
+
+
+def lookup(data, name, compute, key=None):
+    """
+    Mengembalikan hasil `name` untuk dataset `data`; `compute()` hanya
+    dipanggil saat belum ada di cache. `key` dapat diberikan jika hash
+    dataset sudah dihitung sebelumnya.
+    """
+    key = key or dataset_key(data)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and name in entry:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return entry[name]
+        _stats["misses"] += 1
+
+    value = compute()
+
+    with _lock:
+        entry = _cache.setdefault(key, {})
+        _cache.move_to_end(key)
+        entry[name] = value
+        size = _sizeof(entry)
+        _stats["bytes"] += size - _sizes.get(key, 0)
+        _sizes[key] = size
+        _evict()
+    return value
+
+
+def summary(data):
+    """Moments dataset (n, mean, M2, min, max) dengan cache."""
+    if isinstance(data, moments.Moments):
+        return data
+    return lookup(data, "moments", lambda: moments.from_array(data))
+
+
+def info():
+    with _lock:
+        return dict(_stats, entries=len(_cache))
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+        _sizes.clear()
+        _stats.update(hits=0, misses=0, evictions=0, bytes=0)
@@ -0,0 +1,87 @@
+# tests/test_ai_cache.py
+"""Cache jawaban AI Consultant (ai_cache + consultant.stream_case) dengan model tiruan, tanpa jaringan."""
+from types import SimpleNamespace
+
+import pytest
+
+import ai_cache
+import consultant
+
+
+class FakeModel:
+    """Meniru GenerativeModel.generate_content(..., stream=True) dan menghitung panggilan."""
+
+    def __init__(self, chunks=("**Rekomendasi Uji**: ", "Welch t-test"), finish="STOP"):
+        self.chunks = chunks
+        self.finish = finish
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.calls += 1
+        model = self
+
+        class Response:
+            candidates = [SimpleNamespace(finish_reason=SimpleNamespace(name=model.finish))]
+
+            def __iter__(self):
+                return iter(SimpleNamespace(text=c) for c in model.chunks)
+
+        return Response()
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "ai.sqlite3")
+    monkeypatch.setattr(ai_cache, "CACHE_PATH", path)
+    ai_cache.clear(path)
+    return path
+
+
+def ask(case, model, **kwargs):
+    return "".join(consultant.stream_case(case, model, timeout=5, **kwargs))
+
+
+def test_normalized_case_hits(cache_path):
+    model = FakeModel()
+    text = ask("Membandingkan rata-rata  waktu tunggu dua cabang bank.", model)
+    again = ask("  membandingkan RATA-RATA waktu tunggu dua cabang bank. ", model)
+    assert again == text == "**Rekomendasi Uji**: Welch t-test"
+    assert model.calls == 1
+
+
+def test_other_model_name_misses(cache_path):
+    model = FakeModel()
+    ask("kasus", model)
+    ask("kasus", model, model_name="model-lain")
+    assert model.calls == 2
+
+
+@pytest.mark.parametrize("model", [FakeModel(chunks=()), FakeModel(finish="MAX_TOKENS")])
+def test_empty_or_truncated_answer_not_cached(cache_path, model):
+    ask("kasus", model)
+    assert ai_cache.get("kasus", consultant.MODEL_NAME) is None
+    ask("kasus", model)
+    assert model.calls == 2
+
+
+def test_expired_entry_misses(cache_path):
+    ai_cache.put("kasus", "m", "jawaban")
+    assert ai_cache.get("kasus", "m") == "jawaban"
+    assert ai_cache.get("kasus", "m", ttl=0) is None
+
+
+def test_lru_eviction(cache_path):
+    for i in range(10):
+        ai_cache.put(f"kasus {i}", "m", f"jawaban {i}", max_entries=5)
+    assert ai_cache.size() == 5
+    assert ai_cache.get("kasus 9", "m") == "jawaban 9"
+    assert ai_cache.get("kasus 0", "m") is None
+
+
+def test_model_keeps_its_own_api_key():
+    pytest.importorskip("google.generativeai")
+    m1 = consultant.get_model("kunci-1", "models/tiruan")
+    m2 = consultant.get_model("kunci-2", "models/tiruan")
+    assert consultant.get_model("kunci-1", "models/tiruan") is m1
+    assert m1._client._client_options.api_key == "kunci-1"
+    assert m2._client._client_options.api_key == "kunci-2"
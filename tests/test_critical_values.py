@@ -0,0 +1,53 @@
+# tests/test_critical_values.py
+"""Regresi log p-value di ekor sangat dalam untuk df besar (df >= 1e5)."""
+import numpy as np
+import pytest
+from scipy import integrate, stats
+
+import content
+import critical_values
+
+
+def _log_sf_quad(dist, stat, *df):
+    """Referensi: log ∫ pdf dari stat ke tak hingga, dihitung relatif terhadap pdf(stat)."""
+    d = {"t": stats.t, "f": stats.f}[dist]
+    log_pdf0 = d.logpdf(stat, *df)
+    value, _ = integrate.quad(lambda u: np.exp(d.logpdf(u, *df) - log_pdf0), stat, np.inf,
+                              limit=500, epsabs=0, epsrel=1e-12)
+    return log_pdf0 + np.log(value)
+
+
+@pytest.mark.parametrize("dist, stat, df", [
+    ("t", 38.0, (1e6,)),
+    ("t", 40.0, (1e6,)),
+    ("t", 69.0, (2e6,)),
+    ("f", 2.0, (1e5, 1e5)),
+    ("f", 50.0, (1e5, 1e5)),
+    ("f", 1e3, (1e5, 1e5)),
+    ("f", 2.25, (2e5, 2e5)),
+])
+def test_deep_tail_large_df(dist, stat, df):
+    log_p = critical_values.log_p_value(dist, stat, "right", *df)
+    assert np.isfinite(log_p)
+    assert log_p < -690
+    assert log_p == pytest.approx(_log_sf_quad(dist, stat, *df), rel=1e-9)
+
+
+def test_two_sided_f_large_df_not_one():
+    # 200k vs 200k, sd 1 vs 1.5: p dua arah sangat kecil, bukan log p = 0
+    log_p = critical_values.log_p_value("f", 1.5**2, "two", 2e5 - 1, 2e5 - 1)
+    assert np.isfinite(log_p) and log_p < -1e4
+
+
+def test_vectorized_matches_scalar():
+    stat = np.array([1.0, 5.0, 38.0, 40.0])
+    log_p = critical_values.log_p_value("t", stat, "right", 1e6)
+    assert np.all(np.isfinite(log_p))
+    assert log_p[0] == pytest.approx(stats.t.logsf(1.0, 1e6))
+    assert log_p[3] == pytest.approx(critical_values.log_p_value("t", 40.0, "right", 1e6))
+
+
+def test_format_small_p_non_finite():
+    assert content.format_small_p(np.nan) == "tidak terdefinisi"
+    assert content.format_small_p(-np.inf) == "0"
+    assert content.format_small_p(np.log(3.2e-12)) == "3.20e-12"
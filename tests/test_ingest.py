@@ -0,0 +1,47 @@
+# tests/test_ingest.py
+"""Pembacaan CSV per blok (ringkasan per grup, mode watch) harus sama dengan membaca file utuh."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+
+
+def test_group_labels_agree_across_chunks():
+    # Blok pertama hanya berisi grup angka (pandas akan membacanya int64),
+    # blok berikutnya mencampur angka dan teks (object).
+    rng = np.random.default_rng(0)
+    groups = ["1", "2"] * 50 + ["1", "b", "2", ""] * 25
+    df = pd.DataFrame({"grup": groups, "nilai": rng.normal(10, 2, len(groups))})
+    text = df.to_csv(index=False)
+
+    streamed, streamed_labels = ingest.stream_csv_group_moments(io.StringIO(text), "nilai", "grup", chunksize=40)
+    whole, whole_labels = ingest.frame_group_moments(pd.read_csv(io.StringIO(text)), "nilai", "grup")
+
+    assert streamed_labels == whole_labels == ["1", "2", "b"]
+    for a, b in zip(streamed, whole):
+        np.testing.assert_allclose(a, b)
+
+
+def test_group_labels_float_column():
+    col = pd.Series([1.0, 2.0, np.nan, 2.5])
+    labels = ingest.group_labels(col)
+    assert labels[:2].tolist() == ["1", "2"] and pd.isna(labels[2]) and labels[3] == "2.5"
+
+
+def test_tail_line_longer_than_block(tmp_path):
+    path = tmp_path / "watch.csv"
+    path.write_text("x,catatan\n1.5," + "a" * 100 + "\n2.5,b\n")
+    state = ingest.tail_csv_moments(str(path), "x", block_bytes=16)
+    assert state.moments.n == 2 and state.offset == path.stat().st_size
+
+    with open(path, "a") as f:
+        f.write("4.0," + "c" * 50)  # baris belum lengkap ditunda
+    state = ingest.tail_csv_moments(str(path), "x", state, block_bytes=16)
+    assert state.moments.n == 2
+    with open(path, "a") as f:
+        f.write("\n")
+    state = ingest.tail_csv_moments(str(path), "x", state, block_bytes=16)
+    assert state.moments.n == 3 and state.moments.mean == pytest.approx(8 / 3)
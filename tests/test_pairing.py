@@ -0,0 +1,27 @@
+# tests/test_pairing.py
+"""Hash join dan sorted-merge join harus memasangkan ID yang sama."""
+import io
+
+import pytest
+
+import pairing
+
+
+def csv(rows):
+    return "id,nilai\n" + "".join(f"{i},{v}\n" for i, v in rows)
+
+
+@pytest.mark.parametrize("pre_ids, post_ids, chunksize", [
+    # mode teks; terurut setelah normalisasi: "10" < "7" < "S1" < "S2"/"S3"
+    (["10", "7.0", "S1", "S2"], ["010", "7", "S1", "S3"], 1000),
+    # mode angka, dibaca per 2 baris
+    (["1", "7.0", "10", "12"], ["1.0", "007", "10", "13"], 2),
+])
+def test_joins_agree_on_mixed_format_ids(pre_ids, post_ids, chunksize):
+    pre = csv(zip(pre_ids, [5.0, 3.0, 8.0, 1.0]))
+    post = csv(zip(post_ids, [4.0, 1.0, 2.0, 9.0]))
+
+    for join in (pairing.hash_join_moments, pairing.merge_join_moments):
+        res = join(io.StringIO(pre), io.StringIO(post), "id", "nilai", chunksize=chunksize)
+        assert (res.n_matched, res.unmatched_1, res.unmatched_2) == (3, 1, 1)
+        assert res.moments.mean == pytest.approx((1.0 + 2.0 + 6.0) / 3)
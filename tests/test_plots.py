@@ -0,0 +1,25 @@
+# tests/test_plots.py
+"""plots.render_png tidak meninggalkan figure di registry pyplot (RSS diukur di benchmarks/bench_plot_memory.py)."""
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import plots
+
+RENDERS = 50
+
+
+@pytest.mark.parametrize("dist_name, tail, df1, df2", [
+    ("normal", "two", None, None),
+    ("t", "left", 12.5, None),
+    ("f", "right", 3, 40),
+])
+def test_render_png_leaves_no_open_figures(dist_name, tail, df1, df2):
+    plots.clear()
+    before = plt.get_fignums()
+    shift = 0 if dist_name == "f" else 3
+    for stat in np.linspace(0.1, 6, RENDERS) - shift:  # statistik berbeda: setiap render meleset dari cache
+        png = plots.render_png(dist_name, stat, 2.0, tail, df1, df2)
+        assert png.startswith(b"\x89PNG")
+    assert plt.get_fignums() == before
+    assert plots._render_png.cache_info().misses == RENDERS